@@ -0,0 +1,128 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Dict
+
+from exceptions import ServiceOverloadedError
+from metrics import ADMISSION_IN_FLIGHT, ADMISSION_QUEUED, ADMISSION_REJECTED, ADMISSION_WAIT
+
+# 동시 처리 제한 사용 여부
+ADMISSION_ENABLED = os.getenv("ADMISSION_ENABLED", "false").lower() in ("1", "true", "yes")
+
+
+class AdmissionGate:
+    """우선순위 등급 하나의 동시 처리 제한
+
+    최대 limit개 요청을 동시에 처리하고, 초과한 요청은 최대 max_queue개까지 도착 순서대로 기다립니다.
+    대기열이 가득 찼거나 queue_timeout초 안에 차례가 오지 않으면 바로 ServiceOverloadedError(503)를 발생시켜
+    클라이언트가 시간 초과까지 기다리지 않고 Retry-After 뒤에 다시 시도하게 합니다.
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: deque = deque()
+        self._labels = (name,)
+
+    @property
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.queue_timeout))
+
+    def _update_gauges(self) -> None:
+        ADMISSION_IN_FLIGHT.set(self.active, self._labels)
+        ADMISSION_QUEUED.set(len(self._waiters), self._labels)
+
+    def _reject(self, reason: str) -> None:
+        ADMISSION_REJECTED.inc((self.name, reason))
+        raise ServiceOverloadedError(self.name, self.retry_after)
+
+    async def acquire(self) -> None:
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self._update_gauges()
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._reject("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._update_gauges()
+        started = time.perf_counter()
+        try:
+            # release()가 waiter를 완료하면 처리 슬롯을 그대로 넘겨받음
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._remove(waiter)
+            self._reject("queue_timeout")
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소되었다면 다음 요청에 넘김
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._remove(waiter)
+            raise
+        finally:
+            ADMISSION_WAIT.observe(time.perf_counter() - started, self._labels)
+
+    def _remove(self, waiter) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        self._update_gauges()
+
+    def release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                self._update_gauges()
+                return
+        self.active -= 1
+        self._update_gauges()
+
+
+def _gate(name: str, limit: int, max_queue: int, queue_timeout: float) -> AdmissionGate:
+    prefix = f"ADMISSION_{name.upper()}"
+    return AdmissionGate(
+        name,
+        limit=int(os.getenv(f"{prefix}_LIMIT", str(limit))),
+        max_queue=int(os.getenv(f"{prefix}_QUEUE", str(max_queue))),
+        queue_timeout=float(os.getenv(f"{prefix}_TIMEOUT_SECONDS", str(queue_timeout)))
+    )
+
+
+# 우선순위 등급별 제한 (등급마다 따로 제한하므로 비싼 요청이 몰려도 가벼운 요청은 기다리지 않음)
+# - cheap: 단일 식품 조회/수정, 목록 페이지, 다건 조회
+# - expensive: 검색, 통계, 유사 식품, 합산, 일괄 작업
+# - export: 응답을 보내는 동안 읽기 연결을 계속 사용하는 전체 내보내기
+GATES: Dict[str, AdmissionGate] = {
+    "cheap": _gate("cheap", limit=64, max_queue=256, queue_timeout=1.0),
+    "expensive": _gate("expensive", limit=8, max_queue=64, queue_timeout=2.0),
+    "export": _gate("export", limit=2, max_queue=4, queue_timeout=5.0),
+}
+
+
+def admission(priority: str):
+    """라우트의 dependencies에 추가하는 동시 처리 제한 의존성을 반환합니다.
+
+    yield 의존성이므로 슬롯은 응답(스트리밍 본문 포함)을 모두 보낸 뒤에 반환됩니다.
+    """
+    gate = GATES[priority]
+
+    async def admit():
+        if not ADMISSION_ENABLED:
+            yield
+            return
+        await gate.acquire()
+        try:
+            yield
+        finally:
+            gate.release()
+
+    return admit
@@ -0,0 +1,152 @@
+"""벤치마크 실행기
+
+사용법:
+    python -m benchmarks generate --scale 10
+    python -m benchmarks load --scale 10 --mix mixed --concurrency 32 --requests 5000
+    python -m benchmarks load --scale 10 --socket --workers 2
+    python -m benchmarks micro --scale 10 --iterations 200
+    python -m benchmarks load --scale 10 --save-baseline benchmarks/baseline.json
+    python -m benchmarks load --scale 10 --baseline benchmarks/baseline.json --threshold 0.2
+
+데이터베이스 설정은 import 시점의 환경변수로 결정되므로, 인자를 해석해 DATABASE_URL을 정한 뒤
+프로젝트 모듈을 가져옵니다.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# benchmarks.load는 데이터베이스 모듈을 가져오므로 인자 검증용 이름만 따로 둠
+LOAD_MIXES = ("read", "search", "mixed", "write")
+
+
+def _use_database(path: str) -> None:
+    url = f"sqlite+aiosqlite:///{os.path.abspath(path)}"
+    os.environ["DATABASE_URL"] = url
+    os.environ["DATABASE_READ_URL"] = url
+
+
+def _parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Food API 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(command):
+        command.add_argument("--scale", type=float, default=10, help="원본 데이터셋 대비 가상 카탈로그 배율 (기본값: 10)")
+        command.add_argument("--seed", type=int, default=0, help="가상 카탈로그/요청 생성 시드")
+        command.add_argument("--db", help="벤치마크 SQLite 파일 경로 (기본값: 임시 디렉터리의 배율/시드별 파일)")
+        command.add_argument("--excel", default="food_nutrition_db.xlsx", help="원본 엑셀 파일")
+        command.add_argument("--verbose", action="store_true", help="애플리케이션 로그 출력")
+
+    def add_output(command):
+        command.add_argument("--out", help="결과 JSON 저장 경로")
+        command.add_argument("--baseline", help="비교할 기준선 결과 JSON")
+        command.add_argument("--threshold", type=float, default=0.2, help="허용하는 성능 저하 비율 (기본값: 0.2)")
+        command.add_argument("--save-baseline", metavar="PATH", help="이번 결과를 기준선으로 저장")
+
+    generate = commands.add_parser("generate", help="가상 카탈로그 데이터베이스 생성")
+    add_common(generate)
+
+    load = commands.add_parser("load", help="HTTP 부하 테스트 (처리량, p50/p95/p99)")
+    add_common(load)
+    add_output(load)
+    load.add_argument("--mix", default="mixed", help="요청 구성 (read, search, mixed, write 또는 쉼표 구분 여러 개)")
+    load.add_argument("--concurrency", type=int, default=32, help="동시 요청 수")
+    load.add_argument("--requests", type=int, default=5000, help="시나리오별 측정 요청 수")
+    load.add_argument("--warmup", type=int, default=200, help="측정 전 워밍업 요청 수")
+    load.add_argument("--socket", action="store_true", help="uvicorn을 띄워 실제 소켓으로 호출")
+    load.add_argument("--workers", type=int, default=1, help="--socket 시 uvicorn 워커 수")
+    load.add_argument("--url", help="이미 실행 중인 서버 주소 (지정 시 데이터베이스 생성 생략)")
+    load.add_argument("--regenerate", action="store_true", help="가상 카탈로그를 다시 생성")
+
+    micro = commands.add_parser("micro", help="초기화, 리포지토리, 직렬화 마이크로 벤치마크")
+    add_common(micro)
+    add_output(micro)
+    micro.add_argument("--iterations", type=int, default=200, help="항목별 반복 횟수")
+    micro.add_argument("--init-repeat", type=int, default=3, help="init_from_excel 반복 횟수 (0이면 생략)")
+    return parser.parse_args(argv)
+
+
+def _finish(report: dict, args: argparse.Namespace) -> int:
+    from benchmarks.report import compare, format_table, load_report, save_report
+
+    print(format_table(report["results"]))
+    if args.out:
+        save_report(report, args.out)
+    if args.save_baseline:
+        save_report(report, args.save_baseline)
+        print(f"\n기준선을 저장했습니다: {args.save_baseline}")
+    if args.baseline:
+        regressions = compare(report, load_report(args.baseline), args.threshold)
+        if regressions:
+            print(f"\n기준선 대비 성능 저하 {len(regressions)}건:")
+            for regression in regressions:
+                print(f"  - {regression}")
+            return 1
+        print(f"\n기준선 대비 {args.threshold:.0%}를 넘는 성능 저하가 없습니다.")
+    return 0
+
+
+async def _run(args: argparse.Namespace) -> dict:
+    """명령을 실행하고 결과 보고서를 반환합니다. (엔진 커넥션 풀이 이벤트 루프 하나만 쓰도록 한 번에 실행)"""
+    from benchmarks.report import new_report
+    from benchmarks.synthetic import ensure_database
+
+    options = {key: value for key, value in vars(args).items()
+               if key not in ("out", "baseline", "save_baseline", "verbose")}
+    if args.command == "micro":
+        from benchmarks.micro import run_micro
+        report = new_report("micro", options)
+        report["results"] = await run_micro(args.scale, args.iterations, args.init_repeat, args.seed, args.excel)
+        return report
+
+    from benchmarks.load import run_load
+    if args.url is None:
+        await ensure_database(args.scale, args.seed, args.excel, args.regenerate)
+    report = new_report("load", options)
+    for mix in args.mix.split(","):
+        report["results"].update(await run_load(
+            mix.strip(), args.concurrency, args.requests, args.warmup, args.seed,
+            socket_mode=args.socket, url=args.url, workers=args.workers
+        ))
+    return report
+
+
+def main(argv=None) -> int:
+    args = _parse_args(argv)
+    os.chdir(PROJECT_ROOT)
+    if args.command == "load":
+        unknown = [name for name in args.mix.split(",") if name.strip() not in LOAD_MIXES]
+        if unknown:
+            print(f"알 수 없는 요청 구성입니다: {', '.join(unknown)} (사용 가능: {', '.join(LOAD_MIXES)})")
+            return 2
+
+    if args.db:
+        db_path = args.db
+    elif args.command == "micro":
+        # 초기화 측정이 테이블을 비우므로 부하 테스트용 파일과 분리
+        db_path = os.path.join(tempfile.gettempdir(), f"food_bench_micro_s{args.seed}.db")
+    else:
+        db_path = os.path.join(tempfile.gettempdir(), f"food_bench_x{args.scale:g}_s{args.seed}.db")
+    _use_database(db_path)
+
+    logging.basicConfig(level=logging.INFO)
+    if not args.verbose:
+        logging.getLogger().setLevel(logging.ERROR)
+        logging.getLogger("benchmarks").setLevel(logging.INFO)
+
+    if args.command == "generate":
+        from benchmarks.synthetic import ensure_database
+        rows = asyncio.run(ensure_database(args.scale, args.seed, args.excel, regenerate=True))
+        print(f"{db_path}: {rows}개 행")
+        return 0
+    return _finish(asyncio.run(_run(args)), args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
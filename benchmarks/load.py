@@ -0,0 +1,215 @@
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import httpx
+except ImportError:  # 부하 테스트에만 필요
+    httpx = None
+
+from benchmarks.report import summarize
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# 시나리오별 요청 종류 가중치
+MIXES: Dict[str, Dict[str, int]] = {
+    "read": {"get": 50, "list": 30, "search": 20},
+    "search": {"search": 80, "get": 20},
+    "mixed": {"search": 35, "list": 20, "get": 30, "lookup": 5, "write": 10},
+    "write": {"write": 70, "get": 30},
+}
+
+# 준비 상태를 기다리는 최대 시간(초)
+READY_TIMEOUT_SECONDS = 600
+
+# 4xx 중 정상 응답으로 보는 상태 코드 (임의 ID 조회의 404 등)
+EXPECTED_STATUSES = (404,)
+
+
+class TrafficModel:
+    """실제 데이터에서 추출한 ID/식품명/제조사로 요청을 만듭니다."""
+
+    def __init__(self, ids: List[int], names: List[str], makers: List[str], total: int):
+        self.ids = ids
+        self.names = names
+        self.makers = makers
+        self.total = total
+
+    @classmethod
+    async def discover(cls, client, sample_pages: int = 10) -> "TrafficModel":
+        """목록 API로 몇 페이지를 조회하여 요청에 사용할 값을 수집합니다."""
+        first = (await client.get("/v1/foods", params={"limit": 100})).json()
+        total = first["pagination"]["total"]
+        rows = list(first["data"])
+        pages = max(1, total // 100)
+        for page in random.Random(0).sample(range(1, pages + 1), min(sample_pages, pages)):
+            rows += (await client.get("/v1/foods", params={"limit": 100, "page": page})).json()["data"]
+        return cls(
+            ids=[row["id"] for row in rows],
+            names=[row["food_name"] for row in rows],
+            makers=sorted({row["maker_name"] for row in rows}),
+            total=total,
+        )
+
+    def request(self, kind: str, rng: random.Random) -> tuple:
+        """(메서드, 경로, 쿼리 파라미터, JSON 본문)을 반환합니다."""
+        if kind == "get":
+            return "GET", f"/v1/foods/{rng.choice(self.ids)}", None, None
+        if kind == "list":
+            limit = rng.choice((20, 100))
+            page = rng.randint(1, max(1, min(self.total // limit, 200)))
+            return "GET", "/v1/foods", {"page": page, "limit": limit}, None
+        if kind == "search":
+            return "GET", "/v1/foods/search", self._search_params(rng), None
+        if kind == "lookup":
+            return "POST", "/v1/foods/lookup", None, {"ids": rng.sample(self.ids, min(20, len(self.ids)))}
+        if kind == "write":
+            body = {"calorie": round(rng.uniform(0, 900), 2), "salt": round(rng.uniform(0, 2000), 2)}
+            return "PATCH", f"/v1/foods/{rng.choice(self.ids)}", None, body
+        raise ValueError(f"알 수 없는 요청 종류입니다: {kind}")
+
+    def _search_params(self, rng: random.Random) -> dict:
+        shape = rng.randrange(5)
+        if shape == 0:
+            # 식품명 일부 (한두 글자)
+            name = rng.choice(self.names).replace(" ", "")
+            start = rng.randrange(max(1, len(name) - 1))
+            return {"food_name": name[start:start + rng.choice((1, 2))]}
+        if shape == 1:
+            return {"maker_name": rng.choice(self.makers)}
+        if shape == 2:
+            low = rng.uniform(0, 600)
+            return {"calorie_min": round(low, 1), "calorie_max": round(low + 100, 1), "sort": "calorie"}
+        if shape == 3:
+            return {"salt_max": round(rng.uniform(50, 500), 1), "sort": "salt", "order": "desc", "limit": 50}
+        return {"protein_min": round(rng.uniform(5, 40), 1), "fields": "food_name,protein", "limit": 100}
+
+
+async def drive(
+    client,
+    model: TrafficModel,
+    mix: Dict[str, int],
+    concurrency: int,
+    requests: int,
+    seed: int = 0
+) -> Dict[str, dict]:
+    """concurrency개의 작업자로 requests개의 요청을 보내고 요청 종류별/전체 요약을 반환합니다."""
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    latencies: Dict[str, List[float]] = {kind: [] for kind in kinds}
+    errors: Dict[str, int] = {kind: 0 for kind in kinds}
+    remaining = requests
+
+    async def worker(index: int):
+        nonlocal remaining
+        rng = random.Random(seed * 1000 + index)
+        while remaining > 0:
+            remaining -= 1
+            kind = rng.choices(kinds, weights)[0]
+            method, path, params, body = model.request(kind, rng)
+            started = time.perf_counter()
+            try:
+                response = await client.request(method, path, params=params, json=body)
+                failed = response.status_code >= 400 and response.status_code not in EXPECTED_STATUSES
+            except httpx.HTTPError:
+                failed = True
+            latencies[kind].append((time.perf_counter() - started) * 1000)
+            if failed:
+                errors[kind] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    results = {kind: summarize(latencies[kind], elapsed, errors[kind]) for kind in kinds if latencies[kind]}
+    results["all"] = summarize(
+        [value for values in latencies.values() for value in values], elapsed, sum(errors.values())
+    )
+    return results
+
+
+async def _wait_ready(client) -> None:
+    deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("애플리케이션이 준비되지 않았습니다.")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@asynccontextmanager
+async def in_process_client(concurrency: int):
+    """ASGI 전송으로 앱을 같은 프로세스에서 호출하는 클라이언트 (네트워크 비용 제외)"""
+    import main
+
+    async with main.app.router.lifespan_context(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            await _wait_ready(client)
+            yield client
+
+
+@asynccontextmanager
+async def socket_client(concurrency: int, url: Optional[str] = None, workers: int = 1):
+    """실제 소켓으로 호출하는 클라이언트. url이 없으면 uvicorn을 하위 프로세스로 띄웁니다."""
+    server = None
+    if url is None:
+        port = _free_port()
+        url = f"http://127.0.0.1:{port}"
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+             "--workers", str(workers), "--log-level", "warning"],
+            cwd=PROJECT_ROOT, env=os.environ.copy()
+        )
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    try:
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+            await _wait_ready(client)
+            yield client
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+
+async def run_load(
+    mix_name: str,
+    concurrency: int,
+    requests: int,
+    warmup: int,
+    seed: int = 0,
+    socket_mode: bool = False,
+    url: Optional[str] = None,
+    workers: int = 1
+) -> Dict[str, dict]:
+    """시나리오 하나를 실행하고 "load.<시나리오>.<요청 종류>" 이름의 결과를 반환합니다."""
+    if httpx is None:
+        raise SystemExit("부하 테스트에는 httpx가 필요합니다: pip install httpx")
+    mix = MIXES[mix_name]
+    if socket_mode or url:
+        client_context = socket_client(concurrency, url, workers)
+    else:
+        client_context = in_process_client(concurrency)
+
+    async with client_context as client:
+        model = await TrafficModel.discover(client)
+        if warmup:
+            await drive(client, model, mix, concurrency, warmup, seed + 1)
+        results = await drive(client, model, mix, concurrency, requests, seed)
+    return {f"load.{mix_name}.{kind}": result for kind, result in results.items()}
@@ -0,0 +1,131 @@
+import json
+import random
+import time
+from typing import Awaitable, Callable, Dict, List
+
+from sqlalchemy import select
+
+from benchmarks.report import summarize
+from benchmarks.synthetic import DEFAULT_EXCEL_PATH, generate_catalog, load_catalog
+from database import read_session_factory
+from models.food import Food
+from repositories.food_repository import FoodRepository
+from schemas.food import (
+    FoodResponse, FoodSearchParams, NutritionItem, PaginatedResponse, PaginationParams
+)
+from scripts.food_dataset import load_food_dataset
+from scripts.init_db_from_excel import init_from_excel
+from serialization import dumps
+
+
+async def time_async(fn: Callable[[], Awaitable], iterations: int) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await fn()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+def time_sync(fn: Callable[[], object], iterations: int) -> dict:
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        fn()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    return summarize(latencies, time.perf_counter() - started)
+
+
+async def bench_init_from_excel(excel_path: str, repeat: int) -> Dict[str, dict]:
+    """엑셀 초기화 전체(데이터셋 캐시 읽기 + 배치 삽입)를 빈 테이블에서 반복 측정합니다."""
+    async def run():
+        await init_from_excel(excel_path, clear_existing=True)
+    return {"micro.init_from_excel": await time_async(run, repeat)}
+
+
+def _repository_cases(ids: List[int], names: List[str], rng: random.Random) -> Dict[str, Callable]:
+    """측정할 리포지토리 호출 (리포지토리 -> 코루틴)"""
+    deep_page = max(1, len(ids) // 20 // 2)
+    return {
+        "get_by_id": lambda repo: repo.get_by_id(rng.choice(ids)),
+        "get_by_id.fields": lambda repo: repo.get_by_id(rng.choice(ids), ("id", "food_name", "calorie")),
+        "get_all.first_page": lambda repo: repo.get_all(PaginationParams(page=1, limit=20)),
+        "get_all.deep_page": lambda repo: repo.get_all(PaginationParams(page=deep_page, limit=20)),
+        "search.name": lambda repo: repo.search(FoodSearchParams(food_name=rng.choice(names)[:2])),
+        "search.range_sorted": lambda repo: repo.search(
+            FoodSearchParams(calorie_min=200, calorie_max=300, sort="calorie", limit=50)
+        ),
+        "search.sort_desc": lambda repo: repo.search(FoodSearchParams(sort="salt", order="desc", limit=100)),
+        "get_many.50": lambda repo: repo.get_many(rng.sample(ids, 50), []),
+        "aggregate_nutrition.10": lambda repo: repo.aggregate_nutrition(
+            [NutritionItem(food_id=food_id, quantity=2) for food_id in rng.sample(ids, 10)]
+        ),
+        "find_similar.10": lambda repo: repo.find_similar(rng.choice(ids), 10),
+        "get_group_stats": lambda repo: repo.get_group_stats("maker_name"),
+    }
+
+
+async def bench_repository(iterations: int, seed: int = 0) -> Dict[str, dict]:
+    """요청처럼 호출마다 새 읽기 세션을 열어 FoodRepository 메서드를 측정합니다.
+
+    첫 호출에서 카탈로그/통계를 적재하는 메서드가 있으므로 한 번 미리 호출한 뒤 측정합니다.
+    """
+    async with read_session_factory() as session:
+        rows = (await session.execute(select(Food.id, Food.food_name))).all()
+    ids = [row.id for row in rows]
+    names = [row.food_name for row in rows]
+    rng = random.Random(seed)
+
+    results = {}
+    for name, call in _repository_cases(ids, names, rng).items():
+        async def run():
+            async with read_session_factory() as session:
+                await call(FoodRepository(session))
+        await run()
+        results[f"micro.repository.{name}"] = await time_async(run, iterations)
+    return results
+
+
+async def bench_serialization(iterations: int) -> Dict[str, dict]:
+    """목록 응답 한 페이지(100개 행)를 응답 모델 검증 경로와 orjson 직접 직렬화 경로로 측정합니다."""
+    async with read_session_factory() as session:
+        rows, total, next_cursor = await FoodRepository(session).get_all(PaginationParams(page=1, limit=100))
+    payload = {
+        "status": "success",
+        "data": rows,
+        "pagination": {"page": 1, "limit": 100, "total": total, "totalPages": -(-total // 100), "nextCursor": next_cursor},
+    }
+    model = PaginatedResponse[FoodResponse]
+    return {
+        "micro.serialization.orjson_dumps": time_sync(lambda: dumps(payload), iterations),
+        "micro.serialization.json_dumps": time_sync(
+            lambda: json.dumps(payload, ensure_ascii=False).encode(), iterations
+        ),
+        "micro.serialization.pydantic_validate_dump": time_sync(
+            lambda: model.model_validate(payload).model_dump_json(), iterations
+        ),
+    }
+
+
+async def run_micro(
+    scale: float,
+    iterations: int,
+    init_repeat: int,
+    seed: int = 0,
+    excel_path: str = DEFAULT_EXCEL_PATH
+) -> Dict[str, dict]:
+    """현재 DATABASE_URL(전용 임시 DB)에서 초기화, 리포지토리, 직렬화 벤치마크를 차례로 실행합니다.
+
+    초기화 측정이 테이블을 비우므로 그 뒤에 scale배 가상 카탈로그를 적재하여 나머지를 측정합니다.
+    """
+    results = {}
+    if init_repeat:
+        results.update(await bench_init_from_excel(excel_path, init_repeat))
+
+    base, _ = load_food_dataset(excel_path)
+    await load_catalog(generate_catalog(base, scale, seed))
+    results.update(await bench_repository(iterations, seed))
+    results.update(await bench_serialization(iterations))
+    return results
@@ -0,0 +1,92 @@
+import json
+import platform
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# 지연 시간 백분위수
+PERCENTILES = (50, 95, 99)
+
+# 기준선 비교 시 높을수록 좋은 지표 (나머지는 낮을수록 좋음)
+HIGHER_IS_BETTER = ("throughput_rps",)
+# 기준선 비교에 사용하는 지표
+COMPARED_METRICS = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def summarize(latencies_ms: List[float], elapsed_seconds: float, errors: int = 0) -> dict:
+    """지연 시간 목록(ms)을 처리량과 백분위수 요약으로 변환합니다."""
+    values = np.asarray(latencies_ms, dtype=np.float64)
+    summary = {
+        "count": int(len(values)),
+        "errors": int(errors),
+        "elapsed_seconds": round(elapsed_seconds, 3),
+        "throughput_rps": round(len(values) / elapsed_seconds, 2) if elapsed_seconds > 0 else 0.0,
+    }
+    if len(values):
+        for q, value in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+            summary[f"p{q}_ms"] = round(float(value), 3)
+        summary["mean_ms"] = round(float(values.mean()), 3)
+        summary["max_ms"] = round(float(values.max()), 3)
+    return summary
+
+
+def new_report(kind: str, options: dict) -> dict:
+    return {
+        "meta": {
+            "kind": kind,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "options": options,
+        },
+        "results": {},
+    }
+
+
+def format_table(results: Dict[str, dict]) -> str:
+    """결과를 사람이 읽기 쉬운 표로 만듭니다."""
+    header = f"{'name':<44} {'count':>8} {'err':>5} {'rps':>10} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<44} {result['count']:>8} {result['errors']:>5} {result['throughput_rps']:>10.1f} "
+            f"{result.get('p50_ms', 0):>9.3f} {result.get('p95_ms', 0):>9.3f} "
+            f"{result.get('p99_ms', 0):>9.3f} {result.get('max_ms', 0):>9.3f}"
+        )
+    return "\n".join(lines)
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report: dict, baseline: dict, threshold: float) -> List[str]:
+    """기준선 대비 threshold(비율)를 넘게 나빠진 지표를 설명 문자열 목록으로 반환합니다.
+
+    처리량은 줄어든 비율, 지연 시간은 늘어난 비율로 판단하며, 기준선에 없는 항목은 비교하지 않습니다.
+    """
+    regressions = []
+    for name, result in report["results"].items():
+        previous: Optional[dict] = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            current, base = result.get(metric), previous.get(metric)
+            if not current or not base:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                change = (base - current) / base
+            else:
+                change = (current - base) / base
+            if change > threshold:
+                regressions.append(
+                    f"{name} {metric}: {base} -> {current} ({change:+.1%}, 허용 {threshold:.0%})"
+                )
+    return regressions
@@ -0,0 +1,108 @@
+import time
+import logging
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select, text
+
+from database import async_session_factory, create_tables
+from models.food import Food, NUTRIENT_COLUMNS
+from repositories import events
+from repositories.food_repository import FoodRepository
+from scripts.food_dataset import load_food_dataset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXCEL_PATH = "food_nutrition_db.xlsx"
+INSERT_BATCH_SIZE = 5000
+
+# 실제 식품명 앞뒤에 붙여 새 이름을 만드는 수식어
+NAME_PREFIXES = (
+    "", "", "", "매운", "순한", "저당", "고단백", "수제", "프리미엄", "미니", "왕", "옛날",
+    "국산", "전통", "치즈", "불고기", "김치", "마늘", "크림", "흑당", "녹차", "허니", "숯불",
+)
+NAME_SUFFIXES = (
+    "", "", "", " R", " L", " S", " 라지", " 레귤러", " 세트", " (1인분)", " (2인분)", " ICE", " HOT",
+)
+
+# 영양성분 값에 곱하는 로그정규 잡음의 표준편차 (0인 값은 0으로 유지)
+NUTRIENT_NOISE_SIGMA = 0.15
+
+
+def generate_catalog(base: pd.DataFrame, scale: float, seed: int = 0) -> pd.DataFrame:
+    """실제 데이터셋을 바탕으로 scale배 크기의 가상 식품 카탈로그를 만듭니다.
+
+    - 행마다 실제 식품 하나를 복원 추출하여 영양성분 조합(상관관계)과 제조사/출처 분포를 유지합니다.
+    - 영양성분과 1회 제공량에는 로그정규 잡음을 곱하여 값이 겹치지 않게 합니다.
+    - 식품명은 실제 식품명에 수식어/크기 표기를 붙여 만들며, 식품코드는 S로 시작하는 고유 코드입니다.
+    """
+    rng = np.random.default_rng(seed)
+    size = int(round(len(base) * scale))
+    source = base.iloc[rng.integers(0, len(base), size)].reset_index(drop=True)
+
+    catalog = source.copy()
+    catalog["food_cd"] = [f"S{index:08d}" for index in range(size)]
+
+    prefixes = np.array(NAME_PREFIXES, dtype=object)[rng.integers(0, len(NAME_PREFIXES), size)]
+    suffixes = np.array(NAME_SUFFIXES, dtype=object)[rng.integers(0, len(NAME_SUFFIXES), size)]
+    names = source["food_name"].to_numpy(dtype=object)
+    catalog["food_name"] = [
+        f"{prefix} {name}{suffix}".strip()[:200] for prefix, name, suffix in zip(prefixes, names, suffixes)
+    ]
+
+    noise = rng.lognormal(0.0, NUTRIENT_NOISE_SIGMA, size=(size, len(NUTRIENT_COLUMNS)))
+    nutrients = source[list(NUTRIENT_COLUMNS)].to_numpy(dtype=np.float64) * noise
+    for index, name in enumerate(NUTRIENT_COLUMNS):
+        catalog[name] = np.round(nutrients[:, index], 2)
+
+    serving = pd.to_numeric(source["serving_size"], errors="coerce").to_numpy(dtype=np.float64)
+    serving = np.round(serving * rng.lognormal(0.0, NUTRIENT_NOISE_SIGMA, size))
+    catalog["serving_size"] = np.where(np.isnan(serving), source["serving_size"], serving.astype(str))
+    catalog["serving_size"] = catalog["serving_size"].str.removesuffix(".0")
+    return catalog
+
+
+async def load_catalog(catalog: pd.DataFrame, batch_size: int = INSERT_BATCH_SIZE) -> int:
+    """현재 DATABASE_URL의 식품 테이블을 비우고 카탈로그를 배치 삽입합니다."""
+    await create_tables()
+    async with async_session_factory() as session:
+        await session.execute(text("DELETE FROM foods"))
+        events.record_reset(session)
+        await session.commit()
+
+        repository = FoodRepository(session)
+        inserted = 0
+        for start in range(0, len(catalog), batch_size):
+            batch = catalog.iloc[start:start + batch_size].to_dict("records")
+            inserted += await repository.bulk_insert(batch)
+            await session.commit()
+        return inserted
+
+
+async def count_foods() -> int:
+    await create_tables()
+    async with async_session_factory() as session:
+        return (await session.execute(select(func.count(Food.id)))).scalar()
+
+
+async def ensure_database(
+    scale: float,
+    seed: int = 0,
+    excel_path: str = DEFAULT_EXCEL_PATH,
+    regenerate: bool = False
+) -> int:
+    """현재 DATABASE_URL에 scale배 가상 카탈로그가 없으면 만들고 행 수를 반환합니다.
+
+    같은 행 수가 이미 적재되어 있으면 재사용합니다.
+    """
+    base, _ = load_food_dataset(excel_path)
+    expected = int(round(len(base) * scale))
+    if not regenerate and await count_foods() == expected:
+        logger.info(f"기존 벤치마크 데이터베이스를 사용합니다. ({expected}개 행)")
+        return expected
+
+    started = time.perf_counter()
+    catalog = generate_catalog(base, scale, seed)
+    inserted = await load_catalog(catalog)
+    logger.info(f"가상 카탈로그 {inserted}개 행을 {time.perf_counter() - started:.1f}초 만에 적재했습니다.")
+    return inserted
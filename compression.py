@@ -0,0 +1,293 @@
+import os
+import zlib
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from cache import LRUCache
+from http_cache import encoded_etag
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 br 인코딩 비활성화
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # zstandard가 없으면 zstd 인코딩 비활성화
+    zstandard = None
+
+# 응답 압축 사용 여부 및 설정
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "false").lower() in ("1", "true", "yes")
+# 이보다 작은 응답은 압축하지 않음 (바이트)
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+# 압축 레벨 (1~9, 빠름~작음). 같은 값을 gzip/brotli/zstd 레벨로 사용
+COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+# 라우트 템플릿별 압축 레벨 (지정하지 않은 라우트는 COMPRESSION_LEVEL)
+ROUTE_COMPRESSION_LEVELS = {
+    "/v1/foods/{food_id}": int(os.getenv("COMPRESSION_LEVEL_FOOD", str(COMPRESSION_LEVEL))),
+    "/v1/foods": int(os.getenv("COMPRESSION_LEVEL_FOOD_LIST", str(COMPRESSION_LEVEL))),
+    "/v1/foods/search": int(os.getenv("COMPRESSION_LEVEL_FOOD_SEARCH", str(COMPRESSION_LEVEL))),
+    # 스트리밍 내보내기는 처리량이 중요하므로 기본값을 낮게 둠
+    "/v1/foods/export": int(os.getenv("COMPRESSION_LEVEL_FOOD_EXPORT", "1")),
+}
+# 압축 결과 캐시 (ETag가 있는 200 응답만 저장)
+COMPRESSION_CACHE_MAX_ENTRIES = int(os.getenv("COMPRESSION_CACHE_MAX_ENTRIES", "512"))
+COMPRESSION_CACHE_MAX_BYTES = int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+COMPRESSION_CACHE_TTL_SECONDS = float(os.getenv("COMPRESSION_CACHE_TTL_SECONDS", "600"))
+
+# 압축하는 Content-Type
+COMPRESSIBLE_TYPES = ("application/json", "application/x-ndjson", "text/")
+
+
+class _GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        # 스트리밍 응답은 청크마다 클라이언트가 바로 풀 수 있도록 동기화 플러시
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class _ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+# 사용 가능한 인코딩: 이름 -> (한 번에 압축하는 함수, 스트리밍 압축기)
+# Accept-Encoding의 q 값이 같으면 이 순서(압축률이 높은 순)로 선택
+CODECS: Dict[str, tuple] = {}
+if brotli is not None:
+    CODECS["br"] = (lambda data, level: brotli.compress(data, quality=level), _BrotliCompressor)
+if zstandard is not None:
+    CODECS["zstd"] = (lambda data, level: zstandard.ZstdCompressor(level=level).compress(data), _ZstdCompressor)
+CODECS["gzip"] = (_gzip, _GzipCompressor)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩을 고릅니다. 받을 수 있는 인코딩이 없으면 None을 반환합니다."""
+    if not accept_encoding:
+        return None
+    weights = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                continue
+        weights[name.strip().lower()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for name in CODECS:
+        quality = weights.get(name, wildcard)
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressedBodyCache(LRUCache):
+    """(경로, ETag, 인코딩)별 압축된 응답 본문 캐시
+
+    ETag에 테이블 버전이 들어 있으므로 데이터가 바뀌면 새 키로 저장되고, 이전 항목은 LRU/TTL로 정리됩니다.
+    항목 수와 함께 전체 바이트 수도 제한합니다.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        super().__init__(max_entries, ttl)
+        self.max_bytes = max_bytes
+
+    def _total_bytes(self) -> int:
+        return sum(len(value) for _, value in self._entries.values())
+
+    def set(self, key: Hashable, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        super().set(key, value)
+        total = self._total_bytes()
+        while total > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            total -= len(evicted)
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        return {**super().stats(), "bytes": self._total_bytes(), "max_bytes": self.max_bytes}
+
+
+compressed_body_cache = CompressedBodyCache(
+    COMPRESSION_CACHE_MAX_ENTRIES, COMPRESSION_CACHE_MAX_BYTES, COMPRESSION_CACHE_TTL_SECONDS
+)
+
+
+def _header(headers: List[Tuple[bytes, bytes]], name: bytes) -> Optional[str]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _replace_headers(headers: List[Tuple[bytes, bytes]], updates: Dict[bytes, Optional[str]]) -> list:
+    """updates에 있는 헤더를 바꾸거나(None이면 제거) 추가한 헤더 목록을 반환합니다."""
+    replaced = [(key, value) for key, value in headers if key.lower() not in updates]
+    replaced.extend((key, value.encode("latin-1")) for key, value in updates.items() if value is not None)
+    return replaced
+
+
+def _vary(headers: List[Tuple[bytes, bytes]]) -> str:
+    vary = _header(headers, b"vary")
+    if not vary:
+        return "Accept-Encoding"
+    if "accept-encoding" in vary.lower():
+        return vary
+    return f"{vary}, Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """Accept-Encoding에 따라 응답 본문을 압축하는 ASGI 미들웨어
+
+    - 압축 가능한 Content-Type이고 COMPRESSION_MIN_SIZE 이상인 응답만 압축하며, 레벨은 라우트별로 정합니다.
+    - 압축된 표현은 ETag에 인코딩 접미사를 붙여 구분합니다. (If-None-Match 비교 시 접미사는 무시)
+    - ETag가 있는 200 응답의 압축 결과는 캐시에 보관하여 같은 표현을 다시 압축하지 않습니다.
+    - 스트리밍 응답(내보내기)은 청크마다 압축하여 바로 전송합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(scope, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나의 압축 상태"""
+
+    def __init__(self, scope, send, encoding: str):
+        self.scope = scope
+        self._send = send
+        self.encoding = encoding
+        self.start_message = None
+        self.compressor = None
+        # None: 첫 본문 전, True: 압축, False: 그대로 전달
+        self.compressing: Optional[bool] = None
+
+    def _level(self) -> int:
+        route = self.scope.get("route")
+        return ROUTE_COMPRESSION_LEVELS.get(getattr(route, "path", None), COMPRESSION_LEVEL)
+
+    def _compressible(self, headers) -> bool:
+        content_type = _header(headers, b"content-type") or ""
+        return (
+            200 <= self.start_message["status"] < 300
+            and self.start_message["status"] not in (204, 206)
+            and _header(headers, b"content-encoding") is None
+            and content_type.startswith(COMPRESSIBLE_TYPES)
+        )
+
+    async def send(self, message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            headers = list(message.get("headers", []))
+            if message["status"] == 304:
+                await self._send({**message, "headers": self._not_modified_headers(headers)})
+                self.compressing = False
+                return
+            # 본문 크기를 보고 압축 여부를 정하므로 첫 본문까지 시작 메시지를 보류
+            self.start_message = {**message, "headers": headers}
+            return
+
+        if message_type != "http.response.body" or self.compressing is False:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = self.start_message["headers"]
+
+        if self.compressing is None:
+            if not self._compressible(headers) or (not more_body and len(body) < COMPRESSION_MIN_SIZE):
+                self.compressing = False
+                if self._compressible(headers):
+                    headers = _replace_headers(headers, {b"vary": _vary(headers)})
+                await self._send({**self.start_message, "headers": headers})
+                await self._send(message)
+                return
+            self.compressing = True
+            if not more_body:
+                await self._send_whole(headers, body)
+                return
+            # 스트리밍 응답: 길이를 알 수 없으므로 Content-Length 제거
+            self.compressor = CODECS[self.encoding][1](self._level())
+            etag = _header(headers, b"etag")
+            await self._send({**self.start_message, "headers": _replace_headers(headers, {
+                b"content-encoding": self.encoding,
+                b"content-length": None,
+                b"vary": _vary(headers),
+                b"etag": encoded_etag(etag, self.encoding) if etag else None,
+            })})
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+    async def _send_whole(self, headers, body: bytes) -> None:
+        etag = _header(headers, b"etag")
+        key = (self.scope["path"], etag, self.encoding)
+        compressed = None
+        if etag and self.start_message["status"] == 200:
+            _, compressed = compressed_body_cache.get(key)
+        if compressed is None:
+            compressed = CODECS[self.encoding][0](body, self._level())
+            if etag and self.start_message["status"] == 200:
+                compressed_body_cache.set(key, compressed)
+        await self._send({**self.start_message, "headers": _replace_headers(headers, {
+            b"content-encoding": self.encoding,
+            b"content-length": str(len(compressed)),
+            b"vary": _vary(headers),
+            b"etag": encoded_etag(etag, self.encoding) if etag else None,
+        })})
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    def _not_modified_headers(self, headers) -> list:
+        """304 응답의 ETag를 클라이언트가 보낸 표현(압축 여부)에 맞춥니다."""
+        etag = _header(headers, b"etag")
+        if not etag:
+            return headers
+        encoded = encoded_etag(etag, self.encoding)
+        if_none_match = _header(self.scope["headers"], b"if-none-match") or ""
+        if encoded.removeprefix("W/") in if_none_match:
+            return _replace_headers(headers, {b"etag": encoded, b"vary": _vary(headers)})
+        return _replace_headers(headers, {b"vary": _vary(headers)})
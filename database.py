@@ -1,18 +1,98 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 import os
 
+from metrics import instrument_engine, instrumented_pool_class, METRICS_ENABLED
+from slow_query import slow_query_log, SLOW_QUERY_ENABLED
+
 # Database URL - 환경변수에서 가져오거나 기본값 사용 (SQLite for development)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./food_api.db")
+# 읽기 전용 연결 URL (복제본 등, 기본값은 DATABASE_URL)
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", DATABASE_URL)
+# 모든 SQL 로그 출력 (느린 쿼리만 보려면 SLOW_QUERY_THRESHOLD_MS 사용)
+DATABASE_ECHO = os.getenv("DATABASE_ECHO", "false").lower() in ("1", "true", "yes")
+
+# 읽기 엔진 커넥션 풀 설정
+READ_POOL_SIZE = int(os.getenv("DATABASE_READ_POOL_SIZE", "5"))
+READ_MAX_OVERFLOW = int(os.getenv("DATABASE_READ_MAX_OVERFLOW", "10"))
+# 쓰기 엔진 커넥션 풀 설정 (SQLite는 쓰기 잠금이 하나뿐이므로 풀에서 순서를 기다리도록 1개)
+WRITE_POOL_SIZE = int(os.getenv("DATABASE_WRITE_POOL_SIZE", "1"))
+POOL_TIMEOUT = float(os.getenv("DATABASE_POOL_TIMEOUT", "30"))
+
+# 연결마다 적용할 SQLite PRAGMA 설정
+SQLITE_PRAGMAS = {
+    "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+    "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+    "mmap_size": os.getenv("SQLITE_MMAP_SIZE", "268435456"),
+    "cache_size": os.getenv("SQLITE_CACHE_SIZE", "-65536"),
+    "busy_timeout": os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"),
+}
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_memory_sqlite(url: str) -> bool:
+    return _is_sqlite(url) and (":memory:" in url or url.rstrip("/").endswith(":"))
+
+
+def _apply_sqlite_pragmas(sync_engine, read_only: bool) -> None:
+    """새 연결마다 SQLite PRAGMA를 적용합니다. 읽기 엔진 연결은 query_only로 쓰기를 막습니다."""
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            if value:
+                cursor.execute(f"PRAGMA {name}={value}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def _create_engine(url: str, pool_size: int, max_overflow: int, read_only: bool):
+    name = "read" if read_only else "write"
+    options = {"echo": DATABASE_ECHO}
+    if not _is_memory_sqlite(url):
+        # 체크아웃 대기 시간을 기록하는 큐 풀 사용
+        # (aiosqlite 파일 DB의 기본값은 NullPool이므로 연결 재사용과 PRAGMA 유지에도 필요)
+        options.update(
+            poolclass=instrumented_pool_class(name),
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=POOL_TIMEOUT
+        )
+    created = create_async_engine(url, **options)
+    if _is_sqlite(url) and not _is_memory_sqlite(url):
+        _apply_sqlite_pragmas(created.sync_engine, read_only)
+    if METRICS_ENABLED:
+        instrument_engine(created.sync_engine, name)
+    if SLOW_QUERY_ENABLED:
+        slow_query_log.instrument(created.sync_engine)
+    return created
+
 
 # SQLAlchemy 엔진 및 세션 설정
-engine = create_async_engine(DATABASE_URL, echo=True)
+# 쓰기 엔진: 생성/수정/삭제와 초기화 스크립트에서 사용
+engine = _create_engine(DATABASE_URL, WRITE_POOL_SIZE, 0, read_only=False)
 async_session_factory = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
     expire_on_commit=False
 )
 
+# 읽기 엔진: GET 등 조회 전용 라우트에서 사용 (인메모리 SQLite는 연결마다 별도 DB이므로 쓰기 엔진 공유)
+if _is_memory_sqlite(DATABASE_READ_URL):
+    read_engine = engine
+else:
+    read_engine = _create_engine(DATABASE_READ_URL, READ_POOL_SIZE, READ_MAX_OVERFLOW, read_only=True)
+read_session_factory = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
@@ -29,7 +109,21 @@ async def get_db():
             await session.close()
 
 
+async def get_read_db():
+    """읽기 전용 데이터베이스 세션 의존성 함수 (커밋하지 않고 종료 시 트랜잭션을 정리)"""
+    async with read_session_factory() as session:
+        yield session
+
+
+def _create_all(sync_conn):
+    Base.metadata.create_all(sync_conn)
+    # create_all은 이미 있는 테이블의 인덱스를 만들지 않으므로 나중에 추가된 인덱스를 따로 생성
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(sync_conn, checkfirst=True)
+
+
 async def create_tables():
-    """데이터베이스 테이블을 생성하는 함수"""
+    """데이터베이스 테이블과 인덱스를 생성하는 함수"""
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
\ No newline at end of file
+        await conn.run_sync(_create_all)
@@ -1,9 +1,41 @@
-from fastapi import Depends
+import os
+import secrets
+from typing import Optional
+from fastapi import Depends, Header
 from sqlalchemy.ext.asyncio import AsyncSession
-from database import get_db
+from database import get_db, get_read_db
+from exceptions import AdminAccessDeniedError
 from repositories.food_repository import FoodRepository
+from repositories.cached_food_repository import CachedFoodRepository, CACHE_ENABLED
+
+# 관리자 API 토큰 (설정하지 않으면 관리자 API 비활성화)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+
+
+def _food_repository(db: AsyncSession) -> FoodRepository:
+    if CACHE_ENABLED:
+        return CachedFoodRepository(db)
+    return FoodRepository(db)
 
 
 async def get_food_repository(db: AsyncSession = Depends(get_db)) -> FoodRepository:
-    """식품 리포지토리 의존성 주입"""
-    return FoodRepository(db)
\ No newline at end of file
+    """식품 리포지토리 의존성 주입 (FOOD_CACHE_ENABLED이면 조회 캐시 사용)"""
+    return _food_repository(db)
+
+
+async def get_read_food_repository(db: AsyncSession = Depends(get_read_db)) -> FoodRepository:
+    """조회 전용 식품 리포지토리 의존성 주입 (읽기 엔진 사용, 커밋하지 않음)"""
+    return _food_repository(db)
+
+
+def check_admin_token(x_admin_token: Optional[str]) -> None:
+    """관리자 토큰이 ADMIN_TOKEN과 일치하지 않으면 AdminAccessDeniedError를 발생시킵니다."""
+    if not ADMIN_TOKEN:
+        raise AdminAccessDeniedError("관리자 API가 비활성화되어 있습니다. (ADMIN_TOKEN 미설정)")
+    if not x_admin_token or not secrets.compare_digest(x_admin_token, ADMIN_TOKEN):
+        raise AdminAccessDeniedError()
+
+
+async def require_admin_token(x_admin_token: str = Header(None, description="관리자 토큰 (ADMIN_TOKEN)")) -> None:
+    """X-Admin-Token 헤더가 ADMIN_TOKEN과 일치하는지 확인하는 의존성"""
+    check_admin_token(x_admin_token)
@@ -3,8 +3,8 @@ from fastapi import HTTPException, status
 
 class FoodAPIException(HTTPException):
     """식품 API 기본 예외 클래스"""
-    def __init__(self, status_code: int, detail: str, error_code: str = None):
-        super().__init__(status_code=status_code, detail=detail)
+    def __init__(self, status_code: int, detail: str, error_code: str = None, headers: dict = None):
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
         self.error_code = error_code
 
 
@@ -51,4 +51,46 @@ class DatabaseError(FoodAPIException):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=detail,
             error_code="DATABASE_ERROR"
-        )
\ No newline at end of file
+        )
+
+
+class BatchOperationError(FoodAPIException):
+    """일괄 작업 중 실패한 항목이 있어 전체 작업을 취소한 경우 예외"""
+    def __init__(self, errors: list):
+        super().__init__(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{len(errors)}개 항목 처리에 실패하여 전체 작업을 취소했습니다.",
+            error_code="BATCH_OPERATION_FAILED"
+        )
+        self.details = {"errors": errors}
+
+
+class AdminAccessDeniedError(FoodAPIException):
+    """관리자 API 접근이 거부된 경우 예외"""
+    def __init__(self, detail: str = "관리자 토큰이 유효하지 않습니다."):
+        super().__init__(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=detail,
+            error_code="ADMIN_ACCESS_DENIED"
+        )
+
+
+class ProfileNotFoundError(FoodAPIException):
+    """요청한 프로파일이 없는 경우 예외"""
+    def __init__(self, profile_id: int):
+        super().__init__(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"ID {profile_id}인 프로파일을 찾을 수 없습니다. (최근 프로파일만 보관)",
+            error_code="PROFILE_NOT_FOUND"
+        )
+
+
+class ServiceOverloadedError(FoodAPIException):
+    """동시 처리 제한을 넘어 요청을 받을 수 없는 경우 예외"""
+    def __init__(self, priority: str, retry_after: int):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"요청이 많아 처리할 수 없습니다. {retry_after}초 후 다시 시도해 주세요. ({priority})",
+            error_code="SERVICE_OVERLOADED",
+            headers={"Retry-After": str(retry_after)}
+        )
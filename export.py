@@ -0,0 +1,137 @@
+import csv
+import io
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from database import read_session_factory
+from models.food import NUTRIENT_COLUMNS, RESPONSE_COLUMNS
+from repositories.food_repository import FoodRepository
+from schemas.food import FoodSearchParams
+from serialization import dumps
+
+try:
+    import pyarrow
+    import pyarrow.parquet as parquet
+except ImportError:  # pyarrow가 없으면 parquet 내보내기 비활성화
+    pyarrow = None
+
+
+class NDJSONWriter:
+    """한 줄에 식품 하나씩 JSON 객체로 쓰는 형식"""
+    media_type = "application/x-ndjson"
+    extension = "ndjson"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = columns
+
+    def start(self) -> bytes:
+        return b""
+
+    def write(self, rows: List[dict]) -> bytes:
+        return b"".join(dumps(row) + b"\n" for row in rows)
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class CSVWriter:
+    """첫 줄에 컬럼명을 쓰는 UTF-8 CSV 형식 (값이 없으면 빈 칸)"""
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = columns
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+
+    def _drain(self) -> bytes:
+        content = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return content
+
+    def start(self) -> bytes:
+        self._writer.writerow(self.columns)
+        return self._drain()
+
+    def write(self, rows: List[dict]) -> bytes:
+        self._writer.writerows([row[name] for name in self.columns] for row in rows)
+        return self._drain()
+
+    def finish(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter가 쓴 바이트를 모았다가 청크마다 꺼내는 쓰기 전용 스트림"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        content = b"".join(self._chunks)
+        self._chunks.clear()
+        return content
+
+
+class ParquetWriter:
+    """청크마다 row group 하나를 쓰는 Parquet 형식 (pyarrow 필요)"""
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns: Sequence[str]):
+        self.columns = columns
+        self.schema = pyarrow.schema([
+            (name, pyarrow.int64() if name == "id" else pyarrow.float64() if name in NUTRIENT_COLUMNS else pyarrow.string())
+            for name in columns
+        ])
+        self._sink = _ChunkSink()
+        self._writer = None
+
+    def start(self) -> bytes:
+        self._writer = parquet.ParquetWriter(pyarrow.PythonFile(self._sink, mode="w"), self.schema)
+        return self._sink.drain()
+
+    def write(self, rows: List[dict]) -> bytes:
+        self._writer.write_table(pyarrow.Table.from_pylist(rows, schema=self.schema))
+        return self._sink.drain()
+
+    def finish(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+WRITERS: Dict[str, type] = {"ndjson": NDJSONWriter, "csv": CSVWriter}
+if pyarrow is not None:
+    WRITERS["parquet"] = ParquetWriter
+
+# ?format= 에 허용하는 값 (parquet은 pyarrow가 설치된 경우만 동작)
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+
+async def export_foods(
+    export_format: str,
+    search_params: FoodSearchParams,
+    fields: Optional[Sequence[str]] = None
+) -> AsyncIterator[bytes]:
+    """검색 조건에 맞는 식품 전체를 export_format 형식의 바이트 청크로 내보냅니다.
+
+    응답 본문을 보내는 동안 열려 있어야 하므로 요청 의존성의 세션 대신 자체 읽기 세션을 사용합니다.
+    첫 청크에는 헤더와 첫 행 묶음이 함께 들어 있으므로, 첫 청크를 미리 읽으면 조회 오류를 응답 전에 확인할 수 있습니다.
+    """
+    writer = WRITERS[export_format](fields or RESPONSE_COLUMNS)
+    async with read_session_factory() as session:
+        chunk = writer.start()
+        # 중간에 닫히면 서버 측 커서도 바로 닫히도록 aclosing 사용
+        async with aclosing(FoodRepository(session).stream_rows(search_params, fields)) as batches:
+            async for rows in batches:
+                yield chunk + writer.write(rows)
+                chunk = b""
+        yield chunk + writer.finish()
@@ -0,0 +1,84 @@
+import hashlib
+import os
+from datetime import datetime
+from typing import Optional, Sequence
+
+from fastapi import Request
+from fastapi.responses import Response
+
+# 라우트별 Cache-Control 헤더 (환경변수로 변경 가능)
+CACHE_CONTROL = {
+    "food": os.getenv("CACHE_CONTROL_FOOD", "no-cache"),
+    "food_list": os.getenv("CACHE_CONTROL_FOOD_LIST", "no-cache"),
+    "food_search": os.getenv("CACHE_CONTROL_FOOD_SEARCH", "no-cache"),
+    "food_stats": os.getenv("CACHE_CONTROL_FOOD_STATS", "no-cache"),
+}
+
+
+def item_etag(
+    food_id: int,
+    updated_at: Optional[datetime],
+    fields: Optional[Sequence[str]] = None
+) -> str:
+    """단일 식품의 강한 ETag를 ID와 수정 시간(마이크로초 단위)으로 생성합니다.
+
+    다른 식품이 바뀌어도 이 식품의 ETag는 유지되도록 테이블 버전은 사용하지 않습니다.
+    fields로 응답 필드를 줄인 경우 표현이 달라지므로 필드 목록도 반영합니다.
+    """
+    stamp = int(updated_at.timestamp()) * 1_000_000 + updated_at.microsecond if updated_at else 0
+    if fields is None:
+        return f'"{food_id}-{stamp}"'
+    digest = hashlib.sha1(",".join(fields).encode()).hexdigest()[:8]
+    return f'"{food_id}-{stamp}-{digest}"'
+
+
+def collection_etag(version: int, request: Request) -> str:
+    """목록/검색 응답의 약한 ETag를 테이블 버전과 정규화된 쿼리 파라미터로 생성합니다."""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()[:16]
+    return f'W/"{version}-{digest}"'
+
+
+# 압축된 표현의 ETag에 붙는 인코딩 접미사 (예: "12-1700000000123456-gzip")
+ENCODING_ETAG_SUFFIXES = ("gzip", "br", "zstd")
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """압축된 표현의 ETag를 생성합니다. 원래 ETag 값 끝에 -인코딩을 붙입니다."""
+    weak = etag.startswith("W/")
+    opaque = etag[2:] if weak else etag
+    return f'{"W/" if weak else ""}{opaque[:-1]}-{encoding}"'
+
+
+def _opaque(etag: str) -> str:
+    # If-None-Match는 약한 비교를 사용하므로 W/ 접두사를 무시하고,
+    # 압축된 표현의 ETag도 같은 데이터이므로 인코딩 접미사를 무시
+    etag = etag.strip()
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    for suffix in ENCODING_ETAG_SUFFIXES:
+        if etag.endswith(f'-{suffix}"'):
+            return etag[:-len(suffix) - 2] + '"'
+    return etag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag와 일치하는지 확인합니다."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(candidate) == target for candidate in header.split(","))
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """본문 없는 304 응답을 생성합니다."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def set_validators(response: Response, etag: str, cache_control: str) -> None:
+    """응답에 ETag와 Cache-Control 헤더를 설정합니다."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
@@ -1,13 +1,13 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import asynccontextmanager
+from fastapi.responses import JSONResponse, Response
+from contextlib import asynccontextmanager, suppress
 from pydantic import ValidationError
+import asyncio
 import logging
 
-import os
-
-from database import create_tables, async_session_factory
 from routers.food import router as food_router
+from routers.admin import router as admin_router
 from exceptions import FoodAPIException
 from middleware import (
     food_api_exception_handler,
@@ -15,58 +15,33 @@ from middleware import (
     http_exception_handler_custom,
     general_exception_handler
 )
-from sqlalchemy import func, select
-from models.food import Food
+from repositories.cached_food_repository import food_cache, CACHE_ENABLED
+from startup import init_state, ping_database, run_startup
+import metrics
+import profiling
+import compression
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def auto_initialize_data():
-    """데이터가 없으면 자동으로 엑셀에서 초기화"""
-    async with async_session_factory() as session:
-        try:
-            # 데이터 개수 확인
-            result = await session.execute(select(func.count(Food.id)))
-            count = result.scalar()
-            
-            if count == 0:
-                logger.info("데이터베이스가 비어있습니다. 엑셀 파일에서 초기화를 시작합니다...")
-                
-                # 프로젝트 루트의 food_nutrition_db.xlsx 파일 사용
-                excel_path = "food_nutrition_db.xlsx"
-                if os.path.exists(excel_path):
-                    logger.info(f"엑셀 파일 사용: {excel_path}")
-                    
-                    # 동적으로 초기화 스크립트 임포트 및 실행
-                    from scripts.init_db_from_excel import init_from_excel
-                    await init_from_excel(excel_path, clear_existing=False)
-                    logger.info("엑셀 데이터 초기화가 완료되었습니다.")
-                else:
-                    logger.warning(f"초기화용 엑셀 파일을 찾을 수 없습니다: {excel_path}")
-                    logger.warning("프로젝트 루트에 food_nutrition_db.xlsx 파일이 있는지 확인해주세요.")
-            else:
-                logger.info(f"데이터베이스에 {count}개의 식품 데이터가 있습니다.")
-                
-        except Exception as e:
-            logger.error(f"자동 초기화 중 오류 발생: {e}")
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 시작/종료 이벤트 처리"""
     # 시작 시
     logger.info("애플리케이션을 시작합니다...")
-    await create_tables()
-    logger.info("데이터베이스 테이블이 생성되었습니다.")
-    
-    # 데이터가 없으면 엑셀에서 자동 초기화
-    await auto_initialize_data()
+    # 테이블 생성, 데이터 초기화, 카탈로그 적재는 워커 간 잠금을 잡고 백그라운드에서 실행하여
+    # 바로 요청을 받을 수 있게 함 (진행 상황은 GET /health/ready에서 확인)
+    startup_task = asyncio.create_task(run_startup())
     
     yield
     
     # 종료 시
     logger.info("애플리케이션을 종료합니다...")
+    if not startup_task.done():
+        startup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await startup_task
 
 
 app = FastAPI(
@@ -85,6 +60,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 응답 압축 (Accept-Encoding, 지표/프로파일링 시간에 압축 시간 포함)
+if compression.COMPRESSION_ENABLED:
+    app.add_middleware(compression.CompressionMiddleware)
+
+# 요청 지표 수집 (Prometheus 형식으로 GET /metrics에 노출)
+if metrics.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# 요청별 프로파일링 (X-Profile: 1 + X-Admin-Token, 결과는 /v1/admin/profiles)
+if profiling.PROFILING_ENABLED:
+    app.add_middleware(profiling.ProfilingMiddleware)
+
 # 예외 핸들러 등록
 app.add_exception_handler(FoodAPIException, food_api_exception_handler)
 app.add_exception_handler(ValidationError, validation_exception_handler)
@@ -93,6 +80,7 @@ app.add_exception_handler(Exception, general_exception_handler)
 
 # 라우터 등록
 app.include_router(food_router)
+app.include_router(admin_router)
 
 
 @app.get("/")
@@ -110,3 +98,40 @@ async def root():
 async def health_check():
     """헬스체크 엔드포인트"""
     return {"status": "healthy"}
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    """조회 캐시 통계 엔드포인트"""
+    return {
+        "enabled": CACHE_ENABLED,
+        **food_cache.stats(),
+        "compression": {"enabled": compression.COMPRESSION_ENABLED, **compression.compressed_body_cache.stats()},
+    }
+
+
+@app.get("/metrics", include_in_schema=metrics.METRICS_ENABLED)
+async def metrics_endpoint():
+    """Prometheus 텍스트 형식 지표 엔드포인트 (워커 프로세스별 값)"""
+    if not metrics.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="지표 수집이 비활성화되어 있습니다.")
+    return Response(content=metrics.render(), media_type=metrics.CONTENT_TYPE)
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """준비 상태 엔드포인트
+
+    데이터 초기화(진행 행 수/전체 행 수)와 DB ping 지연 시간을 보고하며,
+    초기화가 끝나고 DB가 응답할 때만 200, 그 외에는 503을 반환합니다.
+    """
+    database = await ping_database()
+    ready = init_state.ready and database["ok"]
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "not_ready",
+            "initialization": init_state.snapshot(),
+            "database": database,
+        }
+    )
@@ -0,0 +1,279 @@
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# /metrics 엔드포인트와 요청 계측 미들웨어 사용 여부
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "false").lower() in ("1", "true", "yes")
+
+# Prometheus 텍스트 형식 Content-Type (charset은 응답 클래스가 붙임)
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+# 요청 처리 시간 버킷(초)
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# SQL 실행/커넥션 대기 시간 버킷(초)
+DB_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+# 요청당 SQL 실행 횟수 버킷
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+# 라우트에 매칭되지 않은 요청(404 등)의 route 레이블. 원본 경로를 레이블로 쓰면 시계열이 무한히 늘어남
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self.values: Dict[tuple, float] = {}
+
+    def inc(self, labels: tuple = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """증감 가능한 현재 값"""
+    type_name = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: tuple = ()) -> None:
+        self.values[labels] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램
+
+    관측 시에는 해당 버킷 하나만 증가시키고, 누적 합은 출력할 때 계산합니다.
+    """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float], label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self.bounds = tuple(buckets)
+        # 레이블 값 -> [버킷별 개수(+Inf 포함), 합계]
+        self.series: Dict[tuple, list] = {}
+
+    def observe(self, value: float, labels: tuple = ()) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [[0] * (len(self.bounds) + 1), 0.0]
+        series[0][bisect_left(self.bounds, value)] += 1
+        series[1] += value
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        bucket_names = self.label_names + ("le",)
+        for labels, (counts, total) in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.bounds + (float("inf"),), counts):
+                cumulative += count
+                label_text = _format_labels(bucket_names, labels + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+HTTP_REQUESTS = Counter(
+    "food_api_http_requests_total", "HTTP requests by route template and status code.",
+    ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "food_api_http_request_duration_seconds", "HTTP request latency by route template.",
+    REQUEST_BUCKETS, ("method", "route")
+)
+HTTP_IN_FLIGHT = Gauge("food_api_http_requests_in_flight", "HTTP requests currently being processed.")
+REQUEST_DB_STATEMENTS = Histogram(
+    "food_api_http_request_db_statements", "SQL statements executed per HTTP request.",
+    STATEMENT_COUNT_BUCKETS, ("method", "route")
+)
+REQUEST_DB_DURATION = Histogram(
+    "food_api_http_request_db_seconds", "Total SQL execution time per HTTP request.",
+    REQUEST_BUCKETS, ("method", "route")
+)
+DB_STATEMENT_DURATION = Histogram(
+    "food_api_db_statement_duration_seconds", "SQL statement execution time by engine.",
+    DB_BUCKETS, ("engine",)
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "food_api_db_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection by engine.",
+    DB_BUCKETS, ("engine",)
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "food_api_db_pool_connections", "Pooled connections by engine and state.", ("engine", "state")
+)
+
+ADMISSION_IN_FLIGHT = Gauge(
+    "food_api_admission_in_flight", "Requests holding an admission slot by priority class.", ("priority",)
+)
+ADMISSION_QUEUED = Gauge(
+    "food_api_admission_queued", "Requests waiting for an admission slot by priority class.", ("priority",)
+)
+ADMISSION_WAIT = Histogram(
+    "food_api_admission_wait_seconds", "Time spent waiting in the admission queue by priority class.",
+    REQUEST_BUCKETS, ("priority",)
+)
+ADMISSION_REJECTED = Counter(
+    "food_api_admission_rejected_total", "Requests rejected with 503 by priority class and reason.",
+    ("priority", "reason")
+)
+
+REGISTRY: List[_Metric] = [
+    HTTP_REQUESTS, HTTP_REQUEST_DURATION, HTTP_IN_FLIGHT,
+    REQUEST_DB_STATEMENTS, REQUEST_DB_DURATION,
+    DB_STATEMENT_DURATION, DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS,
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUED, ADMISSION_WAIT, ADMISSION_REJECTED,
+]
+
+# 현재 요청의 [SQL 실행 횟수, SQL 실행 시간 합계]
+_request_db: ContextVar[Optional[list]] = ContextVar("food_api_request_db", default=None)
+
+# 계측된 엔진 목록 (이름, 엔진). 풀 상태 게이지를 출력할 때 사용
+_engines: List[Tuple[str, Engine]] = []
+
+
+def instrument_engine(sync_engine: Engine, name: str) -> None:
+    """엔진의 SQL 실행 횟수와 시간을 수집하는 이벤트를 등록합니다."""
+    _engines.append((name, sync_engine))
+    labels = (name,)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._metrics_started
+        DB_STATEMENT_DURATION.observe(elapsed, labels)
+        stats = _request_db.get()
+        if stats is not None:
+            stats[0] += 1
+            stats[1] += elapsed
+
+
+@lru_cache(maxsize=None)
+def instrumented_pool_class(name: str) -> type:
+    """커넥션 체크아웃 대기 시간을 기록하는 엔진별 풀 클래스를 반환합니다.
+
+    풀이 재생성(dispose)되어도 레이블이 유지되도록 인스턴스 속성 대신 클래스로 구분합니다.
+    """
+    labels = (name,)
+
+    class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+        def _do_get(self):
+            started = time.perf_counter()
+            try:
+                return super()._do_get()
+            finally:
+                DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, labels)
+
+    InstrumentedQueuePool.__name__ = f"InstrumentedQueuePool[{name}]"
+    return InstrumentedQueuePool
+
+
+def _collect_pool_connections() -> None:
+    for name, sync_engine in _engines:
+        pool = sync_engine.pool
+        if hasattr(pool, "checkedout") and hasattr(pool, "checkedin"):
+            DB_POOL_CONNECTIONS.set(pool.checkedout(), (name, "checked_out"))
+            DB_POOL_CONNECTIONS.set(pool.checkedin(), (name, "idle"))
+
+
+def render() -> str:
+    """등록된 모든 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    _collect_pool_connections()
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """요청 수, 처리 시간, 처리 중 요청 수, 요청당 SQL 실행 횟수/시간을 수집하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware와 달리 요청/응답 본문을 감싸지 않고 send만 가로채어 상태 코드를 기록하므로
+    요청당 비용은 시간 측정과 딕셔너리 갱신 몇 번뿐입니다.
+    route 레이블은 라우팅 후 scope에 기록된 라우트의 경로 템플릿(/v1/foods/{food_id})을 사용합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+        stats = [0, 0.0]
+        token = _request_db.set(stats)
+        HTTP_IN_FLIGHT.inc()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec()
+            _request_db.reset(token)
+
+            route = scope.get("route")
+            labels = (scope["method"], getattr(route, "path", UNMATCHED_ROUTE))
+            HTTP_REQUESTS.inc(labels + (str(status),))
+            HTTP_REQUEST_DURATION.observe(elapsed, labels)
+            REQUEST_DB_STATEMENTS.observe(stats[0], labels)
+            REQUEST_DB_DURATION.observe(stats[1], labels)
@@ -1,5 +1,6 @@
 from fastapi import Request, HTTPException
 from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exception_handlers import http_exception_handler
 from pydantic import ValidationError
 from exceptions import FoodAPIException
@@ -23,7 +24,8 @@ async def food_api_exception_handler(request: Request, exc: FoodAPIException):
     
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump()
+        content=error_response.model_dump(),
+        headers=exc.headers
     )
 
 
@@ -34,7 +36,8 @@ async def validation_exception_handler(request: Request, exc: ValidationError):
     error_detail = ErrorDetail(
         code="VALIDATION_ERROR",
         message="입력 데이터 유효성 검증에 실패했습니다.",
-        details={"errors": exc.errors()}
+        # field_validator에서 발생한 예외 객체(ctx.error)는 메시지 문자열로 변환
+        details={"errors": jsonable_encoder(exc.errors(), custom_encoder={Exception: str})}
     )
     
     error_response = ErrorResponse(error=error_detail)
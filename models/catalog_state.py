@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy.sql import func
+from database import Base
+
+
+class CatalogState(Base):
+    """식품 테이블 버전 정보 모델
+
+    식품 데이터를 변경하는 트랜잭션이 커밋될 때마다 version이 1씩 증가합니다.
+    목록/검색 응답의 ETag와 프로세스 내 캐시의 최신 여부 판단에 사용됩니다.
+    """
+    __tablename__ = "catalog_state"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -1,8 +1,33 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, Float, DateTime, Index
 from sqlalchemy.sql import func
 from database import Base
 
 
+# 문자열 컬럼 (딕셔너리 인코딩 대상)
+STRING_COLUMNS = (
+    "food_cd", "group_name", "food_name", "research_year",
+    "maker_name", "ref_name", "serving_size",
+)
+
+# 영양성분 컬럼 (실수형)
+NUTRIENT_COLUMNS = (
+    "calorie", "carbohydrate", "protein", "province", "sugars",
+    "salt", "cholesterol", "saturated_fatty_acids", "trans_fat",
+)
+
+# 응답에 포함되는 컬럼 (생성/수정 시간 제외)
+RESPONSE_COLUMNS = ("id",) + STRING_COLUMNS + NUTRIENT_COLUMNS
+
+
+def utcnow() -> datetime:
+    """수정 시간 값 (UTC, 마이크로초 단위)
+
+    SQLite의 CURRENT_TIMESTAMP는 초 단위이므로 같은 초 안의 연속 수정도 구분되도록 Python에서 설정합니다.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class Food(Base):
     """식품 정보 모델"""
     __tablename__ = "foods"
@@ -27,4 +52,14 @@ class Food(Base):
     
     # 생성/수정 시간 (선택사항)
     created_at = Column(DateTime, server_default=func.now())
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # 단일 식품 ETag에 사용하므로 마이크로초 단위로 기록
+    updated_at = Column(DateTime, default=utcnow, server_default=func.now(), onupdate=utcnow)
+
+    # 영양성분 범위 검색과 정렬(키셋 페이지네이션)용 (영양성분, id) 복합 인덱스
+    __table_args__ = tuple(
+        Index(f"ix_foods_{name}_id", name, "id") for name in NUTRIENT_COLUMNS
+    )
+
+    def to_dict(self) -> dict:
+        """응답 필드(id, 문자열, 영양성분)를 딕셔너리로 반환합니다."""
+        return {column: getattr(self, column) for column in RESPONSE_COLUMNS}
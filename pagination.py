@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+from exceptions import ValidationError
+
+
+def encode_cursor(last_id: int, sort: Optional[str] = None, sort_value: Optional[float] = None) -> str:
+    """마지막 항목의 ID(와 정렬 컬럼 값)를 불투명한 커서 문자열로 인코딩합니다."""
+    payload = {"id": last_id}
+    if sort is not None and sort != "id":
+        payload["sort"] = sort
+        payload["value"] = sort_value
+    data = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip("=")
+
+
+def _decode_payload(cursor: str) -> dict:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(payload, dict) or not isinstance(payload["id"], int):
+            raise ValueError(payload)
+        return payload
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("유효하지 않은 커서입니다.")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """커서 문자열에서 마지막 항목의 ID를 복원합니다."""
+    if not cursor:
+        return None
+    return _decode_payload(cursor)["id"]
+
+
+def decode_keyset_cursor(cursor: Optional[str], sort: str = "id") -> Optional[tuple]:
+    """정렬 기준에 맞는 키셋 커서를 (ID,) 또는 (정렬 컬럼 값, ID) 튜플로 복원합니다.
+
+    다른 정렬 기준으로 발급된 커서는 거부합니다.
+    """
+    if not cursor:
+        return None
+    payload = _decode_payload(cursor)
+    if sort == "id":
+        return (payload["id"],)
+    value = payload.get("value")
+    if payload.get("sort") != sort or isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValidationError("유효하지 않은 커서입니다.")
+    return (float(value), payload["id"])
+
+
+def keyset_key(row: dict, sort: str = "id") -> tuple:
+    """행의 키셋 정렬 키를 decode_keyset_cursor와 같은 형태로 반환합니다."""
+    if sort == "id":
+        return (row["id"],)
+    return (row[sort], row["id"])
+
+
+def keyset_cursor(row: dict, sort: str = "id") -> str:
+    """행 다음부터 이어서 조회하는 커서를 생성합니다."""
+    return encode_cursor(row["id"], sort, row.get(sort))
@@ -0,0 +1,304 @@
+import asyncio
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+from fastapi import Request
+
+from dependencies import check_admin_token
+from exceptions import AdminAccessDeniedError
+from middleware import food_api_exception_handler
+
+# 요청별 프로파일링 사용 여부 및 설정
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "1"))
+PROFILING_MAX_PROFILES = int(os.getenv("PROFILING_MAX_PROFILES", "20"))
+PROFILING_MAX_SECONDS = float(os.getenv("PROFILING_MAX_SECONDS", "30"))
+# 프로파일링할 수 있는 경로 접두사
+PROFILING_PATH_PREFIX = os.getenv("PROFILING_PATH_PREFIX", "/v1/foods")
+
+# 프로파일링을 요청하는 헤더 (값이 1/true이고 X-Admin-Token이 유효할 때만)
+PROFILE_HEADER = b"x-profile"
+ADMIN_TOKEN_HEADER = b"x-admin-token"
+
+# 샘플의 시간 분류 규칙: 가장 안쪽 프레임부터 처음 일치하는 규칙의 분류를 사용
+# (분류, 파일 경로 조각, 함수 이름)
+_CATEGORY_RULES = (
+    ("compress", ("compression.py",), ()),
+    ("json", ("serialization.py", "/json/", "starlette/responses.py", "fastapi/encoders.py"), ()),
+    ("pydantic", ("/pydantic/", "/pydantic_core/"), ("serialize_response", "_prepare_response_content")),
+    ("orm", ("sqlalchemy/orm/", "sqlalchemy/engine/result.py", "sqlalchemy/engine/row.py"), ()),
+    ("sql", ("sqlalchemy/", "aiosqlite/", "sqlite3/", "asyncpg/"), ()),
+)
+# 일치하는 규칙이 없을 때: 실행 중이면 애플리케이션 코드, 대기 중이면 SQL 외의 대기(다른 태스크, 요청 본문 등)
+APP_CATEGORY = "app"
+AWAIT_CATEGORY = "await"
+# 대기 중인 스택 끝에 붙이는 가상 프레임
+_AWAIT_FRAME = ("(await)", "", 0)
+
+_ids = itertools.count(1)
+
+# 프로파일링 중에는 GIL 전환 간격을 샘플링 간격으로 줄여 CPU 작업 중에도 샘플러 스레드가 깨어날 수 있게 함
+_DEFAULT_SWITCH_INTERVAL = sys.getswitchinterval()
+_active_samplers = 0
+_active_lock = threading.Lock()
+
+
+def _classify(frames: List[tuple], suspended: bool) -> str:
+    for name, filename, _ in reversed(frames):
+        for category, paths, functions in _CATEGORY_RULES:
+            if name.rsplit(".", 1)[-1] in functions or any(path in filename for path in paths):
+                return category
+    return AWAIT_CATEGORY if suspended else APP_CATEGORY
+
+
+def _frame_key(frame) -> tuple:
+    code = frame.f_code
+    return (code.co_qualname, code.co_filename.replace("\\", "/"), code.co_firstlineno)
+
+
+def _running_stack(frame, task_frame) -> List[tuple]:
+    """실행 중인 스레드의 스택을 바깥 -> 안쪽 순서로 반환합니다. 태스크 코루틴 바깥의 이벤트 루프 프레임은 제외합니다."""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        if frame is task_frame:
+            break
+        frame = frame.f_back
+    return [_frame_key(frame) for frame in reversed(frames)]
+
+
+def _awaited(coro):
+    """코루틴/제너레이터/비동기 제너레이터가 기다리는 다음 객체와 그 프레임을 반환합니다."""
+    for frame_attr, await_attr in (("cr_frame", "cr_await"), ("ag_frame", "ag_await"), ("gi_frame", "gi_yieldfrom")):
+        if hasattr(coro, frame_attr):
+            return getattr(coro, frame_attr), getattr(coro, await_attr)
+    return None, None
+
+
+def _suspended_stack(coro) -> List[tuple]:
+    """대기 중인 태스크의 코루틴 대기 체인을 바깥 -> 안쪽 순서로 반환합니다.
+
+    async with로 쓰는 비동기 제너레이터(get_db 같은 yield 의존성)는 asend 객체 너머를 따라갈 수 없으므로
+    contextlib 컨텍스트 매니저의 gen을 이어서 따라갑니다.
+    """
+    frames = []
+    while coro is not None:
+        frame, awaited = _awaited(coro)
+        if frame is None:
+            break
+        frames.append(_frame_key(frame))
+        if awaited is not None and _awaited(awaited)[0] is None:
+            context_manager = frame.f_locals.get("self")
+            awaited = getattr(context_manager, "gen", None) or awaited
+        coro = awaited
+    frames.append(_AWAIT_FRAME)
+    return frames
+
+
+class RequestProfile:
+    """요청 하나의 샘플링 프로파일
+
+    샘플은 (프레임 번호 목록, 가중치 ms, 분류)이며 speedscope의 sampled 프로파일로 내보냅니다.
+    """
+
+    def __init__(self, method: str, path: str, query: str):
+        self.id = next(_ids)
+        self.method = method
+        self.path = path
+        self.query = query
+        self.status: Optional[int] = None
+        self.started_at = time.time()
+        self.duration_ms = 0.0
+        self.frames: List[tuple] = []
+        self._frame_index: Dict[tuple, int] = {}
+        self.samples: List[List[int]] = []
+        self.weights: List[float] = []
+        self.breakdown_ms: Dict[str, float] = {}
+
+    def add_sample(self, frames: List[tuple], weight_ms: float, category: str) -> None:
+        stack = []
+        for key in frames:
+            index = self._frame_index.get(key)
+            if index is None:
+                index = self._frame_index[key] = len(self.frames)
+                self.frames.append(key)
+            stack.append(index)
+        self.samples.append(stack)
+        self.weights.append(weight_ms)
+        self.breakdown_ms[category] = self.breakdown_ms.get(category, 0.0) + weight_ms
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "query": self.query,
+            "status": self.status,
+            "started_at": self.started_at,
+            "duration_ms": round(self.duration_ms, 3),
+            "sample_count": len(self.samples),
+            "breakdown_ms": {key: round(value, 3) for key, value in sorted(self.breakdown_ms.items())},
+        }
+
+    def to_speedscope(self) -> dict:
+        """speedscope(https://www.speedscope.app) 파일 형식으로 변환합니다."""
+        name = f"{self.method} {self.path}" + (f"?{self.query}" if self.query else "")
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "food-api profiling",
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [{"name": frame, "file": file, "line": line} for frame, file, line in self.frames],
+            },
+            "profiles": [{
+                "type": "sampled",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": round(sum(self.weights), 3),
+                "samples": self.samples,
+                "weights": [round(weight, 3) for weight in self.weights],
+            }],
+        }
+
+
+class StackSampler(threading.Thread):
+    """이벤트 루프 스레드를 주기적으로 샘플링하여 대상 태스크의 스택만 기록하는 스레드
+
+    대상 태스크가 실행 중이면 루프 스레드의 현재 스택을, 대기 중이면 태스크의 코루틴 대기 체인을 기록하므로
+    DB 응답 대기처럼 루프가 다른 일을 하는 시간도 벽시계 기준으로 포함됩니다.
+    """
+
+    def __init__(self, profile: RequestProfile, loop, task, thread_id: int, interval_ms: float, max_seconds: float):
+        super().__init__(name=f"profiler-{profile.id}", daemon=True)
+        self.profile = profile
+        self.loop = loop
+        self.task = task
+        self.thread_id = thread_id
+        self.interval = interval_ms / 1000
+        self.max_seconds = max_seconds
+        self._stop_event = threading.Event()
+
+    def start(self) -> None:
+        global _active_samplers
+        with _active_lock:
+            _active_samplers += 1
+            sys.setswitchinterval(min(_DEFAULT_SWITCH_INTERVAL, self.interval))
+        super().start()
+
+    def stop(self) -> None:
+        global _active_samplers
+        self._stop_event.set()
+        self.join()
+        with _active_lock:
+            _active_samplers -= 1
+            if not _active_samplers:
+                sys.setswitchinterval(_DEFAULT_SWITCH_INTERVAL)
+
+    def run(self) -> None:
+        started = last = time.perf_counter()
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            self._sample((now - last) * 1000)
+            last = now
+            if now - started > self.max_seconds:
+                break
+
+    def _sample(self, weight_ms: float) -> None:
+        if self._stop_event.is_set():
+            return
+        task_frame = self.task.get_coro().cr_frame
+        if asyncio.current_task(self.loop) is self.task:
+            frame = sys._current_frames().get(self.thread_id)
+            frames = _running_stack(frame, task_frame)
+            suspended = False
+        else:
+            frames = _suspended_stack(self.task.get_coro())
+            suspended = True
+        if frames:
+            self.profile.add_sample(frames, weight_ms, _classify(frames, suspended))
+
+
+class ProfileStore:
+    """최근 프로파일을 최대 max_profiles개까지 보관합니다."""
+
+    def __init__(self, max_profiles: int):
+        self.profiles: deque = deque(maxlen=max_profiles)
+
+    def add(self, profile: RequestProfile) -> None:
+        self.profiles.append(profile)
+
+    def get(self, profile_id: int) -> Optional[RequestProfile]:
+        for profile in self.profiles:
+            if profile.id == profile_id:
+                return profile
+        return None
+
+    def list(self) -> List[dict]:
+        return [profile.summary() for profile in reversed(self.profiles)]
+
+
+profile_store = ProfileStore(PROFILING_MAX_PROFILES)
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+class ProfilingMiddleware:
+    """X-Profile 헤더가 붙은 /v1/foods 요청을 샘플링 프로파일링하는 ASGI 미들웨어
+
+    의존성(get_db -> 리포지토리), 리포지토리 호출, 응답 직렬화와 세션 정리까지 요청 처리 전체를 포함합니다.
+    X-Admin-Token이 유효해야 하며, 응답에는 관리자 API에서 조회할 X-Profile-Id 헤더가 붙습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not scope["path"].startswith(PROFILING_PATH_PREFIX)
+            or (_header(scope, PROFILE_HEADER) or "").lower() not in ("1", "true")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            check_admin_token(_header(scope, ADMIN_TOKEN_HEADER))
+        except AdminAccessDeniedError as exc:
+            response = await food_api_exception_handler(Request(scope), exc)
+            await response(scope, receive, send)
+            return
+
+        profile = RequestProfile(scope["method"], scope["path"], scope.get("query_string", b"").decode("latin-1"))
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                profile.status = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-profile-id", str(profile.id).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        sampler = StackSampler(
+            profile, asyncio.get_running_loop(), asyncio.current_task(), threading.get_ident(),
+            PROFILING_INTERVAL_MS, PROFILING_MAX_SECONDS
+        )
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.duration_ms = (time.perf_counter() - started) * 1000
+            sampler.stop()
+            profile_store.add(profile)
@@ -0,0 +1,210 @@
+import os
+from dataclasses import dataclass
+from typing import FrozenSet, List, Optional, Sequence, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from cache import LRUCache
+from pagination import decode_keyset_cursor, keyset_key
+from repositories import events
+from repositories.events import FoodChange
+from repositories.food_repository import FoodRepository, project_rows
+from schemas.food import FoodResponse, FoodSearchParams, PaginationParams
+
+# 읽기 캐시 사용 여부 및 설정
+CACHE_ENABLED = os.getenv("FOOD_CACHE_ENABLED", "false").lower() in ("1", "true", "yes")
+CACHE_MAX_ENTRIES = int(os.getenv("FOOD_CACHE_MAX_ENTRIES", "1024"))
+CACHE_TTL_SECONDS = float(os.getenv("FOOD_CACHE_TTL_SECONDS", "300"))
+
+
+def row_matches(search_params: FoodSearchParams, row: dict) -> bool:
+    """식품 행이 검색 조건을 만족하는지 확인합니다. (SQLite LIKE와 같이 대소문자 무시)"""
+    contains_filters = (
+        ("food_name", search_params.food_name),
+        ("maker_name", search_params.maker_name),
+        ("food_cd", search_params.food_code),
+    )
+    for name, query in contains_filters:
+        if query and query.lower() not in row[name].lower():
+            return False
+    if search_params.research_year and row["research_year"] != search_params.research_year:
+        return False
+    for name, low, high in search_params.nutrient_ranges():
+        if low is not None and row[name] < low:
+            return False
+        if high is not None and row[name] > high:
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class _PageEntry:
+    items: List[dict]
+    total: int
+    next_cursor: Optional[str]
+    ids: FrozenSet[int]
+
+
+@dataclass(frozen=True)
+class _SearchEntry:
+    items: List[dict]
+    next_cursor: Optional[str]
+    search_params: FoodSearchParams
+    after_key: Optional[tuple]
+
+    def _follows(self, key: tuple, other: tuple) -> bool:
+        # 정렬 순서상 key가 other보다 뒤에 오는지 여부
+        return key < other if self.search_params.order == "desc" else key > other
+
+    def affected_by(self, row: dict) -> bool:
+        """row의 변경이 이 검색 결과 페이지에 영향을 주는지 확인합니다."""
+        if not row_matches(self.search_params, row):
+            return False
+        sort = self.search_params.sort
+        key = keyset_key(row, sort)
+        if self.after_key is not None and not self._follows(key, self.after_key):
+            return False
+        # 다음 페이지가 있으면 마지막 항목 이후의 변경은 이 페이지와 무관
+        if self.next_cursor is not None and self._follows(key, keyset_key(self.items[-1], sort)):
+            return False
+        return True
+
+
+class FoodCache(LRUCache):
+    """식품 조회 결과 캐시
+
+    로컬 쓰기는 변경된 행이 영향을 주는 항목만 무효화하고,
+    다른 프로세스의 쓰기로 테이블 버전이 건너뛰면 전체를 비웁니다.
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        super().__init__(max_entries, ttl)
+        self.db_version: Optional[int] = None
+        # 무효화가 일어날 때마다 증가. 조회 도중 무효화된 결과가 저장되지 않도록 사용
+        self.generation = 0
+
+    def sync_version(self, version: int) -> None:
+        """데이터베이스 테이블 버전과 다르면 전체를 비웁니다."""
+        if version != self.db_version:
+            self.clear()
+            self.generation += 1
+            self.db_version = version
+
+    def set_if_current(self, generation: int, key, value) -> None:
+        """조회를 시작한 이후 무효화가 없었을 때만 값을 저장합니다."""
+        if generation == self.generation:
+            self.set(key, value)
+
+    def on_changes(self, changes: List[FoodChange], version: Optional[int] = None) -> None:
+        """커밋된 변경 내역으로 캐시를 무효화합니다."""
+        self.generation += 1
+        if version is None or self.db_version is None or version != self.db_version + 1:
+            self.clear()
+            self.db_version = None
+            return
+        for change in changes:
+            if change.kind == "reset":
+                self.clear()
+                break
+            self._invalidate(change)
+        self.db_version = version
+
+    def _invalidate(self, change: FoodChange) -> None:
+        rows = [row for row in (change.before, change.after) if row is not None]
+        self.delete(("id", change.food_id))
+        for row in rows:
+            self.delete(("cd", row["food_cd"]))
+        count_changed = change.before is None or change.after is None
+
+        def stale(key, value) -> bool:
+            if key[0] == "all":
+                return count_changed or change.food_id in value.ids
+            if key[0] == "search":
+                return any(value.affected_by(row) for row in rows)
+            return False
+
+        self.delete_where(stale)
+
+
+food_cache = FoodCache(CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS)
+events.subscribe(food_cache.on_changes)
+
+
+class CachedFoodRepository(FoodRepository):
+    """조회 결과를 프로세스 내 LRU 캐시에 보관하는 식품 리포지토리
+
+    쓰기 작업은 FoodRepository를 그대로 사용하며, 캐시에는 응답 값 스냅샷만 저장합니다.
+    캐시 항목은 항상 전체 필드로 저장하고, fields가 지정되면 반환할 때 필드를 골라냅니다.
+    캐시된 딕셔너리는 여러 요청이 공유하므로 호출자는 수정하지 않아야 합니다.
+    """
+
+    def __init__(self, db: AsyncSession, cache: FoodCache = food_cache):
+        super().__init__(db)
+        self.cache = cache
+        self._version: Optional[int] = None
+
+    async def get_version(self) -> int:
+        # 요청 하나에서는 한 번만 조회
+        if self._version is None:
+            self._version = await super().get_version()
+        return self._version
+
+    async def get_validator(self, food_id: int):
+        updated_at, version = await super().get_validator(food_id)
+        self._version = version
+        return updated_at, version
+
+    async def _begin_read(self) -> int:
+        self.cache.sync_version(await self.get_version())
+        return self.cache.generation
+
+    async def get_by_id(self, food_id: int, fields: Optional[Sequence[str]] = None) -> Union[FoodResponse, dict]:
+        generation = await self._begin_read()
+        key = ("id", food_id)
+        hit, food = self.cache.get(key)
+        if not hit:
+            food = FoodResponse.model_validate(await super().get_by_id(food_id))
+            self.cache.set_if_current(generation, key, food)
+        if fields is not None:
+            return {name: getattr(food, name) for name in fields}
+        return food
+
+    async def get_by_food_cd(self, food_cd: str) -> Optional[FoodResponse]:
+        generation = await self._begin_read()
+        key = ("cd", food_cd)
+        hit, food = self.cache.get(key)
+        if not hit:
+            food = await super().get_by_food_cd(food_cd)
+            food = FoodResponse.model_validate(food) if food else None
+            self.cache.set_if_current(generation, key, food)
+        return food
+
+    async def get_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[dict], int, Optional[str]]:
+        generation = await self._begin_read()
+        page = None if pagination.cursor else pagination.page
+        key = ("all", page, pagination.limit, pagination.cursor)
+        hit, entry = self.cache.get(key)
+        if not hit:
+            foods, total, next_cursor = await super().get_all(pagination)
+            entry = _PageEntry(foods, total, next_cursor, frozenset(food["id"] for food in foods))
+            self.cache.set_if_current(generation, key, entry)
+        return project_rows(entry.items, fields), entry.total, entry.next_cursor
+
+    async def search(
+        self,
+        search_params: FoodSearchParams,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[dict], Optional[str]]:
+        generation = await self._begin_read()
+        key = ("search", tuple(sorted(search_params.model_dump().items())))
+        hit, entry = self.cache.get(key)
+        if not hit:
+            foods, next_cursor = await super().search(search_params)
+            after_key = decode_keyset_cursor(search_params.cursor, search_params.sort)
+            entry = _SearchEntry(foods, next_cursor, search_params, after_key)
+            self.cache.set_if_current(generation, key, entry)
+        return project_rows(entry.items, fields), entry.next_cursor
@@ -0,0 +1,56 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Union
+
+from sqlalchemy import event, select, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import Session
+
+from models.catalog_state import CatalogState
+from repositories import events
+
+# catalog_state 테이블의 단일 행 ID
+_STATE_ID = 1
+
+
+def _bump_statement(dialect_name: str):
+    dialects = {"postgresql": postgresql, "sqlite": sqlite}
+    table = CatalogState.__table__
+    stmt = dialects[dialect_name].insert(table).values(id=_STATE_ID, version=1)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.c.id],
+        set_={"version": table.c.version + 1, "updated_at": func.now()}
+    ).returning(table.c.version)
+
+
+async def get_catalog_version(db: Union[AsyncSession, AsyncConnection]) -> int:
+    """현재 식품 테이블 버전을 조회합니다."""
+    result = await db.execute(select(CatalogState.version).where(CatalogState.id == _STATE_ID))
+    return result.scalar() or 0
+
+
+@asynccontextmanager
+async def read_snapshot(db: AsyncSession) -> AsyncIterator[AsyncConnection]:
+    """테이블 버전과 식품 행을 같은 시점으로 읽는 읽기 트랜잭션 연결을 엽니다.
+
+    pysqlite는 SELECT만으로는 트랜잭션을 시작하지 않아 문장마다 다른 시점을 보므로 BEGIN을 직접 실행하고,
+    PostgreSQL은 REPEATABLE READ로 트랜잭션 전체가 첫 조회 시점을 보게 합니다.
+    """
+    async with db.bind.connect() as conn:
+        if conn.dialect.name == "sqlite":
+            await conn.exec_driver_sql("BEGIN")
+        else:
+            await conn.execution_options(isolation_level="REPEATABLE READ")
+        try:
+            yield conn
+        finally:
+            await conn.rollback()
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_before_commit(session):
+    # 식품 변경 내역이 있는 트랜잭션만 같은 트랜잭션 안에서 버전을 올림
+    if not events.has_pending(session):
+        return
+    result = session.execute(_bump_statement(session.get_bind().dialect.name))
+    events.set_committed_version(session, result.scalar())
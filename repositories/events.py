@@ -0,0 +1,89 @@
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 세션 info에 커밋 대기 중인 변경 내역과 커밋될 테이블 버전을 보관하는 키
+_PENDING_KEY = "food_changes"
+_VERSION_KEY = "food_catalog_version"
+
+_listeners: List[Callable[[List["FoodChange"], Optional[int]], None]] = []
+
+
+@dataclass(frozen=True)
+class FoodChange:
+    """커밋된 식품 데이터 변경 내역
+
+    kind는 "upsert", "delete", "reset" 중 하나입니다.
+    before/after는 변경 전/후의 컬럼 값 딕셔너리입니다.
+    """
+    kind: str
+    food_id: Optional[int] = None
+    before: Optional[dict] = None
+    after: Optional[dict] = None
+
+
+def subscribe(listener: Callable[[List[FoodChange], Optional[int]], None]) -> None:
+    """커밋된 변경 내역을 전달받을 리스너를 등록합니다.
+
+    리스너는 (변경 내역 목록, 커밋 후 테이블 버전)으로 호출됩니다.
+    """
+    if listener not in _listeners:
+        _listeners.append(listener)
+
+
+def unsubscribe(listener: Callable[[List[FoodChange], Optional[int]], None]) -> None:
+    """등록된 리스너를 해제합니다."""
+    if listener in _listeners:
+        _listeners.remove(listener)
+
+
+def _pending(session) -> list:
+    return session.info.setdefault(_PENDING_KEY, [])
+
+
+def has_pending(session) -> bool:
+    """커밋 대기 중인 변경 내역이 있는지 확인합니다."""
+    return bool(session.info.get(_PENDING_KEY))
+
+
+def set_committed_version(session, version: int) -> None:
+    """이 트랜잭션이 커밋되면 적용될 테이블 버전을 기록합니다."""
+    session.info[_VERSION_KEY] = version
+
+
+def record_upsert(session, after: dict, before: Optional[dict] = None) -> None:
+    """식품 생성/수정 내역을 기록합니다. 커밋 후에 리스너로 전달됩니다."""
+    _pending(session).append(FoodChange("upsert", after["id"], before, after))
+
+
+def record_delete(session, before: dict) -> None:
+    """식품 삭제 내역을 기록합니다."""
+    _pending(session).append(FoodChange("delete", before["id"], before, None))
+
+
+def record_reset(session) -> None:
+    """대량 적재처럼 개별 추적이 불가능한 변경을 기록합니다."""
+    _pending(session).append(FoodChange("reset"))
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    version = session.info.pop(_VERSION_KEY, None)
+    if not changes:
+        return
+    for listener in list(_listeners):
+        try:
+            listener(changes, version)
+        except Exception as e:
+            logger.error(f"식품 변경 리스너 처리 중 오류 발생: {e}", exc_info=True)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_VERSION_KEY, None)
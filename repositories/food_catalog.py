@@ -0,0 +1,332 @@
+import asyncio
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Set
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.food import Food, STRING_COLUMNS, NUTRIENT_COLUMNS, RESPONSE_COLUMNS
+from repositories import events
+from repositories.events import FoodChange
+from repositories.catalog_version import get_catalog_version
+from repositories.ngram_index import NgramIndex
+from schemas.food import FoodSearchParams
+
+logger = logging.getLogger(__name__)
+
+# 검색에 인메모리 카탈로그를 사용할지 여부
+CATALOG_ENABLED = os.getenv("FOOD_CATALOG_ENABLED", "false").lower() in ("1", "true", "yes")
+
+_INITIAL_CAPACITY = 1024
+
+# n-gram 색인으로 부분 일치 검색을 처리하는 컬럼
+INDEXED_COLUMNS = ("food_cd", "food_name", "maker_name")
+
+# 영양성분 컬럼명 -> 영양성분 행렬의 열 번호
+NUTRIENT_INDEX = {name: index for index, name in enumerate(NUTRIENT_COLUMNS)}
+
+
+class DictionaryColumn:
+    """딕셔너리 인코딩된 문자열 컬럼
+
+    고유 문자열은 values에 한 번만 저장하고, 각 행은 int32 코드만 가집니다.
+    indexed 컬럼은 고유값에 대한 n-gram 색인과 코드별 행 위치 목록을 유지하여
+    부분 일치 검색을 테이블 크기가 아닌 일치 건수에 비례하는 비용으로 처리합니다.
+    """
+
+    def __init__(self, capacity: int, indexed: bool = False):
+        self.values: List[str] = []
+        self.lookup: Dict[str, int] = {}
+        self.refcounts: List[int] = []
+        self.codes = np.zeros(capacity, dtype=np.int32)
+        self.index = NgramIndex() if indexed else None
+        self.rows: Dict[int, Set[int]] = {}
+
+    def grow(self, capacity: int) -> None:
+        codes = np.zeros(capacity, dtype=np.int32)
+        codes[:len(self.codes)] = self.codes
+        self.codes = codes
+
+    def assign(self, position: int, value: str, replace: bool) -> None:
+        """행 위치에 값을 설정합니다. replace가 참이면 기존 값을 먼저 해제합니다."""
+        if replace:
+            if self.values[self.codes[position]] == value:
+                return
+            self.release(position)
+
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            self.values.append(value)
+            self.refcounts.append(0)
+            self.lookup[value] = code
+        if self.refcounts[code] == 0 and self.index is not None:
+            self.index.add(code, value)
+        self.refcounts[code] += 1
+        self.codes[position] = code
+        if self.index is not None:
+            self.rows.setdefault(code, set()).add(position)
+
+    def release(self, position: int) -> None:
+        """행 위치의 값 참조를 해제합니다. 참조가 없어진 값은 색인에서 제거합니다."""
+        code = int(self.codes[position])
+        self.refcounts[code] -= 1
+        if self.index is not None:
+            self.rows[code].discard(position)
+            if self.refcounts[code] == 0:
+                self.index.remove(code)
+                del self.rows[code]
+
+    def positions_containing(self, query: str) -> Set[int]:
+        """query를 포함하는 값을 가진 행 위치 집합을 반환합니다. (SQLite LIKE와 같이 대소문자 무시)"""
+        positions: Set[int] = set()
+        for code in self.index.search(query):
+            positions |= self.rows[code]
+        return positions
+
+
+class FoodCatalog:
+    """식품 테이블 전체를 NumPy 컬럼으로 보관하는 읽기 전용 엔진
+
+    문자열 컬럼은 딕셔너리 인코딩, 영양성분은 (행 x 영양성분) 연속 행렬로 저장합니다.
+    쓰기는 항상 데이터베이스를 거치며, 커밋된 변경 내역을 받아 동기화합니다.
+    다른 프로세스의 쓰기로 데이터베이스 테이블 버전이 앞서가면 다음 조회 시 다시 적재합니다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._loading = False
+        self._buffered: List[tuple] = []
+        # 카탈로그 내용이 바뀔 때마다 증가 (다시 적재해도 감소하지 않으므로 파생 색인의 갱신 판단에 사용)
+        self.version = 0
+        self._reset(0)
+
+    def _reset(self, capacity: int) -> None:
+        capacity = max(capacity, _INITIAL_CAPACITY)
+        self.size = 0
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.nutrients = np.zeros((capacity, len(NUTRIENT_COLUMNS)), dtype=np.float64)
+        self.columns: Dict[str, DictionaryColumn] = {
+            name: DictionaryColumn(capacity, indexed=name in INDEXED_COLUMNS)
+            for name in STRING_COLUMNS
+        }
+        self.positions: Dict[int, int] = {}
+        self.version += 1
+        self.db_version: Optional[int] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    @property
+    def count(self) -> int:
+        return len(self.positions)
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """카탈로그가 적재되지 않았거나 데이터베이스 버전과 다르면 다시 적재합니다."""
+        db_version = await get_catalog_version(db)
+        if self._loaded and self.db_version == db_version:
+            return
+        async with self._lock:
+            if not self._loaded or self.db_version != db_version:
+                await self.load(db)
+
+    async def load(self, db: AsyncSession) -> None:
+        """데이터베이스의 식품 테이블 전체를 컬럼 형태로 적재합니다."""
+        self._loading = True
+        try:
+            # 버전을 먼저 읽어야 그 사이의 쓰기가 있어도 다음 조회에서 다시 적재됨
+            db_version = await get_catalog_version(db)
+            columns = [getattr(Food, name) for name in RESPONSE_COLUMNS]
+            result = await db.execute(select(*columns).order_by(Food.id))
+            rows = result.all()
+
+            self._reset(len(rows))
+            for row in rows:
+                self._upsert(row._mapping)
+            self.db_version = db_version
+            self._loaded = True
+
+            # 적재 도중 커밋된 변경 내역 반영
+            buffered, self._buffered = self._buffered, []
+            for changes, version in buffered:
+                self._apply(changes, version)
+            logger.info(f"인메모리 식품 카탈로그를 적재했습니다: {self.count}개")
+        finally:
+            self._loading = False
+
+    def invalidate(self) -> None:
+        """카탈로그를 비워 다음 조회 시 다시 적재되도록 합니다."""
+        self._loaded = False
+        self._reset(0)
+
+    def on_changes(self, changes: List[FoodChange], version: Optional[int] = None) -> None:
+        """커밋된 변경 내역을 카탈로그에 반영합니다."""
+        if self._loading:
+            self._buffered.append((changes, version))
+            return
+        if self._loaded:
+            self._apply(changes, version)
+
+    def _apply(self, changes: List[FoodChange], version: Optional[int]) -> None:
+        for change in changes:
+            if change.kind == "reset":
+                self.invalidate()
+                return
+            if change.kind == "upsert":
+                self._upsert(change.after)
+            elif change.kind == "delete":
+                self._delete(change.food_id)
+
+        # 바로 다음 버전일 때만 최신으로 간주 (건너뛴 버전은 다른 프로세스의 쓰기)
+        if version is not None and self.db_version is not None and version == self.db_version + 1:
+            self.db_version = version
+
+    def _grow(self) -> None:
+        capacity = len(self.ids) * 2
+        ids = np.zeros(capacity, dtype=np.int64)
+        ids[:self.size] = self.ids[:self.size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:self.size] = self.alive[:self.size]
+        nutrients = np.zeros((capacity, len(NUTRIENT_COLUMNS)), dtype=np.float64)
+        nutrients[:self.size] = self.nutrients[:self.size]
+        self.ids, self.alive, self.nutrients = ids, alive, nutrients
+        for column in self.columns.values():
+            column.grow(capacity)
+
+    def _upsert(self, row) -> None:
+        food_id = row["id"]
+        position = self.positions.get(food_id)
+        replace = position is not None
+        if position is None:
+            if self.size == len(self.ids):
+                self._grow()
+            position = self.size
+            self.size += 1
+            self.positions[food_id] = position
+            self.ids[position] = food_id
+            self.alive[position] = True
+
+        for name, column in self.columns.items():
+            column.assign(position, row[name], replace)
+        self.nutrients[position] = [row[name] for name in NUTRIENT_COLUMNS]
+        self.version += 1
+
+    def _delete(self, food_id: int) -> None:
+        position = self.positions.pop(food_id, None)
+        if position is not None:
+            self.alive[position] = False
+            for column in self.columns.values():
+                column.release(position)
+            self.version += 1
+
+    def row(self, position: int, fields: Optional[Sequence[str]] = None) -> dict:
+        """행 위치의 값을 응답 필드 딕셔너리로 복원합니다. fields가 있으면 해당 필드만 복원합니다."""
+        data = {}
+        for name in fields or RESPONSE_COLUMNS:
+            if name == "id":
+                data[name] = int(self.ids[position])
+            elif name in self.columns:
+                column = self.columns[name]
+                data[name] = column.values[column.codes[position]]
+            else:
+                data[name] = float(self.nutrients[position, NUTRIENT_INDEX[name]])
+        return data
+
+    def rows_by_keys(self, ids: List[int], food_cds: List[str]) -> tuple[Dict[int, dict], Dict[str, dict]]:
+        """ID와 식품코드로 행을 찾아 키별 딕셔너리로 반환합니다."""
+        by_id = {
+            food_id: self.row(self.positions[food_id])
+            for food_id in ids if food_id in self.positions
+        }
+        column = self.columns["food_cd"]
+        by_cd = {}
+        for food_cd in food_cds:
+            positions = column.rows.get(column.lookup.get(food_cd))
+            if positions:
+                by_cd[food_cd] = self.row(next(iter(positions)))
+        return by_id, by_cd
+
+    def search_positions(self, search_params: FoodSearchParams) -> np.ndarray:
+        """검색 조건에 맞는 행 위치 배열을 반환합니다.
+
+        부분 일치 조건은 n-gram 색인으로 후보 행을 구해 교집합하고,
+        나머지 조건은 후보 행에 대해서만 벡터화하여 평가합니다.
+        """
+        contains_filters = (
+            ("food_name", search_params.food_name),
+            ("maker_name", search_params.maker_name),
+            ("food_cd", search_params.food_code),
+        )
+        candidates = [
+            self.columns[name].positions_containing(query)
+            for name, query in contains_filters if query
+        ]
+        if candidates:
+            candidates.sort(key=len)
+            matched = set.intersection(*candidates)
+            positions = np.fromiter(matched, dtype=np.int64, count=len(matched))
+        else:
+            positions = np.flatnonzero(self.alive[:self.size])
+
+        if search_params.research_year:
+            column = self.columns["research_year"]
+            code = column.lookup.get(search_params.research_year)
+            if code is None:
+                return positions[:0]
+            positions = positions[column.codes[positions] == code]
+
+        for name, low, high in search_params.nutrient_ranges():
+            values = self.nutrients[positions, NUTRIENT_INDEX[name]]
+            mask = np.ones(len(positions), dtype=bool)
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+            positions = positions[mask]
+
+        return positions
+
+    def search(
+        self,
+        search_params: FoodSearchParams,
+        after_key: Optional[tuple] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> List[dict]:
+        """검색 조건에 맞는 식품을 sort/order 순(동률은 같은 방향의 ID 순)으로 최대 limit + 1개 반환합니다.
+
+        after_key는 decode_keyset_cursor가 복원한 (ID,) 또는 (정렬 값, ID) 튜플입니다.
+        limit보다 하나 더 반환하여 호출자가 다음 페이지 존재 여부를 판단할 수 있게 합니다.
+        """
+        positions = self.search_positions(search_params)
+        ids = self.ids[positions]
+        if search_params.sort == "id":
+            primary = ids
+        else:
+            primary = self.nutrients[positions, NUTRIENT_INDEX[search_params.sort]]
+        # 내림차순은 부호를 뒤집어 오름차순과 같은 방식으로 처리
+        sign = -1 if search_params.order == "desc" else 1
+        primary, secondary = primary * sign, ids * sign
+
+        if after_key is not None:
+            after_primary = after_key[0] * sign
+            after_secondary = after_key[-1] * sign
+            mask = (primary > after_primary) | ((primary == after_primary) & (secondary > after_secondary))
+            positions, primary, secondary = positions[mask], primary[mask], secondary[mask]
+
+        # 상위 N개만 필요하므로 전체 정렬 대신 부분 선택 후 후보(경계값 동률 포함)만 정렬
+        count = search_params.limit + 1
+        if len(positions) > count:
+            threshold = np.partition(primary, count - 1)[count - 1]
+            mask = primary <= threshold
+            positions, primary, secondary = positions[mask], primary[mask], secondary[mask]
+        order = np.lexsort((secondary, primary))[:count]
+        return [self.row(position, fields) for position in positions[order]]
+
+
+catalog = FoodCatalog()
+events.subscribe(catalog.on_changes)
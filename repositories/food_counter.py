@@ -0,0 +1,51 @@
+import os
+import time
+from typing import List, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.food import Food
+from repositories import events
+from repositories.events import FoodChange
+
+# 전체 개수를 데이터베이스에서 다시 집계하는 주기(초)
+COUNT_TTL_SECONDS = float(os.getenv("FOOD_COUNT_TTL_SECONDS", "60"))
+
+
+class FoodCounter:
+    """식품 전체 개수 캐시
+
+    커밋된 생성/삭제 내역으로 값을 증감하고, 다른 프로세스의 쓰기를 반영하기 위해
+    TTL이 지나면 데이터베이스에서 다시 집계합니다.
+    """
+
+    def __init__(self, ttl: float = COUNT_TTL_SECONDS):
+        self.ttl = ttl
+        self.value: Optional[int] = None
+        self.counted_at = 0.0
+
+    async def get(self, db: AsyncSession) -> int:
+        """캐시된 전체 개수를 반환합니다. 만료되었으면 다시 집계합니다."""
+        if self.value is None or time.monotonic() - self.counted_at > self.ttl:
+            result = await db.execute(select(func.count(Food.id)))
+            self.value = result.scalar()
+            self.counted_at = time.monotonic()
+        return self.value
+
+    def on_changes(self, changes: List[FoodChange], version: Optional[int] = None) -> None:
+        """커밋된 변경 내역으로 개수를 증감합니다."""
+        if self.value is None:
+            return
+        for change in changes:
+            if change.kind == "reset":
+                self.value = None
+                return
+            if change.kind == "upsert" and change.before is None:
+                self.value += 1
+            elif change.kind == "delete":
+                self.value -= 1
+
+
+food_counter = FoodCounter()
+events.subscribe(food_counter.on_changes)
@@ -1,10 +1,103 @@
-from typing import List, Optional
+import os
+from datetime import datetime
+from itertools import zip_longest
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
+from sqlalchemy import select, insert, update, delete, bindparam, and_, or_, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from models.food import Food
-from schemas.food import FoodCreate, FoodUpdate, FoodPartialUpdate, FoodSearchParams, PaginationParams
-from exceptions import FoodNotFoundError, FoodAlreadyExistsError, DatabaseError
+from models.food import Food, STRING_COLUMNS, NUTRIENT_COLUMNS, RESPONSE_COLUMNS, utcnow
+from schemas.food import FoodCreate, FoodUpdate, FoodPartialUpdate, FoodSearchParams, PaginationParams, NutritionItem
+from exceptions import (
+    FoodAPIException, FoodNotFoundError, FoodAlreadyExistsError, ValidationError,
+    DatabaseError, BatchOperationError
+)
+from repositories import events
+from repositories.food_catalog import catalog, CATALOG_ENABLED
+from repositories.food_counter import food_counter
+from repositories.food_similarity import similarity_index
+from repositories.food_stats import food_stats
+from repositories.catalog_version import get_catalog_version
+from models.catalog_state import CatalogState
+from pagination import encode_cursor, decode_cursor, decode_keyset_cursor, keyset_cursor
+
+
+def dialect_insert(dialect_name: str):
+    """ON CONFLICT 절을 지원하는 데이터베이스별 insert 구문을 반환합니다."""
+    if dialect_name == "postgresql":
+        return postgresql.insert(Food.__table__)
+    if dialect_name == "sqlite":
+        return sqlite.insert(Food.__table__)
+    raise DatabaseError(f"지원하지 않는 데이터베이스입니다: {dialect_name}")
+
+
+# IN 절 하나에 넣을 최대 값 개수 (SQLite 바인드 변수 제한 고려)
+IN_CLAUSE_CHUNK_SIZE = 500
+# 전체 내보내기 시 서버 측 커서에서 한 번에 읽는 행 수
+STREAM_CHUNK_SIZE = int(os.getenv("FOOD_EXPORT_CHUNK_SIZE", "1000"))
+
+
+def chunked(values: list, size: int = IN_CLAUSE_CHUNK_SIZE):
+    """리스트를 size개씩 나누어 순회합니다."""
+    for i in range(0, len(values), size):
+        yield values[i:i + size]
+
+
+def _response_rows_query(fields: Optional[Sequence[str]] = None):
+    """응답 필드(또는 fields에 지정한 필드)만 Core 행으로 조회하는 select 구문 (ORM 객체 생성 없음)"""
+    return select(*(getattr(Food, name) for name in fields or RESPONSE_COLUMNS))
+
+
+def project_rows(rows: List[dict], fields: Optional[Sequence[str]]) -> List[dict]:
+    """행 딕셔너리 목록에서 fields에 지정한 필드만 남깁니다. fields가 없으면 그대로 반환합니다."""
+    if fields is None:
+        return rows
+    return [{name: row[name] for name in fields} for row in rows]
+
+
+# 일괄 작업 결과: 입력 순서대로 성공한 행(dict) 또는 실패 원인(FoodAPIException)
+BatchOutcome = List[Union[dict, FoodAPIException]]
+
+
+def _search_conditions(search_params: FoodSearchParams) -> list:
+    """검색 파라미터의 문자열/영양성분 범위 조건을 WHERE 조건 목록으로 변환합니다. (정렬/커서 제외)
+
+    부분 일치 검색어의 %와 _는 인메모리 카탈로그와 같은 결과가 나오도록 LIKE 와일드카드가 아닌 문자 그대로 비교합니다.
+    """
+    conditions = []
+
+    if search_params.food_name:
+        conditions.append(Food.food_name.contains(search_params.food_name, autoescape=True))
+    
+    if search_params.research_year:
+        conditions.append(Food.research_year == search_params.research_year)
+    
+    if search_params.maker_name:
+        conditions.append(Food.maker_name.contains(search_params.maker_name, autoescape=True))
+    
+    if search_params.food_code:
+        conditions.append(Food.food_cd.contains(search_params.food_code, autoescape=True))
+
+    for name, low, high in search_params.nutrient_ranges():
+        column = getattr(Food, name)
+        if low is not None:
+            conditions.append(column >= low)
+        if high is not None:
+            conditions.append(column <= high)
+    return conditions
+
+
+def _raise_if_failed(outcomes: BatchOutcome) -> None:
+    """실패한 항목이 있으면 BatchOperationError를 발생시킵니다."""
+    errors = [
+        {"index": index, "code": outcome.error_code, "message": outcome.detail}
+        for index, outcome in enumerate(outcomes)
+        if isinstance(outcome, FoodAPIException)
+    ]
+    if errors:
+        raise BatchOperationError(errors)
 
 
 class FoodRepository:
@@ -20,6 +113,7 @@ class FoodRepository:
             self.db.add(db_food)
             await self.db.flush()
             await self.db.refresh(db_food)
+            events.record_upsert(self.db, db_food.to_dict())
             return db_food
         except IntegrityError:
             await self.db.rollback()
@@ -28,8 +122,350 @@ class FoodRepository:
             await self.db.rollback()
             raise DatabaseError(f"식품 생성 중 오류가 발생했습니다: {str(e)}")
 
-    async def get_by_id(self, food_id: int) -> Food:
-        """ID로 식품을 조회합니다."""
+    async def bulk_insert(self, records: List[dict]) -> int:
+        """여러 식품을 한 번의 executemany로 삽입합니다.
+
+        식품코드가 이미 존재하는 행은 건너뛰며, 실제로 삽입된 행 수를 반환합니다.
+        개별 행을 추적하지 않으므로 커밋 후 캐시는 전체 무효화됩니다.
+        """
+        if not records:
+            return 0
+        try:
+            stmt = dialect_insert(self.db.get_bind().dialect.name).on_conflict_do_nothing(
+                index_elements=[Food.__table__.c.food_cd]
+            )
+            result = await self.db.execute(stmt, records)
+            events.record_reset(self.db)
+            return result.rowcount
+        except DatabaseError:
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            raise DatabaseError(f"식품 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
+    async def get_rows(self) -> List[dict]:
+        """모든 식품의 응답 컬럼 값을 ORM 객체 없이 딕셔너리 목록으로 조회합니다."""
+        try:
+            columns = [Food.__table__.c[name] for name in RESPONSE_COLUMNS]
+            result = await self.db.execute(select(*columns).order_by(Food.id))
+            return [dict(row) for row in result.mappings()]
+        except Exception as e:
+            raise DatabaseError(f"식품 목록 조회 중 오류가 발생했습니다: {str(e)}")
+
+    async def upsert_many(self, records: List[dict], previous: Dict[str, dict]) -> None:
+        """식품코드 기준으로 여러 식품을 삽입하거나 수정합니다. (INSERT ... ON CONFLICT DO UPDATE)
+
+        previous는 식품코드별 변경 전 값으로, 변경 내역 기록에 사용됩니다.
+        """
+        if not records:
+            return
+        try:
+            table = Food.__table__
+            stmt = dialect_insert(self.db.get_bind().dialect.name)
+            update_columns = {
+                name: stmt.excluded[name]
+                for name in STRING_COLUMNS + NUTRIENT_COLUMNS if name != "food_cd"
+            }
+            update_columns["updated_at"] = utcnow()
+            stmt = stmt.on_conflict_do_update(index_elements=[table.c.food_cd], set_=update_columns)
+            await self.db.execute(stmt, records)
+
+            # 변경된 행을 다시 읽어 ID를 포함한 변경 내역 기록
+            columns = [table.c[name] for name in RESPONSE_COLUMNS]
+            food_cds = [record["food_cd"] for record in records]
+            for chunk in chunked(food_cds):
+                result = await self.db.execute(select(*columns).where(table.c.food_cd.in_(chunk)))
+                for row in result.mappings():
+                    events.record_upsert(self.db, dict(row), previous.get(row["food_cd"]))
+        except DatabaseError:
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            raise DatabaseError(f"식품 일괄 반영 중 오류가 발생했습니다: {str(e)}")
+
+    async def delete_many(self, rows: List[dict]) -> int:
+        """조회해 둔 식품 행들을 ID 기준으로 한꺼번에 삭제합니다."""
+        try:
+            table = Food.__table__
+            deleted = 0
+            for chunk in chunked(rows):
+                result = await self.db.execute(
+                    delete(table).where(table.c.id.in_([row["id"] for row in chunk]))
+                )
+                deleted += result.rowcount
+                for row in chunk:
+                    events.record_delete(self.db, row)
+            return deleted
+        except Exception as e:
+            await self.db.rollback()
+            raise DatabaseError(f"식품 일괄 삭제 중 오류가 발생했습니다: {str(e)}")
+
+    async def _rows_by(self, column, values: list) -> Dict[object, dict]:
+        """column 값 목록으로 식품 행을 IN 절로 조회하여 값별 딕셔너리로 반환합니다."""
+        table = Food.__table__
+        columns = [table.c[name] for name in RESPONSE_COLUMNS]
+        rows = {}
+        for chunk in chunked(list(dict.fromkeys(values))):
+            result = await self.db.execute(select(*columns).where(column.in_(chunk)))
+            for row in result.mappings():
+                rows[row[column.name]] = dict(row)
+        return rows
+
+    async def _rows_by_keys(self, ids: List[int], food_cds: List[str]) -> tuple[Dict[int, dict], Dict[str, dict]]:
+        """ID와 식품코드 목록으로 식품 행을 조회하여 키별 딕셔너리로 반환합니다.
+
+        ID와 식품코드 조건을 OR로 묶어 청크마다 한 번의 쿼리로 조회합니다.
+        """
+        try:
+            if CATALOG_ENABLED:
+                await catalog.ensure_fresh(self.db)
+                return catalog.rows_by_keys(ids, food_cds)
+
+            table = Food.__table__
+            columns = [table.c[name] for name in RESPONSE_COLUMNS]
+            ids = list(dict.fromkeys(ids))
+            food_cds = list(dict.fromkeys(food_cds))
+            id_set, cd_set = set(ids), set(food_cds)
+            by_id, by_cd = {}, {}
+            # 두 IN 절의 바인드 변수 합이 청크 크기를 넘지 않도록 절반씩 사용
+            size = IN_CLAUSE_CHUNK_SIZE // 2
+            for id_chunk, cd_chunk in zip_longest(chunked(ids, size), chunked(food_cds, size), fillvalue=[]):
+                conditions = []
+                if id_chunk:
+                    conditions.append(table.c.id.in_(id_chunk))
+                if cd_chunk:
+                    conditions.append(table.c.food_cd.in_(cd_chunk))
+                result = await self.db.execute(select(*columns).where(or_(*conditions)))
+                for row in result.mappings():
+                    row = dict(row)
+                    if row["id"] in id_set:
+                        by_id[row["id"]] = row
+                    if row["food_cd"] in cd_set:
+                        by_cd[row["food_cd"]] = row
+            return by_id, by_cd
+        except Exception as e:
+            raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
+
+    async def get_many(self, ids: List[int], food_cds: List[str]) -> tuple[List[dict], List[int], List[str]]:
+        """ID와 식품코드 목록으로 여러 식품을 한 번에 조회합니다.
+
+        요청한 순서대로 찾은 행 목록과, 찾지 못한 ID/식품코드 목록을 반환합니다.
+        """
+        by_id, by_cd = await self._rows_by_keys(ids, food_cds)
+
+        rows = [by_id[food_id] for food_id in ids if food_id in by_id]
+        rows += [by_cd[food_cd] for food_cd in food_cds if food_cd in by_cd]
+        missing_ids = [food_id for food_id in ids if food_id not in by_id]
+        missing_cds = [food_cd for food_cd in food_cds if food_cd not in by_cd]
+        return rows, missing_ids, missing_cds
+
+    async def aggregate_nutrition(self, items: List[NutritionItem]) -> tuple[List[dict], Dict[str, float]]:
+        """(식품, 섭취량) 목록의 항목별 영양성분과 합계를 계산합니다.
+
+        식품은 한 번에 조회하고, 1회 제공량 기준 배수 벡터와 영양성분 행렬의 곱으로 한 번에 계산합니다.
+        찾지 못한 식품이나 g 단위로 환산할 수 없는 1회 제공량이 있으면 항목별 오류와 함께 BatchOperationError를 발생시킵니다.
+        """
+        by_id, by_cd = await self._rows_by_keys(
+            [item.food_id for item in items if item.food_id is not None],
+            [item.food_cd for item in items if item.food_cd is not None]
+        )
+
+        rows: List[dict] = []
+        grams_per_serving: List[float] = []
+        errors = []
+        for index, item in enumerate(items):
+            row = by_id.get(item.food_id) if item.food_id is not None else by_cd.get(item.food_cd)
+            if row is None:
+                error = FoodNotFoundError(food_id=item.food_id, food_cd=item.food_cd)
+                errors.append({"index": index, "code": error.error_code, "message": error.detail})
+            elif item.unit == "g":
+                # 1회 제공량은 자유 형식 문자열이므로 양수 그램 수로 해석할 수 없으면 항목 오류
+                grams = float(pd.to_numeric(row["serving_size"], errors="coerce"))
+                if not grams > 0:
+                    error = ValidationError(
+                        f"1회 제공량 '{row['serving_size']}'을(를) 그램 수로 해석할 수 없어 g 단위로 합산할 수 없습니다."
+                    )
+                    errors.append({"index": index, "code": error.error_code, "message": error.detail})
+                grams_per_serving.append(grams)
+            else:
+                grams_per_serving.append(1.0)
+            rows.append(row)
+        if errors:
+            raise BatchOperationError(errors)
+
+        nutrients = np.array([[row[name] for name in NUTRIENT_COLUMNS] for row in rows], dtype=np.float64)
+        servings = np.array([
+            item.quantity if item.unit == "serving" else item.quantity / grams
+            for item, grams in zip(items, grams_per_serving)
+        ])
+        per_item = np.round(nutrients * servings[:, None], 4)
+        totals = np.round(per_item.sum(axis=0), 4)
+
+        results = [
+            {
+                "index": index,
+                "id": row["id"],
+                "food_cd": row["food_cd"],
+                "food_name": row["food_name"],
+                "servings": float(servings[index]),
+                "nutrients": dict(zip(NUTRIENT_COLUMNS, per_item[index].tolist())),
+            }
+            for index, row in enumerate(rows)
+        ]
+        return results, dict(zip(NUTRIENT_COLUMNS, totals.tolist()))
+
+    async def create_many(self, items: List[FoodCreate], atomic: bool = True) -> BatchOutcome:
+        """여러 식품을 하나의 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 생성합니다.
+
+        atomic이 참이면 하나라도 실패할 경우 전체를 롤백하고 BatchOperationError를 발생시키고,
+        거짓이면 성공한 항목만 반영한 뒤 항목별 결과를 반환합니다.
+        """
+        if not items:
+            return []
+        try:
+            table = Food.__table__
+            records = [item.model_dump() for item in items]
+            stmt = dialect_insert(self.db.get_bind().dialect.name).on_conflict_do_nothing(
+                index_elements=[table.c.food_cd]
+            ).returning(table.c.id, table.c.food_cd)
+            result = await self.db.execute(stmt, records)
+            created_ids = {row.food_cd: row.id for row in result}
+
+            outcomes: BatchOutcome = []
+            for record in records:
+                food_id = created_ids.pop(record["food_cd"], None)
+                if food_id is None:
+                    # 기존 식품코드 또는 요청 내 중복 식품코드
+                    outcomes.append(FoodAlreadyExistsError(record["food_cd"]))
+                else:
+                    outcomes.append({"id": food_id, **record})
+
+            if atomic:
+                try:
+                    _raise_if_failed(outcomes)
+                except BatchOperationError:
+                    await self.db.rollback()
+                    raise
+            for outcome in outcomes:
+                if isinstance(outcome, dict):
+                    events.record_upsert(self.db, outcome)
+            return outcomes
+        except (DatabaseError, BatchOperationError):
+            raise
+        except Exception as e:
+            await self.db.rollback()
+            raise DatabaseError(f"식품 일괄 생성 중 오류가 발생했습니다: {str(e)}")
+
+    async def update_many(self, items: List[tuple[int, FoodPartialUpdate]], atomic: bool = True) -> BatchOutcome:
+        """여러 식품을 부분 수정합니다.
+
+        대상 행과 식품코드 충돌은 IN 절로 한 번에 확인하고,
+        같은 필드 조합을 수정하는 항목끼리 묶어 executemany UPDATE로 반영합니다.
+        """
+        if not items:
+            return []
+        try:
+            table = Food.__table__
+            current = await self._rows_by(table.c.id, [food_id for food_id, _ in items])
+            updates = [data.model_dump(exclude_unset=True) for _, data in items]
+            new_cds = [
+                update_data["food_cd"] for (food_id, _), update_data in zip(items, updates)
+                if "food_cd" in update_data and food_id in current
+                and update_data["food_cd"] != current[food_id]["food_cd"]
+            ]
+            owners = await self._rows_by(table.c.food_cd, new_cds)
+
+            outcomes: BatchOutcome = []
+            seen_ids, claimed_cds = set(), set()
+            for (food_id, _), update_data in zip(items, updates):
+                before = current.get(food_id)
+                food_cd = update_data.get("food_cd")
+                if before is None:
+                    outcomes.append(FoodNotFoundError(food_id=food_id))
+                elif food_id in seen_ids:
+                    outcomes.append(ValidationError(f"ID {food_id}가 요청에 중복되어 있습니다."))
+                elif food_cd is not None and food_cd != before["food_cd"] and (
+                    food_cd in owners or food_cd in claimed_cds
+                ):
+                    outcomes.append(FoodAlreadyExistsError(food_cd))
+                else:
+                    seen_ids.add(food_id)
+                    if food_cd is not None:
+                        claimed_cds.add(food_cd)
+                    outcomes.append({**before, **update_data})
+
+            if atomic:
+                _raise_if_failed(outcomes)
+
+            # 수정하는 필드 조합별로 묶어서 executemany
+            groups: Dict[tuple, List[dict]] = {}
+            for outcome, update_data in zip(outcomes, updates):
+                if isinstance(outcome, dict) and update_data:
+                    groups.setdefault(tuple(sorted(update_data)), []).append(
+                        {"_id": outcome["id"], **{f"_{k}": v for k, v in update_data.items()}}
+                    )
+            for fields, params in groups.items():
+                stmt = (
+                    update(table)
+                    .where(table.c.id == bindparam("_id"))
+                    .values({**{field: bindparam(f"_{field}") for field in fields}, "updated_at": utcnow()})
+                )
+                await self.db.execute(stmt, params)
+
+            for outcome, (food_id, _) in zip(outcomes, items):
+                if isinstance(outcome, dict):
+                    events.record_upsert(self.db, outcome, current[food_id])
+            return outcomes
+        except (DatabaseError, BatchOperationError):
+            raise
+        except IntegrityError:
+            await self.db.rollback()
+            raise DatabaseError("식품코드 충돌로 일괄 수정에 실패했습니다.")
+        except Exception as e:
+            await self.db.rollback()
+            raise DatabaseError(f"식품 일괄 수정 중 오류가 발생했습니다: {str(e)}")
+
+    async def delete_many_by_ids(self, food_ids: List[int], atomic: bool = True) -> BatchOutcome:
+        """여러 식품을 ID 목록으로 한 번에 삭제합니다."""
+        if not food_ids:
+            return []
+        try:
+            current = await self._rows_by(Food.__table__.c.id, food_ids)
+        except Exception as e:
+            raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
+        outcomes: BatchOutcome = []
+        targets = []
+        for food_id in food_ids:
+            row = current.pop(food_id, None)
+            if row is None:
+                outcomes.append(FoodNotFoundError(food_id=food_id))
+            else:
+                outcomes.append(row)
+                targets.append(row)
+
+        if atomic:
+            _raise_if_failed(outcomes)
+        await self.delete_many(targets)
+        return outcomes
+
+    async def get_by_id(self, food_id: int, fields: Optional[Sequence[str]] = None) -> Union[Food, dict]:
+        """ID로 식품을 조회합니다.
+
+        fields가 지정되면 해당 컬럼만 조회하여 딕셔너리로 반환합니다.
+        """
+        if fields is None:
+            return await self._get_food(food_id)
+        try:
+            result = await self.db.execute(_response_rows_query(fields).where(Food.id == food_id))
+            row = result.mappings().first()
+        except Exception as e:
+            raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
+        if row is None:
+            raise FoodNotFoundError(food_id=food_id)
+        return dict(row)
+
+    async def _get_food(self, food_id: int) -> Food:
+        """ID로 세션에 연결된 식품 ORM 객체를 조회합니다. 쓰기 작업은 항상 이 메서드를 사용합니다."""
         try:
             result = await self.db.execute(select(Food).where(Food.id == food_id))
             food = result.scalar_one_or_none()
@@ -41,71 +477,225 @@ class FoodRepository:
         except Exception as e:
             raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
 
+    async def get_version(self) -> int:
+        """식품 테이블 버전을 조회합니다. 쓰기 트랜잭션이 커밋될 때마다 증가합니다."""
+        try:
+            return await get_catalog_version(self.db)
+        except Exception as e:
+            raise DatabaseError(f"식품 테이블 버전 조회 중 오류가 발생했습니다: {str(e)}")
+
+    async def get_validator(self, food_id: int) -> tuple[datetime, int]:
+        """ETag 생성을 위해 식품의 수정 시간만 조회합니다.
+
+        테이블 버전은 ETag에는 쓰지 않지만, 같은 요청의 캐시 확인에서 다시 조회하지 않도록 함께 반환합니다.
+        """
+        try:
+            version = (
+                select(CatalogState.version).where(CatalogState.id == 1).scalar_subquery()
+            )
+            result = await self.db.execute(
+                select(Food.updated_at, version).where(Food.id == food_id)
+            )
+            row = result.first()
+        except Exception as e:
+            raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
+        if row is None:
+            raise FoodNotFoundError(food_id=food_id)
+        return row[0], row[1] or 0
+
     async def get_by_food_cd(self, food_cd: str) -> Optional[Food]:
         """식품코드로 식품을 조회합니다."""
+        return await self._find_by_food_cd(food_cd)
+
+    async def _find_by_food_cd(self, food_cd: str) -> Optional[Food]:
+        """식품코드로 세션에 연결된 식품 ORM 객체를 조회합니다."""
         try:
             result = await self.db.execute(select(Food).where(Food.food_cd == food_cd))
             return result.scalar_one_or_none()
         except Exception as e:
             raise DatabaseError(f"식품 조회 중 오류가 발생했습니다: {str(e)}")
 
-    async def get_all(self, pagination: PaginationParams) -> tuple[List[Food], int]:
-        """모든 식품을 페이지네이션과 함께 조회합니다."""
+    async def get_all(
+        self,
+        pagination: PaginationParams,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[dict], int, Optional[str]]:
+        """모든 식품을 페이지네이션과 함께 조회합니다.
+
+        cursor가 지정되면 OFFSET 대신 ID 기준 키셋 페이지네이션을 사용합니다.
+        전체 개수는 매 요청마다 집계하지 않고 캐시된 값을 사용합니다.
+        ORM 객체 대신 응답 필드(fields 지정 시 해당 필드와 id)만 담은 딕셔너리 목록을 반환합니다.
+        """
+        after_id = decode_cursor(pagination.cursor)
         try:
-            # 전체 개수 조회
-            count_result = await self.db.execute(select(func.count(Food.id)))
-            total = count_result.scalar()
+            total = await food_counter.get(self.db)
 
-            # 페이지네이션된 데이터 조회
-            offset = (pagination.page - 1) * pagination.limit
-            result = await self.db.execute(
-                select(Food)
-                .offset(offset)
-                .limit(pagination.limit)
-                .order_by(Food.id)
-            )
-            foods = result.scalars().all()
+            query = _response_rows_query(fields).order_by(Food.id).limit(pagination.limit + 1)
+            if after_id is not None:
+                query = query.where(Food.id > after_id)
+            else:
+                query = query.offset((pagination.page - 1) * pagination.limit)
+            result = await self.db.execute(query)
+            foods = [dict(row) for row in result.mappings()]
+
+            next_cursor = None
+            if len(foods) > pagination.limit:
+                foods = foods[:pagination.limit]
+                next_cursor = encode_cursor(foods[-1]["id"])
             
-            return list(foods), total
+            return foods, total, next_cursor
         except Exception as e:
             raise DatabaseError(f"식품 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
-    async def search(self, search_params: FoodSearchParams) -> List[Food]:
-        """검색 조건에 따라 식품을 조회합니다."""
+    async def search(
+        self,
+        search_params: FoodSearchParams,
+        fields: Optional[Sequence[str]] = None
+    ) -> tuple[List[dict], Optional[str]]:
+        """검색 조건에 따라 식품을 조회합니다.
+
+        최대 limit개를 sort/order 순(동률은 같은 방향의 ID 순)으로 응답 필드 딕셔너리로 반환하며,
+        다음 항목이 있으면 (정렬 값, ID) 키셋 커서를 함께 반환합니다.
+        fields가 지정되면 해당 필드(와 id)만 조회합니다.
+        인메모리 카탈로그가 활성화된 경우 데이터베이스를 거치지 않습니다.
+        """
+        sort = search_params.sort
+        after_key = decode_keyset_cursor(search_params.cursor, sort)
+        # 다음 페이지 커서를 만들려면 정렬 컬럼 값이 필요
+        query_fields = fields
+        if fields is not None and sort not in fields:
+            query_fields = tuple(fields) + (sort,)
         try:
-            query = select(Food)
-            conditions = []
+            if CATALOG_ENABLED:
+                await catalog.ensure_fresh(self.db)
+                foods = catalog.search(search_params, after_key, query_fields)
+            else:
+                query = _response_rows_query(query_fields)
+                conditions = _search_conditions(search_params)
 
-            if search_params.food_name:
-                conditions.append(Food.food_name.contains(search_params.food_name))
-            
-            if search_params.research_year:
-                conditions.append(Food.research_year == search_params.research_year)
-            
-            if search_params.maker_name:
-                conditions.append(Food.maker_name.contains(search_params.maker_name))
-            
-            if search_params.food_code:
-                conditions.append(Food.food_cd.contains(search_params.food_code))
+                # (정렬 컬럼, id) 복합 인덱스를 따라 읽도록 키셋 조건과 정렬을 같은 컬럼 순서로 구성
+                key_columns = [Food.id] if sort == "id" else [getattr(Food, sort), Food.id]
+                descending = search_params.order == "desc"
+                if after_key is not None:
+                    key = tuple_(*key_columns) if len(key_columns) > 1 else key_columns[0]
+                    bound = after_key if len(after_key) > 1 else after_key[0]
+                    conditions.append(key < bound if descending else key > bound)
 
-            if conditions:
-                query = query.where(and_(*conditions))
+                if conditions:
+                    query = query.where(and_(*conditions))
 
-            query = query.order_by(Food.id)
-            result = await self.db.execute(query)
-            return list(result.scalars().all())
+                order_by = [column.desc() if descending else column for column in key_columns]
+                query = query.order_by(*order_by).limit(search_params.limit + 1)
+                result = await self.db.execute(query)
+                foods = [dict(row) for row in result.mappings()]
+
+            next_cursor = None
+            if len(foods) > search_params.limit:
+                foods = foods[:search_params.limit]
+                next_cursor = keyset_cursor(foods[-1], sort)
+            if query_fields is not fields:
+                foods = project_rows(foods, fields)
+            return foods, next_cursor
             
         except Exception as e:
             raise DatabaseError(f"식품 검색 중 오류가 발생했습니다: {str(e)}")
 
+    async def stream_rows(
+        self,
+        search_params: FoodSearchParams,
+        fields: Optional[Sequence[str]] = None,
+        chunk_size: int = STREAM_CHUNK_SIZE
+    ) -> AsyncIterator[List[dict]]:
+        """검색 조건에 맞는 식품 전체를 sort/order 순으로 chunk_size개씩 응답 필드 딕셔너리 목록으로 반환합니다.
+
+        limit/cursor는 무시하며, 서버 측 커서(yield_per)로 읽으므로 테이블 크기와 관계없이
+        한 번에 chunk_size개 행만 메모리에 올라옵니다. 인메모리 카탈로그는 사용하지 않습니다.
+        응답 헤더를 보낸 뒤에는 오류 응답으로 바꿀 수 없으므로 조회 오류는 감싸지 않고 그대로 발생시킵니다.
+        """
+        key_columns = [Food.id] if search_params.sort == "id" else [getattr(Food, search_params.sort), Food.id]
+        descending = search_params.order == "desc"
+        # ORM 행 처리를 거치지 않도록 테이블 컬럼으로 조회
+        table = Food.__table__
+        query = (
+            select(*(table.c[name] for name in fields or RESPONSE_COLUMNS))
+            .where(*_search_conditions(search_params))
+            .order_by(*(column.desc() if descending else column for column in key_columns))
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await self.db.stream(query)
+        try:
+            keys = list(result.keys())
+            async for partition in result.partitions():
+                yield [dict(zip(keys, row)) for row in partition]
+        finally:
+            await result.close()
+
+    async def find_similar(self, food_id: int, k: int, same_group: bool = False) -> List[Tuple[dict, float]]:
+        """영양성분 프로파일이 가장 비슷한 식품 k개를 (식품, 거리) 목록으로 반환합니다. 자기 자신은 제외합니다."""
+        await self._ensure_similarity_index()
+        position = catalog.positions.get(food_id)
+        if position is None:
+            raise FoodNotFoundError(food_id=food_id)
+        target = catalog.row(position)
+        vector, columns = similarity_index.standardize({name: target[name] for name in NUTRIENT_COLUMNS})
+        group_name = target["group_name"] if same_group else None
+        neighbors = similarity_index.nearest(catalog, vector, columns, k, group_name, exclude_position=position)
+        return [(catalog.row(neighbor), distance) for neighbor, distance in neighbors]
+
+    async def find_similar_to_profile(
+        self,
+        nutrients: Dict[str, float],
+        k: int,
+        group_name: Optional[str] = None
+    ) -> List[Tuple[dict, float]]:
+        """목표 영양성분 값에 가장 가까운 식품 k개를 (식품, 거리) 목록으로 반환합니다."""
+        await self._ensure_similarity_index()
+        vector, columns = similarity_index.standardize(nutrients)
+        neighbors = similarity_index.nearest(catalog, vector, columns, k, group_name)
+        return [(catalog.row(neighbor), distance) for neighbor, distance in neighbors]
+
+    async def _ensure_similarity_index(self) -> None:
+        # 유사도 검색은 FOOD_CATALOG_ENABLED와 관계없이 인메모리 카탈로그를 사용
+        try:
+            await catalog.ensure_fresh(self.db)
+        except Exception as e:
+            raise DatabaseError(f"식품 카탈로그 적재 중 오류가 발생했습니다: {str(e)}")
+        similarity_index.refresh(catalog)
+
+    async def get_group_stats(self, group_by: str, group: Optional[str] = None) -> List[dict]:
+        """그룹별 영양성분 통계를 반환합니다. 요청마다 집계하지 않고 미리 집계된 요약을 사용합니다."""
+        await self._ensure_stats()
+        return food_stats.group_stats(group_by, group)
+
+    async def get_percentile_ranks(self, food_id: int, group_by: str) -> tuple[str, int, Dict[str, float]]:
+        """식품이 속한 그룹에서의 영양성분별 백분위 순위를 반환합니다."""
+        food = await self.get_by_id(food_id)
+        await self._ensure_stats()
+        row = {name: getattr(food, name) for name in (group_by,) + NUTRIENT_COLUMNS}
+        ranks = food_stats.percentile_ranks(group_by, row)
+        if ranks is None:
+            # 요약에 그룹이 없으면 다시 집계한 뒤 한 번 더 조회하고, 그래도 없으면 그사이 삭제된 식품
+            await self._ensure_stats()
+            ranks = food_stats.percentile_ranks(group_by, row)
+            if ranks is None:
+                raise FoodNotFoundError(food_id=food_id)
+        return ranks
+
+    async def _ensure_stats(self) -> None:
+        try:
+            await food_stats.ensure_fresh(self.db)
+        except Exception as e:
+            raise DatabaseError(f"식품 통계 집계 중 오류가 발생했습니다: {str(e)}")
+
     async def update(self, food_id: int, food_data: FoodUpdate) -> Food:
         """식품 정보를 전체 수정합니다."""
         try:
-            food = await self.get_by_id(food_id)
+            food = await self._get_food(food_id)
+            before = food.to_dict()
             
             # 식품코드 중복 확인 (다른 식품이 같은 코드를 사용하는지)
             if food_data.food_cd != food.food_cd:
-                existing_food = await self.get_by_food_cd(food_data.food_cd)
+                existing_food = await self._find_by_food_cd(food_data.food_cd)
                 if existing_food and existing_food.id != food_id:
                     raise FoodAlreadyExistsError(food_data.food_cd)
 
@@ -115,6 +705,7 @@ class FoodRepository:
 
             await self.db.flush()
             await self.db.refresh(food)
+            events.record_upsert(self.db, food.to_dict(), before)
             return food
             
         except (FoodNotFoundError, FoodAlreadyExistsError):
@@ -126,14 +717,15 @@ class FoodRepository:
     async def partial_update(self, food_id: int, food_data: FoodPartialUpdate) -> Food:
         """식품 정보를 부분 수정합니다."""
         try:
-            food = await self.get_by_id(food_id)
+            food = await self._get_food(food_id)
+            before = food.to_dict()
             
             # 수정할 데이터만 추출 (None이 아닌 값들만)
             update_data = food_data.model_dump(exclude_unset=True)
             
             # 식품코드 중복 확인
             if 'food_cd' in update_data and update_data['food_cd'] != food.food_cd:
-                existing_food = await self.get_by_food_cd(update_data['food_cd'])
+                existing_food = await self._find_by_food_cd(update_data['food_cd'])
                 if existing_food and existing_food.id != food_id:
                     raise FoodAlreadyExistsError(update_data['food_cd'])
 
@@ -143,6 +735,7 @@ class FoodRepository:
 
             await self.db.flush()
             await self.db.refresh(food)
+            events.record_upsert(self.db, food.to_dict(), before)
             return food
             
         except (FoodNotFoundError, FoodAlreadyExistsError):
@@ -154,9 +747,11 @@ class FoodRepository:
     async def delete(self, food_id: int) -> None:
         """식품을 삭제합니다."""
         try:
-            food = await self.get_by_id(food_id)
+            food = await self._get_food(food_id)
+            before = food.to_dict()
             await self.db.delete(food)
             await self.db.flush()
+            events.record_delete(self.db, before)
             
         except FoodNotFoundError:
             raise
@@ -0,0 +1,90 @@
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.food import NUTRIENT_COLUMNS
+from repositories.food_catalog import FoodCatalog, NUTRIENT_INDEX
+
+
+class NutrientSimilarityIndex:
+    """영양성분 프로파일 유사도 색인
+
+    카탈로그의 영양성분 행렬을 컬럼별로 표준화(z-score)한 float32 행렬로 보관하고,
+    질의 벡터와의 거리를 벡터 연산으로 한 번에 계산하여 가장 가까운 k개를 찾습니다.
+    카탈로그 내용이 바뀌면(쓰기 반영, 재적재) 다음 질의에서 다시 계산합니다.
+    """
+
+    def __init__(self):
+        self._catalog_version: Optional[int] = None
+        self.positions = np.zeros(0, dtype=np.int64)
+        self.rows = np.zeros(0, dtype=np.int64)
+        self.matrix = np.zeros((0, len(NUTRIENT_COLUMNS)), dtype=np.float32)
+        self.mean = np.zeros(len(NUTRIENT_COLUMNS))
+        self.std = np.ones(len(NUTRIENT_COLUMNS))
+
+    def refresh(self, catalog: FoodCatalog) -> None:
+        """카탈로그가 바뀌었으면 표준화 행렬을 다시 계산합니다."""
+        if self._catalog_version == catalog.version:
+            return
+        positions = np.flatnonzero(catalog.alive[:catalog.size])
+        values = catalog.nutrients[positions]
+        if len(positions):
+            mean = values.mean(axis=0)
+            std = values.std(axis=0)
+            std[std == 0] = 1.0
+        else:
+            mean = np.zeros(len(NUTRIENT_COLUMNS))
+            std = np.ones(len(NUTRIENT_COLUMNS))
+
+        self.positions = positions
+        # 카탈로그 행 위치 -> 행렬 행 번호 (삭제된 위치는 -1)
+        self.rows = np.full(catalog.size, -1, dtype=np.int64)
+        self.rows[positions] = np.arange(len(positions))
+        self.matrix = ((values - mean) / std).astype(np.float32)
+        self.mean, self.std = mean, std
+        self._catalog_version = catalog.version
+
+    def standardize(self, nutrients: Dict[str, float]) -> Tuple[np.ndarray, np.ndarray]:
+        """영양성분 값을 (표준화된 벡터, 사용할 컬럼 번호)로 변환합니다. 지정된 컬럼만 거리 계산에 사용합니다."""
+        columns = np.array(sorted(NUTRIENT_INDEX[name] for name in nutrients), dtype=np.int64)
+        vector = np.zeros(len(NUTRIENT_COLUMNS), dtype=np.float32)
+        for name, value in nutrients.items():
+            index = NUTRIENT_INDEX[name]
+            vector[index] = (value - self.mean[index]) / self.std[index]
+        return vector, columns
+
+    def nearest(
+        self,
+        catalog: FoodCatalog,
+        vector: np.ndarray,
+        columns: np.ndarray,
+        k: int,
+        group_name: Optional[str] = None,
+        exclude_position: Optional[int] = None
+    ) -> List[Tuple[int, float]]:
+        """표준화된 벡터에 가장 가까운 k개의 (카탈로그 행 위치, 거리)를 가까운 순으로 반환합니다.
+
+        거리는 사용한 컬럼 수로 나눈 평균 제곱 z-score 차이의 제곱근입니다.
+        """
+        diff = self.matrix[:, columns] - vector[columns]
+        distances = np.einsum("ij,ij->i", diff, diff) / len(columns)
+
+        candidates = np.ones(len(self.positions), dtype=bool)
+        if group_name is not None:
+            column = catalog.columns["group_name"]
+            code = column.lookup.get(group_name)
+            if code is None:
+                return []
+            candidates &= column.codes[self.positions] == code
+        if exclude_position is not None and self.rows[exclude_position] >= 0:
+            candidates[self.rows[exclude_position]] = False
+
+        rows = np.flatnonzero(candidates)
+        if len(rows) > k:
+            rows = rows[np.argpartition(distances[rows], k - 1)[:k]]
+        ids = catalog.ids[self.positions[rows]]
+        rows = rows[np.lexsort((ids, distances[rows]))]
+        return [(int(self.positions[row]), float(np.sqrt(distances[row]))) for row in rows]
+
+
+similarity_index = NutrientSimilarityIndex()
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.food import Food, NUTRIENT_COLUMNS
+from repositories import events
+from repositories.events import FoodChange
+from repositories.catalog_version import get_catalog_version, read_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 통계를 집계하는 그룹 기준 컬럼
+GROUP_BY_COLUMNS = ("group_name", "research_year", "maker_name")
+
+# 그룹 통계에 포함하는 백분위수
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값 목록의 q 백분위수를 선형 보간으로 계산합니다. (numpy.percentile 기본 방식과 동일)"""
+    index = (len(values) - 1) * q / 100
+    low = math.floor(index)
+    high = math.ceil(index)
+    return values[low] + (values[high] - values[low]) * (index - low)
+
+
+class GroupSummary:
+    """그룹 하나의 영양성분별 정렬된 값 목록과 합계
+
+    값 목록을 정렬 상태로 유지하므로 최소/최대/백분위수는 인덱스로 바로 구하고,
+    변경 반영 시 행 추가/삭제는 이분 탐색으로 해당 값만 넣고 뺍니다.
+    전체 집계 시에는 append()로 모두 추가한 뒤 sort()로 한 번만 정렬합니다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sums = [0.0] * len(NUTRIENT_COLUMNS)
+        self.values: List[List[float]] = [[] for _ in NUTRIENT_COLUMNS]
+        self._stats: Optional[dict] = None
+
+    def add(self, row: dict) -> None:
+        self.count += 1
+        for index, name in enumerate(NUTRIENT_COLUMNS):
+            insort(self.values[index], row[name])
+            self.sums[index] += row[name]
+        self._stats = None
+
+    def append(self, row) -> None:
+        """정렬 상태를 유지하지 않고 값을 추가합니다. 모두 추가한 뒤 sort()를 호출해야 합니다."""
+        self.count += 1
+        for index, name in enumerate(NUTRIENT_COLUMNS):
+            self.values[index].append(row[name])
+            self.sums[index] += row[name]
+        self._stats = None
+
+    def sort(self) -> None:
+        for values in self.values:
+            values.sort()
+
+    def remove(self, row: dict) -> None:
+        """행의 값을 뺍니다. 요약에 없는 값이면 아무것도 바꾸지 않고 KeyError를 발생시킵니다."""
+        positions = []
+        for index, name in enumerate(NUTRIENT_COLUMNS):
+            values = self.values[index]
+            position = bisect_left(values, row[name])
+            if position == len(values) or values[position] != row[name]:
+                raise KeyError(name)
+            positions.append(position)
+        self.count -= 1
+        for index, name in enumerate(NUTRIENT_COLUMNS):
+            del self.values[index][positions[index]]
+            self.sums[index] -= row[name]
+        self._stats = None
+
+    def stats(self) -> dict:
+        """영양성분별 평균/최소/최대/백분위수를 반환합니다. 변경이 없으면 이전 계산 결과를 재사용합니다."""
+        if self._stats is None:
+            nutrients = {}
+            for index, name in enumerate(NUTRIENT_COLUMNS):
+                values = self.values[index]
+                nutrients[name] = {
+                    "mean": self.sums[index] / self.count,
+                    "min": values[0],
+                    "max": values[-1],
+                    **{f"p{q}": percentile(values, q) for q in PERCENTILES},
+                }
+            self._stats = {"count": self.count, "nutrients": nutrients}
+        return self._stats
+
+    def percentile_rank(self, name: str, value: float) -> float:
+        """그룹 안에서 value의 백분위 순위(0~100)를 반환합니다. 같은 값은 절반만 아래로 셉니다."""
+        values = self.values[NUTRIENT_COLUMNS.index(name)]
+        below = bisect_left(values, value)
+        equal = bisect_right(values, value) - below
+        return (below + equal / 2) / len(values) * 100
+
+
+class FoodStatistics:
+    """그룹별 영양성분 통계 요약
+
+    시작 시(첫 조회 시) 한 번 전체를 집계하고, 이후에는 커밋된 변경 내역으로 해당 그룹만 갱신합니다.
+    다른 프로세스의 쓰기로 데이터베이스 테이블 버전이 앞서가면 다음 조회 시 다시 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._loading = False
+        self._buffered: List[tuple] = []
+        self.groups: Dict[str, Dict[str, GroupSummary]] = {column: {} for column in GROUP_BY_COLUMNS}
+        self.db_version: Optional[int] = None
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        """집계되지 않았거나 데이터베이스 버전과 다르면 다시 집계합니다."""
+        db_version = await get_catalog_version(db)
+        if self._loaded and self.db_version == db_version:
+            return
+        async with self._lock:
+            if not self._loaded or self.db_version != db_version:
+                await self.load(db)
+
+    async def load(self, db: AsyncSession) -> None:
+        """식품 테이블 전체를 읽어 그룹별 요약을 만듭니다.
+
+        버전과 행은 하나의 읽기 트랜잭션에서 읽으므로, 집계 도중 도착한 변경 내역 중
+        읽은 버전 이하(이미 행에 포함된 변경)는 건너뛰고 그 이후의 변경만 반영합니다.
+        """
+        self._loading = True
+        try:
+            columns = [getattr(Food, name) for name in GROUP_BY_COLUMNS + NUTRIENT_COLUMNS]
+            async with read_snapshot(db) as conn:
+                db_version = await get_catalog_version(conn)
+                rows = (await conn.execute(select(*columns))).mappings().all()
+
+            # 행마다 insort하면 그룹 크기에 비례해 느려지므로 모두 추가한 뒤 값 목록마다 한 번씩 정렬
+            self.groups = {column: {} for column in GROUP_BY_COLUMNS}
+            for row in rows:
+                for summary in self._summaries(row):
+                    summary.append(row)
+            for summaries in self.groups.values():
+                for summary in summaries.values():
+                    summary.sort()
+            self.db_version = db_version
+            self._loaded = True
+
+            # 집계 도중 커밋된 변경 내역 반영 (_apply가 이미 포함된 버전은 건너뜀)
+            buffered, self._buffered = self._buffered, []
+            for changes, version in buffered:
+                self._apply(changes, version)
+            logger.info("식품 그룹 통계를 집계했습니다.")
+        finally:
+            self._loading = False
+
+    def on_changes(self, changes: List[FoodChange], version: Optional[int] = None) -> None:
+        """커밋된 변경 내역을 통계에 반영합니다."""
+        if self._loading:
+            self._buffered.append((changes, version))
+            return
+        if self._loaded:
+            self._apply(changes, version)
+
+    def _apply(self, changes: List[FoodChange], version: Optional[int]) -> None:
+        if version is not None and self.db_version is not None and version <= self.db_version:
+            # 집계한 스냅샷에 이미 포함된 변경
+            return
+        try:
+            for change in changes:
+                if change.kind == "reset":
+                    self._loaded = False
+                    return
+                if change.before is not None:
+                    self._remove(change.before)
+                if change.after is not None:
+                    self._add(change.after)
+        except KeyError:
+            # 요약에 없는 값을 지우려 한 경우 요약이 어긋난 것이므로 다음 조회 시 다시 집계
+            self._loaded = False
+            return
+
+        # 바로 다음 버전일 때만 최신으로 간주 (건너뛴 버전은 다른 프로세스의 쓰기)
+        if version is not None and self.db_version is not None and version == self.db_version + 1:
+            self.db_version = version
+
+    def _summaries(self, row) -> List[GroupSummary]:
+        """행이 속한 그룹 기준별 요약을 반환합니다. 없는 그룹은 새로 만듭니다."""
+        summaries = []
+        for column in GROUP_BY_COLUMNS:
+            summary = self.groups[column].get(row[column])
+            if summary is None:
+                summary = self.groups[column][row[column]] = GroupSummary()
+            summaries.append(summary)
+        return summaries
+
+    def _add(self, row) -> None:
+        for summary in self._summaries(row):
+            summary.add(row)
+
+    def _remove(self, row) -> None:
+        for column in GROUP_BY_COLUMNS:
+            summary = self.groups[column][row[column]]
+            summary.remove(row)
+            if summary.count == 0:
+                del self.groups[column][row[column]]
+
+    def group_stats(self, group_by: str, group: Optional[str] = None) -> List[dict]:
+        """그룹별 통계 목록을 그룹 이름 순으로 반환합니다. group을 지정하면 해당 그룹만 반환합니다."""
+        summaries = self.groups[group_by]
+        keys = [group] if group is not None else sorted(summaries)
+        return [
+            {"group": key, **summaries[key].stats()}
+            for key in keys if key in summaries
+        ]
+
+    def percentile_ranks(self, group_by: str, row: dict) -> Optional[tuple[str, int, Dict[str, float]]]:
+        """식품이 속한 그룹에서의 영양성분별 백분위 순위를 (그룹, 그룹 크기, 순위)로 반환합니다.
+
+        식품을 조회한 뒤 통계에 반영되기 전에 바뀐 경우처럼 그룹이 요약에 없으면
+        요약이 어긋난 것이므로 다음 조회 시 다시 집계하도록 표시하고 None을 반환합니다.
+        """
+        key = row[group_by]
+        summary = self.groups[group_by].get(key)
+        if summary is None:
+            self._loaded = False
+            return None
+        ranks = {name: summary.percentile_rank(name, row[name]) for name in NUTRIENT_COLUMNS}
+        return key, summary.count, ranks
+
+
+food_stats = FoodStatistics()
+events.subscribe(food_stats.on_changes)
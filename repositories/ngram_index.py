@@ -0,0 +1,65 @@
+from collections import defaultdict
+from typing import Dict, Iterator, Optional, Set
+
+
+def iter_ngrams(text: str, max_n: int) -> Iterator[str]:
+    """text의 1글자부터 max_n글자까지의 모든 부분 문자열을 순회합니다."""
+    length = len(text)
+    for n in range(1, max_n + 1):
+        for start in range(length - n + 1):
+            yield text[start:start + n]
+
+
+class NgramIndex:
+    """문자 n-gram 역색인
+
+    문서(문자열 id)마다 1~max_n글자 n-gram을 색인합니다.
+    max_n글자 이하 질의는 포스팅 리스트 자체가 정답이고,
+    더 긴 질의는 max_n-gram 포스팅을 교집합한 뒤 후보만 원문과 대조합니다.
+    """
+
+    def __init__(self, max_n: int = 3):
+        self.max_n = max_n
+        self.postings: Dict[str, Set[int]] = defaultdict(set)
+        self.texts: Dict[int, str] = {}
+
+    def add(self, doc_id: int, text: str) -> None:
+        """문서를 색인에 추가합니다."""
+        text = text.lower()
+        self.texts[doc_id] = text
+        for gram in set(iter_ngrams(text, self.max_n)):
+            self.postings[gram].add(doc_id)
+
+    def remove(self, doc_id: int) -> None:
+        """문서를 색인에서 제거합니다."""
+        text = self.texts.pop(doc_id, None)
+        if text is None:
+            return
+        for gram in set(iter_ngrams(text, self.max_n)):
+            posting = self.postings.get(gram)
+            if posting is not None:
+                posting.discard(doc_id)
+                if not posting:
+                    del self.postings[gram]
+
+    def search(self, query: str) -> Set[int]:
+        """query를 부분 문자열로 포함하는 문서 id 집합을 반환합니다. (대소문자 무시)"""
+        query = query.lower()
+        if len(query) <= self.max_n:
+            return set(self.postings.get(query, ()))
+
+        grams = sorted(
+            {query[i:i + self.max_n] for i in range(len(query) - self.max_n + 1)},
+            key=lambda gram: len(self.postings.get(gram, ()))
+        )
+        candidates: Optional[Set[int]] = None
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            candidates = set(posting) if candidates is None else candidates & posting
+            if not candidates:
+                return set()
+
+        # 최종 후보만 원문과 대조
+        return {doc_id for doc_id in candidates if query in self.texts[doc_id]}
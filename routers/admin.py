@@ -0,0 +1,66 @@
+from fastapi import APIRouter, Depends, Path, Query, status
+from fastapi.responses import Response
+from dependencies import require_admin_token
+from exceptions import ProfileNotFoundError
+from profiling import profile_store, PROFILING_ENABLED
+from schemas.admin import ProfileSummary, SlowQueryReport
+from schemas.food import ApiListResponse, ApiResponse
+from serialization import dumps
+from slow_query import slow_query_log, SLOW_QUERY_ENABLED
+
+router = APIRouter(prefix="/v1/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
+
+
+@router.get("/slow-queries", response_model=ApiResponse[SlowQueryReport])
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=100, description="반환할 쿼리 형태 수"),
+    order_by: str = Query("total_ms", pattern="^(total_ms|max_ms|count|slow_count)$", description="정렬 기준 (내림차순)")
+):
+    """
+    정규화된 쿼리 형태를 누적 실행 시간(기본) 순으로 조회합니다.
+    임계값을 넘은 형태는 호출한 리포지토리 메서드, 가장 느렸던 파라미터, 실행 계획을 함께 반환합니다.
+    X-Admin-Token 헤더가 필요합니다.
+    """
+    return ApiResponse(data=SlowQueryReport(
+        enabled=SLOW_QUERY_ENABLED,
+        threshold_ms=slow_query_log.threshold_ms,
+        shape_count=len(slow_query_log.shapes),
+        shapes=slow_query_log.top(limit, order_by)
+    ))
+
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_slow_queries():
+    """
+    쿼리 형태별 집계를 초기화합니다. X-Admin-Token 헤더가 필요합니다.
+    """
+    slow_query_log.reset()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/profiles", response_model=ApiListResponse[ProfileSummary], include_in_schema=PROFILING_ENABLED)
+async def list_profiles():
+    """
+    최근 요청 프로파일 목록을 최신순으로 조회합니다. (PROFILING_ENABLED일 때
+    X-Profile: 1 헤더를 붙인 /v1/foods 요청이 기록됨)
+    분류별 시간(SQL, ORM 객체 생성, Pydantic 검증, JSON 인코딩 등)을 함께 반환합니다.
+    X-Admin-Token 헤더가 필요합니다.
+    """
+    profiles = profile_store.list()
+    return ApiListResponse(data=profiles, count=len(profiles))
+
+
+@router.get("/profiles/{profile_id}", include_in_schema=PROFILING_ENABLED)
+async def download_profile(profile_id: int = Path(..., ge=1, description="응답의 X-Profile-Id 값")):
+    """
+    프로파일을 speedscope 파일로 내려받습니다. https://www.speedscope.app 에서 열 수 있습니다.
+    X-Admin-Token 헤더가 필요합니다.
+    """
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise ProfileNotFoundError(profile_id)
+    return Response(
+        content=dumps(profile.to_speedscope()),
+        media_type="application/json",
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.speedscope.json"'}
+    )
@@ -1,88 +1,453 @@
-from typing import List
-from fastapi import APIRouter, Depends, status, Query
-from fastapi.responses import Response
-from repositories.food_repository import FoodRepository
+import inspect
+import logging
+from typing import List, Optional
+from fastapi import APIRouter, Body, Depends, Request, status, Query
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
+from repositories.food_repository import FoodRepository, BatchOutcome
+from repositories.food_stats import GROUP_BY_COLUMNS
 from schemas.food import (
     FoodCreate, FoodUpdate, FoodPartialUpdate, FoodResponse,
-    FoodSearchParams, PaginationParams, PaginatedResponse,
-    ApiResponse, ApiListResponse, PaginationInfo
+    FoodSearchParams, PaginationParams, PaginatedResponse, nutrient_range_fields,
+    ApiResponse, ApiListResponse,
+    FoodBatchUpdateItem, BatchItemResult, BatchResponse, ErrorDetail,
+    FoodLookupRequest, LookupResponse, LookupMissing,
+    SimilarFoodResponse, NutrientProfileQuery,
+    GroupStatsResponse, FoodPercentileResponse,
+    NutritionAggregateRequest, NutritionAggregateResponse
+)
+from dependencies import get_food_repository, get_read_food_repository
+from admission import admission
+from exceptions import FoodAPIException, ValidationError, DatabaseError
+from serialization import FastJSONResponse
+from export import export_foods, EXPORT_FORMATS, WRITERS
+from http_cache import (
+    CACHE_CONTROL, item_etag, collection_etag, etag_matches, not_modified, set_validators
 )
-from dependencies import get_food_repository
 import math
+import os
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/foods", tags=["foods"])
 
+# 우선순위 등급별 동시 처리 제한 (비싼 요청이 몰려도 가벼운 요청은 별도 제한으로 처리)
+ADMIT_CHEAP = [Depends(admission("cheap"))]
+ADMIT_EXPENSIVE = [Depends(admission("expensive"))]
+ADMIT_EXPORT = [Depends(admission("export"))]
+
+# 일괄 작업 요청당 최대 항목 수
+MAX_BATCH_ITEMS = int(os.getenv("FOOD_BATCH_MAX_ITEMS", "5000"))
+
+
+def _check_batch_size(items: list) -> None:
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ValidationError(f"일괄 작업은 한 번에 최대 {MAX_BATCH_ITEMS}개까지 처리할 수 있습니다.")
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[tuple]:
+    """?fields= 값을 검증하여 조회할 필드 튜플로 변환합니다. id는 항상 포함됩니다."""
+    if not fields:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(requested - set(FoodResponse.model_fields))
+    if unknown:
+        raise ValidationError(f"알 수 없는 필드입니다: {', '.join(unknown)}")
+    return ("id",) + tuple(name for name in FoodResponse.model_fields if name in requested and name != "id")
+
+
+def nutrient_range_params(**ranges: Optional[float]) -> dict:
+    """영양성분 범위 검색 쿼리 파라미터 (경계값 포함). 지정된 값만 딕셔너리로 반환합니다."""
+    return {name: value for name, value in ranges.items() if value is not None}
+
+
+# 쿼리 파라미터는 FoodSearchParams의 범위 필드와 같은 정의(nutrient_range_fields)로 생성
+nutrient_range_params.__signature__ = inspect.Signature([
+    inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=query, annotation=float)
+    for name, query in nutrient_range_fields(Query).items()
+])
+
+
+def _similar_response(neighbors: list) -> ApiListResponse[SimilarFoodResponse]:
+    """(식품, 거리) 목록을 유사 식품 응답으로 변환합니다."""
+    data = [SimilarFoodResponse(**row, distance=distance) for row, distance in neighbors]
+    return ApiListResponse[SimilarFoodResponse](data=data, count=len(data))
 
-@router.get("/search", response_model=ApiListResponse[FoodResponse])
+
+def _batch_response(outcomes: BatchOutcome, success_status: str, with_data: bool = True) -> BatchResponse[FoodResponse]:
+    """항목별 결과를 일괄 작업 응답으로 변환합니다."""
+    results = []
+    for index, outcome in enumerate(outcomes):
+        if isinstance(outcome, FoodAPIException):
+            results.append(BatchItemResult[FoodResponse](
+                index=index,
+                status="error",
+                error=ErrorDetail(code=outcome.error_code, message=outcome.detail)
+            ))
+        else:
+            results.append(BatchItemResult[FoodResponse](
+                index=index,
+                status=success_status,
+                id=outcome["id"],
+                data=FoodResponse.model_validate(outcome) if with_data else None
+            ))
+    failed = sum(1 for result in results if result.status == "error")
+    return BatchResponse[FoodResponse](
+        status="success" if failed == 0 else "partial",
+        results=results,
+        succeeded=len(results) - failed,
+        failed=failed
+    )
+
+
+@router.get("/search", response_model=ApiListResponse[FoodResponse], dependencies=ADMIT_EXPENSIVE)
 async def search_foods(
+    request: Request,
     food_name: str = Query(None, description="식품이름 (부분 일치 검색)"),
     research_year: str = Query(None, pattern=r'^\d{4}$', description="연도(YYYY)"),
     maker_name: str = Query(None, description="지역/제조사"),
     food_code: str = Query(None, description="식품코드"),
-    food_repo: FoodRepository = Depends(get_food_repository)
+    limit: int = Query(100, ge=1, le=1000, description="최대 항목 수"),
+    sort: str = Query("id", description="정렬 기준 (id 또는 영양성분 컬럼명, 예: calorie)"),
+    order: str = Query("asc", pattern=r'^(asc|desc)$', description="정렬 방향 (asc/desc)"),
+    cursor: str = Query(None, description="이전 응답의 nextCursor"),
+    fields: str = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: food_name,calorie). id는 항상 포함"),
+    nutrient_ranges: dict = Depends(nutrient_range_params),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
 ):
     """
     식품 정보를 검색 조건에 따라 조회합니다.
+    영양성분 범위(예: salt_max=300&protein_min=20)로 거르고 sort/order로 정렬할 수 있으며,
+    결과가 limit개를 넘으면 nextCursor로 같은 정렬 순서의 다음 결과를 이어서 조회할 수 있습니다.
     """
+    selected_fields = _parse_fields(fields)
+    etag = collection_etag(await food_repo.get_version(), request)
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL["food_search"])
+    
     search_params = FoodSearchParams(
         food_name=food_name,
         research_year=research_year,
         maker_name=maker_name,
-        food_code=food_code
+        food_code=food_code,
+        sort=sort,
+        order=order,
+        limit=limit,
+        cursor=cursor,
+        **nutrient_ranges
     )
     
-    foods = await food_repo.search(search_params)
-    food_responses = [FoodResponse.model_validate(food) for food in foods]
+    foods, next_cursor = await food_repo.search(search_params, selected_fields)
     
-    return ApiListResponse[FoodResponse](
-        data=food_responses,
-        count=len(food_responses)
+    # 저장된 값은 이미 검증된 데이터이므로 응답 모델 검증 없이 바로 직렬화 (ApiListResponse 형태)
+    fast_response = FastJSONResponse({
+        "status": "success",
+        "data": foods,
+        "count": len(foods),
+        "nextCursor": next_cursor
+    })
+    set_validators(fast_response, etag, CACHE_CONTROL["food_search"])
+    return fast_response
+
+
+@router.get("/export", response_class=StreamingResponse, dependencies=ADMIT_EXPORT)
+async def export_foods_endpoint(
+    export_format: str = Query(
+        "ndjson", alias="format", pattern=f"^({'|'.join(EXPORT_FORMATS)})$",
+        description="내보내기 형식 (ndjson/csv/parquet, parquet은 pyarrow 필요)"
+    ),
+    food_name: str = Query(None, description="식품이름 (부분 일치 검색)"),
+    research_year: str = Query(None, pattern=r'^\d{4}$', description="연도(YYYY)"),
+    maker_name: str = Query(None, description="지역/제조사"),
+    food_code: str = Query(None, description="식품코드"),
+    sort: str = Query("id", description="정렬 기준 (id 또는 영양성분 컬럼명, 예: calorie)"),
+    order: str = Query("asc", pattern=r'^(asc|desc)$', description="정렬 방향 (asc/desc)"),
+    fields: str = Query(None, description="내보낼 필드 (쉼표 구분, 예: food_name,calorie). id는 항상 포함"),
+    nutrient_ranges: dict = Depends(nutrient_range_params)
+):
+    """
+    검색 조건에 맞는 식품 전체를 한 번의 응답으로 내보냅니다. (페이지 크기 제한 없음)
+    서버 측 커서로 행을 나누어 읽으면서 바로 응답 본문에 쓰므로 테이블 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    if export_format not in WRITERS:
+        raise ValidationError(f"{export_format} 형식으로 내보내려면 pyarrow가 설치되어 있어야 합니다.")
+    selected_fields = _parse_fields(fields)
+    search_params = FoodSearchParams(
+        food_name=food_name,
+        research_year=research_year,
+        maker_name=maker_name,
+        food_code=food_code,
+        sort=sort,
+        order=order,
+        **nutrient_ranges
     )
 
+    # 첫 청크를 미리 읽어 조회 오류는 응답을 시작하기 전에 오류 응답으로 반환
+    body = export_foods(export_format, search_params, selected_fields)
+    try:
+        first_chunk = await body.__anext__()
+    except FoodAPIException:
+        await body.aclose()
+        raise
+    except Exception as e:
+        await body.aclose()
+        raise DatabaseError(f"식품 내보내기 중 오류가 발생했습니다: {str(e)}")
+    except BaseException:
+        await body.aclose()
+        raise
+
+    async def stream():
+        try:
+            yield first_chunk
+            async for chunk in body:
+                yield chunk
+        except Exception:
+            # 200 헤더를 이미 보냈으므로 오류 응답 대신 예외를 그대로 올려 연결을 끊음
+            # (마지막 청크와 압축 종료 블록을 보내지 않으므로 클라이언트는 본문이 잘렸음을 알 수 있음)
+            logger.exception(f"식품 내보내기 도중 오류가 발생하여 응답을 중단합니다. ({export_format})")
+            raise
+        finally:
+            # 읽기 세션 연결과 서버 측 커서를 GC를 기다리지 않고 바로 풀에 반환
+            await body.aclose()
+
+    # 클라이언트 연결이 끊기면 StreamingResponse는 본문 이터레이터를 닫지 않고 버리므로
+    # 응답 후 작업으로 직접 닫아 stream()의 finally가 실행되게 함
+    chunks = stream()
+
+    async def close_stream():
+        await chunks.aclose()
+
+    writer = WRITERS[export_format]
+    return StreamingResponse(
+        chunks,
+        background=BackgroundTask(close_stream),
+        media_type=writer.media_type,
+        headers={"Content-Disposition": f'attachment; filename="foods.{writer.extension}"'}
+    )
 
-@router.get("", response_model=PaginatedResponse[FoodResponse])
+
+GROUP_BY_PATTERN = f"^({'|'.join(GROUP_BY_COLUMNS)})$"
+
+
+@router.get("/stats", response_model=ApiListResponse[GroupStatsResponse], dependencies=ADMIT_EXPENSIVE)
+async def get_food_stats(
+    request: Request,
+    group_by: str = Query("group_name", pattern=GROUP_BY_PATTERN, description="그룹 기준 (group_name/research_year/maker_name)"),
+    group: str = Query(None, description="지정 시 해당 그룹의 통계만 반환"),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    그룹별 영양성분 통계(개수, 평균, 최소, 최대, p50/p90/p99)를 조회합니다.
+    통계는 미리 집계되어 쓰기 시 해당 그룹만 갱신되므로 요청마다 테이블을 스캔하지 않습니다.
+    """
+    etag = collection_etag(await food_repo.get_version(), request)
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL["food_stats"])
+    
+    stats = await food_repo.get_group_stats(group_by, group)
+    
+    # 집계된 값을 응답 모델 검증 없이 바로 직렬화 (ApiListResponse 형태)
+    fast_response = FastJSONResponse({
+        "status": "success",
+        "data": stats,
+        "count": len(stats),
+        "nextCursor": None
+    })
+    set_validators(fast_response, etag, CACHE_CONTROL["food_stats"])
+    return fast_response
+
+
+@router.get("", response_model=PaginatedResponse[FoodResponse], dependencies=ADMIT_CHEAP)
 async def get_foods(
+    request: Request,
     page: int = Query(1, ge=1, description="페이지 번호"),
     limit: int = Query(20, ge=1, le=100, description="페이지당 항목 수"),
-    food_repo: FoodRepository = Depends(get_food_repository)
+    cursor: str = Query(None, description="이전 응답의 nextCursor (지정 시 page 대신 사용)"),
+    fields: str = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: food_name,calorie). id는 항상 포함"),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
 ):
     """
     모든 식품 목록을 페이지네이션과 함께 조회합니다.
+    전체 목록을 순회할 때는 page 대신 nextCursor를 사용하면 깊은 페이지도 일정한 비용으로 조회됩니다.
     """
-    pagination_params = PaginationParams(page=page, limit=limit)
-    foods, total = await food_repo.get_all(pagination_params)
+    selected_fields = _parse_fields(fields)
+    etag = collection_etag(await food_repo.get_version(), request)
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL["food_list"])
     
-    food_responses = [FoodResponse.model_validate(food) for food in foods]
-    total_pages = math.ceil(total / limit)
+    pagination_params = PaginationParams(page=page, limit=limit, cursor=cursor)
+    foods, total, next_cursor = await food_repo.get_all(pagination_params, selected_fields)
     
-    pagination_info = PaginationInfo(
-        page=page,
-        limit=limit,
-        total=total,
-        totalPages=total_pages
-    )
+    # PaginatedResponse 형태로 바로 직렬화
+    fast_response = FastJSONResponse({
+        "status": "success",
+        "data": foods,
+        "pagination": {
+            "page": None if cursor else page,
+            "limit": limit,
+            "total": total,
+            "totalPages": math.ceil(total / limit),
+            "nextCursor": next_cursor
+        }
+    })
+    set_validators(fast_response, etag, CACHE_CONTROL["food_list"])
+    return fast_response
+
+
+@router.post("/lookup", response_model=LookupResponse[FoodResponse], dependencies=ADMIT_CHEAP)
+async def lookup_foods(
+    lookup: FoodLookupRequest,
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    ID 또는 식품코드 목록으로 여러 식품을 한 번에 조회합니다.
+    요청 순서(ids 다음 food_cds)대로 반환하며, 찾지 못한 키는 missing에 담깁니다.
+    """
+    _check_batch_size(lookup.ids + lookup.food_cds)
+    rows, missing_ids, missing_cds = await food_repo.get_many(lookup.ids, lookup.food_cds)
     
-    return PaginatedResponse[FoodResponse](
-        data=food_responses,
-        pagination=pagination_info
+    return LookupResponse[FoodResponse](
+        data=[FoodResponse.model_validate(row) for row in rows],
+        missing=LookupMissing(ids=missing_ids, food_cds=missing_cds)
     )
 
 
-@router.get("/{food_id}", response_model=ApiResponse[FoodResponse])
+@router.post("/nutrition/aggregate", response_model=NutritionAggregateResponse, dependencies=ADMIT_EXPENSIVE)
+async def aggregate_nutrition(
+    request_body: NutritionAggregateRequest,
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    여러 (식품, 섭취량) 항목의 영양성분을 1회 제공량 기준으로 환산하여 항목별 값과 합계를 계산합니다.
+    unit이 g이면 섭취량을 serving_size(g)로 나눈 배수를 사용합니다.
+    찾지 못한 식품이 있으면 400 BATCH_OPERATION_FAILED와 항목별 오류를 반환합니다.
+    """
+    _check_batch_size(request_body.items)
+    items, totals = await food_repo.aggregate_nutrition(request_body.items)
+    return NutritionAggregateResponse(items=items, totals=totals)
+
+
+@router.post("/similar", response_model=ApiListResponse[SimilarFoodResponse], dependencies=ADMIT_EXPENSIVE)
+async def find_foods_by_profile(
+    query: NutrientProfileQuery,
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    목표 영양성분 값에 가장 가까운 식품을 조회합니다.
+    지정한 영양성분만 표준화(z-score)된 거리로 비교하며, 가까운 순으로 반환합니다.
+    """
+    neighbors = await food_repo.find_similar_to_profile(query.nutrients, query.k, query.group_name)
+    return _similar_response(neighbors)
+
+
+@router.post("/batch", response_model=BatchResponse[FoodResponse], dependencies=ADMIT_EXPENSIVE)
+async def create_foods_batch(
+    items: List[FoodCreate],
+    atomic: bool = Query(True, description="참이면 하나라도 실패 시 전체 취소, 거짓이면 항목별 결과 반환"),
+    food_repo: FoodRepository = Depends(get_food_repository)
+):
+    """
+    여러 식품 정보를 한 번에 등록합니다.
+    """
+    _check_batch_size(items)
+    outcomes = await food_repo.create_many(items, atomic=atomic)
+    return _batch_response(outcomes, "created")
+
+
+@router.patch("/batch", response_model=BatchResponse[FoodResponse], dependencies=ADMIT_EXPENSIVE)
+async def partial_update_foods_batch(
+    items: List[FoodBatchUpdateItem],
+    atomic: bool = Query(True, description="참이면 하나라도 실패 시 전체 취소, 거짓이면 항목별 결과 반환"),
+    food_repo: FoodRepository = Depends(get_food_repository)
+):
+    """
+    여러 식품의 일부 정보를 한 번에 수정합니다.
+    """
+    _check_batch_size(items)
+    outcomes = await food_repo.update_many([(item.id, item.data) for item in items], atomic=atomic)
+    return _batch_response(outcomes, "updated")
+
+
+@router.delete("/batch", response_model=BatchResponse[FoodResponse], dependencies=ADMIT_EXPENSIVE)
+async def delete_foods_batch(
+    ids: List[int] = Body(..., description="삭제할 식품 ID 목록"),
+    atomic: bool = Query(True, description="참이면 하나라도 실패 시 전체 취소, 거짓이면 항목별 결과 반환"),
+    food_repo: FoodRepository = Depends(get_food_repository)
+):
+    """
+    여러 식품 정보를 한 번에 삭제합니다.
+    """
+    _check_batch_size(ids)
+    outcomes = await food_repo.delete_many_by_ids(ids, atomic=atomic)
+    return _batch_response(outcomes, "deleted", with_data=False)
+
+
+@router.get("/{food_id}", response_model=ApiResponse[FoodResponse], dependencies=ADMIT_CHEAP)
 async def get_food(
     food_id: int,
-    food_repo: FoodRepository = Depends(get_food_repository)
+    request: Request,
+    response: Response,
+    fields: str = Query(None, description="응답에 포함할 필드 (쉼표 구분, 예: food_name,calorie). id는 항상 포함"),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
 ):
     """
     특정 식품 정보를 조회합니다.
     """
-    food = await food_repo.get_by_id(food_id)
+    selected_fields = _parse_fields(fields)
+    updated_at, _ = await food_repo.get_validator(food_id)
+    etag = item_etag(food_id, updated_at, selected_fields)
+    if etag_matches(request, etag):
+        return not_modified(etag, CACHE_CONTROL["food"])
+    
+    food = await food_repo.get_by_id(food_id, selected_fields)
+    if selected_fields is not None:
+        # 일부 필드만 담은 응답은 FoodResponse 검증을 거치지 않고 바로 직렬화
+        fast_response = FastJSONResponse({"status": "success", "data": food})
+        set_validators(fast_response, etag, CACHE_CONTROL["food"])
+        return fast_response
+    
+    set_validators(response, etag, CACHE_CONTROL["food"])
     food_response = FoodResponse.model_validate(food)
     
     return ApiResponse[FoodResponse](data=food_response)
 
 
-@router.post("", response_model=ApiResponse[FoodResponse], status_code=status.HTTP_201_CREATED)
+@router.get("/{food_id}/similar", response_model=ApiListResponse[SimilarFoodResponse], dependencies=ADMIT_EXPENSIVE)
+async def get_similar_foods(
+    food_id: int,
+    k: int = Query(10, ge=1, le=100, description="반환할 식품 수"),
+    same_group: bool = Query(False, description="참이면 같은 식품군에서만 검색"),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    영양성분 프로파일이 비슷한 식품을 조회합니다. (대체 식품 추천)
+    """
+    neighbors = await food_repo.find_similar(food_id, k, same_group)
+    return _similar_response(neighbors)
+
+
+@router.get("/{food_id}/percentiles", response_model=ApiResponse[FoodPercentileResponse], dependencies=ADMIT_CHEAP)
+async def get_food_percentiles(
+    food_id: int,
+    group_by: str = Query("group_name", pattern=GROUP_BY_PATTERN, description="그룹 기준 (group_name/research_year/maker_name)"),
+    food_repo: FoodRepository = Depends(get_read_food_repository)
+):
+    """
+    식품이 속한 그룹 안에서 영양성분별 백분위 순위를 조회합니다.
+    예: salt가 92이면 같은 그룹 식품의 92%보다 나트륨이 많습니다.
+    """
+    group, count, ranks = await food_repo.get_percentile_ranks(food_id, group_by)
+    
+    return ApiResponse[FoodPercentileResponse](data=FoodPercentileResponse(
+        id=food_id,
+        group_by=group_by,
+        group=group,
+        count=count,
+        percentiles=ranks
+    ))
+
+
+@router.post("", response_model=ApiResponse[FoodResponse], status_code=status.HTTP_201_CREATED, dependencies=ADMIT_CHEAP)
 async def create_food(
     food_data: FoodCreate,
     food_repo: FoodRepository = Depends(get_food_repository)
@@ -96,7 +461,7 @@ async def create_food(
     return ApiResponse[FoodResponse](data=food_response)
 
 
-@router.put("/{food_id}", response_model=ApiResponse[FoodResponse])
+@router.put("/{food_id}", response_model=ApiResponse[FoodResponse], dependencies=ADMIT_CHEAP)
 async def update_food(
     food_id: int,
     food_data: FoodUpdate,
@@ -111,7 +476,7 @@ async def update_food(
     return ApiResponse[FoodResponse](data=food_response)
 
 
-@router.patch("/{food_id}", response_model=ApiResponse[FoodResponse])
+@router.patch("/{food_id}", response_model=ApiResponse[FoodResponse], dependencies=ADMIT_CHEAP)
 async def partial_update_food(
     food_id: int,
     food_data: FoodPartialUpdate,
@@ -126,7 +491,7 @@ async def partial_update_food(
     return ApiResponse[FoodResponse](data=food_response)
 
 
-@router.delete("/{food_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete("/{food_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=ADMIT_CHEAP)
 async def delete_food(
     food_id: int,
     food_repo: FoodRepository = Depends(get_food_repository)
@@ -0,0 +1,38 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class QueryShapeStats(BaseModel):
+    """정규화된 쿼리 형태별 실행 통계 스키마"""
+    statement: str = Field(..., description="리터럴과 IN 목록 길이를 지운 SQL")
+    count: int
+    total_ms: float
+    mean_ms: float
+    max_ms: float
+    slow_count: int = Field(..., description="임계값을 넘은 실행 횟수")
+    callers: Dict[str, int] = Field(..., description="느리게 실행된 호출 위치(리포지토리 메서드)별 횟수")
+    slowest_params: Optional[str] = Field(None, description="가장 느렸던 실행의 파라미터")
+    plan: Optional[List[str]] = Field(None, description="처음 느리게 실행되었을 때의 실행 계획")
+
+
+class SlowQueryReport(BaseModel):
+    """느린 쿼리 보고서 스키마"""
+    enabled: bool
+    threshold_ms: float
+    shape_count: int = Field(..., description="집계 중인 쿼리 형태 수")
+    shapes: List[QueryShapeStats]
+
+
+class ProfileSummary(BaseModel):
+    """요청 프로파일 요약 스키마"""
+    id: int
+    method: str
+    path: str
+    query: str
+    status: Optional[int] = Field(None, description="응답 상태 코드")
+    started_at: float = Field(..., description="요청 시작 시각 (Unix 시간)")
+    duration_ms: float
+    sample_count: int
+    breakdown_ms: Dict[str, float] = Field(
+        ..., description="분류별 시간 (sql, orm, pydantic, json, compress, app, await)"
+    )
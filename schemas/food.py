@@ -1,9 +1,16 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import Optional, List, Generic, TypeVar
+from pydantic import BaseModel, Field, create_model, field_validator, model_validator, ConfigDict
+from pydantic.fields import FieldInfo
+from typing import Callable, Dict, Optional, List, Generic, Tuple, TypeVar
 import re
 
+from models.food import NUTRIENT_COLUMNS
+
 T = TypeVar('T')
 
+# 범위 검색과 정렬을 지원하는 영양성분 필드
+NUTRIENT_FIELDS = NUTRIENT_COLUMNS
+SORT_FIELDS = ("id",) + NUTRIENT_FIELDS
+
 
 class FoodBase(BaseModel):
     """식품 기본 스키마"""
@@ -83,12 +90,33 @@ class FoodResponse(FoodBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-class FoodSearchParams(BaseModel):
-    """식품 검색 파라미터 스키마"""
+class SimilarFoodResponse(FoodResponse):
+    """유사 식품 응답 스키마"""
+    distance: float = Field(..., description="표준화된 영양성분 거리 (작을수록 유사)")
+
+
+def nutrient_range_fields(field: Callable[..., FieldInfo] = Field) -> Dict[str, FieldInfo]:
+    """영양성분마다 {name}_min/{name}_max 범위 필드(경계값 포함)를 만듭니다.
+
+    field에 FastAPI의 Query를 넘기면 같은 정의로 쿼리 파라미터를 만들 수 있습니다.
+    """
+    fields = {}
+    for name in NUTRIENT_FIELDS:
+        label = FoodBase.model_fields[name].description
+        fields[f"{name}_min"] = field(None, ge=0, description=f"최소 {label}")
+        fields[f"{name}_max"] = field(None, ge=0, description=f"최대 {label}")
+    return fields
+
+
+class _FoodSearchParamsBase(BaseModel):
     food_name: Optional[str] = Field(None, description="식품이름 (부분 일치 검색)")
     research_year: Optional[str] = Field(None, pattern=r'^\d{4}$', description="연도(YYYY)")
     maker_name: Optional[str] = Field(None, description="지역/제조사")
     food_code: Optional[str] = Field(None, description="식품코드")
+    sort: str = Field(default="id", description="정렬 기준 (id 또는 영양성분 컬럼명)")
+    order: str = Field(default="asc", pattern=r'^(asc|desc)$', description="정렬 방향 (asc/desc)")
+    limit: int = Field(default=100, ge=1, le=1000, description="최대 항목 수")
+    cursor: Optional[str] = Field(None, description="이전 응답의 nextCursor")
 
     @field_validator('research_year')
     @classmethod
@@ -97,19 +125,90 @@ class FoodSearchParams(BaseModel):
             raise ValueError('연도는 YYYY 형식이어야 합니다')
         return v
 
+    @field_validator('sort')
+    @classmethod
+    def validate_sort(cls, v):
+        if v not in SORT_FIELDS:
+            raise ValueError(f"정렬 기준은 {', '.join(SORT_FIELDS)} 중 하나여야 합니다")
+        return v
+
+    def nutrient_ranges(self) -> List[Tuple[str, Optional[float], Optional[float]]]:
+        """지정된 영양성분 범위 조건을 (컬럼명, 최소값, 최대값) 목록으로 반환합니다. 경계값 포함."""
+        ranges = []
+        for name in NUTRIENT_FIELDS:
+            low = getattr(self, f"{name}_min")
+            high = getattr(self, f"{name}_max")
+            if low is not None or high is not None:
+                ranges.append((name, low, high))
+        return ranges
+
+
+# 영양성분 범위 필드는 NUTRIENT_FIELDS에서 생성
+FoodSearchParams = create_model(
+    "FoodSearchParams",
+    __doc__="식품 검색 파라미터 스키마",
+    __base__=_FoodSearchParamsBase,
+    __module__=__name__,
+    **{name: (Optional[float], info) for name, info in nutrient_range_fields().items()}
+)
+
+
+class FoodLookupRequest(BaseModel):
+    """식품 다건 조회 요청 스키마"""
+    ids: List[int] = Field(default_factory=list, description="식품 ID 목록")
+    food_cds: List[str] = Field(default_factory=list, description="식품코드 목록")
+
+
+class NutrientProfileQuery(BaseModel):
+    """영양성분 프로파일 유사도 검색 요청 스키마"""
+    nutrients: Dict[str, float] = Field(..., description="목표 영양성분 값 (지정한 영양성분만 거리 계산에 사용)")
+    k: int = Field(default=10, ge=1, le=100, description="반환할 식품 수")
+    group_name: Optional[str] = Field(None, description="지정 시 같은 식품군에서만 검색")
+
+    @field_validator('nutrients')
+    @classmethod
+    def validate_nutrients(cls, v):
+        if not v:
+            raise ValueError('영양성분을 하나 이상 지정해야 합니다')
+        unknown = sorted(set(v) - set(NUTRIENT_FIELDS))
+        if unknown:
+            raise ValueError(f"알 수 없는 영양성분입니다: {', '.join(unknown)}")
+        return v
+
+
+class NutritionItem(BaseModel):
+    """영양성분 합산 요청 항목 스키마 (food_id 또는 food_cd 중 하나 지정)"""
+    food_id: Optional[int] = Field(None, description="식품 ID")
+    food_cd: Optional[str] = Field(None, description="식품코드")
+    quantity: float = Field(default=1.0, gt=0, description="섭취량")
+    unit: str = Field(default="serving", pattern=r'^(serving|g)$', description="섭취량 단위 (serving: 1회 제공량 배수, g: 그램)")
+
+    @model_validator(mode="after")
+    def validate_key(self):
+        if (self.food_id is None) == (self.food_cd is None):
+            raise ValueError('food_id와 food_cd 중 하나만 지정해야 합니다')
+        return self
+
+
+class NutritionAggregateRequest(BaseModel):
+    """영양성분 합산 요청 스키마"""
+    items: List[NutritionItem] = Field(..., min_length=1, description="식품과 섭취량 목록")
+
 
 class PaginationParams(BaseModel):
     """페이지네이션 파라미터 스키마"""
     page: int = Field(default=1, ge=1, description="페이지 번호")
     limit: int = Field(default=20, ge=1, le=100, description="페이지당 항목 수")
+    cursor: Optional[str] = Field(None, description="이전 응답의 nextCursor (지정 시 page 대신 사용)")
 
 
 class PaginationInfo(BaseModel):
     """페이지네이션 정보 스키마"""
-    page: int
+    page: Optional[int] = None
     limit: int
     total: int
     totalPages: int
+    nextCursor: Optional[str] = None
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
@@ -130,6 +229,63 @@ class ApiListResponse(BaseModel, Generic[T]):
     status: str = "success"
     data: List[T]
     count: int
+    nextCursor: Optional[str] = None
+
+
+class LookupMissing(BaseModel):
+    """다건 조회에서 찾지 못한 키 스키마"""
+    ids: List[int] = []
+    food_cds: List[str] = []
+
+
+class LookupResponse(BaseModel, Generic[T]):
+    """다건 조회 응답 스키마"""
+    status: str = "success"
+    data: List[T]
+    missing: LookupMissing
+
+
+class NutrientStats(BaseModel):
+    """영양성분 하나의 그룹 통계 스키마"""
+    mean: float
+    min: float
+    max: float
+    p50: float
+    p90: float
+    p99: float
+
+
+class GroupStatsResponse(BaseModel):
+    """그룹별 영양성분 통계 스키마"""
+    group: str = Field(..., description="그룹 값 (group_by 컬럼의 값)")
+    count: int
+    nutrients: Dict[str, NutrientStats]
+
+
+class FoodPercentileResponse(BaseModel):
+    """식품의 그룹 내 백분위 순위 스키마"""
+    id: int
+    group_by: str
+    group: str
+    count: int = Field(..., description="그룹 내 식품 수")
+    percentiles: Dict[str, float] = Field(..., description="영양성분별 백분위 순위 (0~100)")
+
+
+class NutritionItemResult(BaseModel):
+    """영양성분 합산 결과 항목 스키마"""
+    index: int = Field(..., description="요청 항목 순번")
+    id: int
+    food_cd: str
+    food_name: str
+    servings: float = Field(..., description="1회 제공량 기준 배수")
+    nutrients: Dict[str, float]
+
+
+class NutritionAggregateResponse(BaseModel):
+    """영양성분 합산 응답 스키마"""
+    status: str = "success"
+    items: List[NutritionItemResult]
+    totals: Dict[str, float]
 
 
 class ErrorDetail(BaseModel):
@@ -142,4 +298,27 @@ class ErrorDetail(BaseModel):
 class ErrorResponse(BaseModel):
     """에러 응답 스키마"""
     status: str = "error"
-    error: ErrorDetail
\ No newline at end of file
+    error: ErrorDetail
+
+
+class FoodBatchUpdateItem(BaseModel):
+    """일괄 부분 수정 항목 스키마"""
+    id: int = Field(..., description="식품 ID")
+    data: FoodPartialUpdate
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """일괄 작업 항목별 결과 스키마"""
+    index: int
+    status: str
+    id: Optional[int] = None
+    data: Optional[T] = None
+    error: Optional[ErrorDetail] = None
+
+
+class BatchResponse(BaseModel, Generic[T]):
+    """일괄 작업 응답 스키마"""
+    status: str = "success"
+    results: List[BatchItemResult[T]]
+    succeeded: int
+    failed: int
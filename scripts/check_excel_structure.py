@@ -1,6 +1,12 @@
 import pandas as pd
 import sys
 import os
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from scripts.food_dataset import describe_dataset_cache
 
 def check_excel_structure(excel_path: str):
     """엑셀 파일의 구조를 확인합니다."""
@@ -26,6 +32,10 @@ def check_excel_structure(excel_path: str):
         print("\n결측값 확인:")
         print(df.isnull().sum())
         
+        print("\n데이터셋 캐시:")
+        for key, value in describe_dataset_cache(excel_path).items():
+            print(f"  {key}: {value}")
+        
     except Exception as e:
         print(f"엑셀 파일 분석 실패: {e}")
 
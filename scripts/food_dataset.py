@@ -0,0 +1,236 @@
+import hashlib
+import json
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트를 Python path에 추가
+sys.path.append(str(Path(__file__).parent.parent))
+
+from models.food import Food, STRING_COLUMNS, NUTRIENT_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# 정제 규칙이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_FORMAT_VERSION = 1
+CACHE_SUFFIX = ".cache.npz"
+
+# 모델 필드 -> 엑셀 컬럼명
+EXCEL_COLUMNS = {
+    "food_cd": "식품코드",
+    "group_name": "DB군",
+    "food_name": "식품명",
+    "research_year": "연도",
+    "maker_name": "지역 / 제조사",
+    "ref_name": "성분표출처",
+    "serving_size": "1회제공량",
+    "calorie": "에너지(㎉)",
+    "carbohydrate": "탄수화물(g)",
+    "protein": "단백질(g)",
+    "province": "지방(g)",
+    "sugars": "총당류(g)",
+    "salt": "나트륨(㎎)",
+    "cholesterol": "콜레스테롤(㎎)",
+    "saturated_fatty_acids": "총 포화 지방산(g)",
+    "trans_fat": "트랜스 지방산(g)",
+}
+
+DEFAULT_RESEARCH_YEAR = "2023"
+
+
+def _clean_str(series: pd.Series) -> pd.Series:
+    """빈 값과 '-'는 빈 문자열로, 나머지는 앞뒤 공백을 제거한 문자열로 변환합니다."""
+    missing = series.isna() | (series == '-')
+    return series.astype("string").str.strip().where(~missing, "").fillna("")
+
+
+def _clean_float(series: pd.Series) -> pd.Series:
+    """숫자로 변환할 수 없는 값('-', 빈 값 등)은 0.0으로 변환합니다."""
+    return pd.to_numeric(series, errors="coerce").fillna(0.0).astype(np.float64)
+
+
+def clean_dataframe(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """엑셀 데이터프레임을 컬럼 단위로 정제하고 검증합니다.
+
+    Returns:
+        (적재 가능한 행, 거부된 행 보고서[row, food_cd, reason])
+    """
+    clean = pd.DataFrame(index=df.index)
+    for field in STRING_COLUMNS:
+        clean[field] = _clean_str(df[EXCEL_COLUMNS[field]])
+    for field in NUTRIENT_COLUMNS:
+        clean[field] = _clean_float(df[EXCEL_COLUMNS[field]])
+
+    # 연도 형식이 맞지 않으면 기본값 설정
+    year = clean["research_year"]
+    clean["research_year"] = year.where(year.str.fullmatch(r"\d{4}"), DEFAULT_RESEARCH_YEAR)
+
+    # 행마다 첫 번째 거부 사유만 기록
+    reasons = pd.Series(pd.NA, index=df.index, dtype="string")
+
+    def reject(mask: pd.Series, reason: str):
+        reasons[mask & reasons.isna()] = reason
+
+    reject((clean["food_cd"] == "") | (clean["food_name"] == ""), "필수 필드 누락 (식품코드/식품명)")
+    for field in STRING_COLUMNS:
+        max_length = Food.__table__.c[field].type.length
+        reject(clean[field] == "", f"{field} 값이 비어 있습니다")
+        reject(clean[field].str.len() > max_length, f"{field} 길이가 {max_length}자를 초과합니다")
+    year_value = clean["research_year"].astype(int)
+    reject((year_value < 1900) | (year_value > 2100), "연도는 1900년과 2100년 사이여야 합니다")
+    for field in NUTRIENT_COLUMNS:
+        reject(clean[field] < 0, f"{field} 값은 0 이상이어야 합니다")
+    reject(clean["food_cd"].duplicated(keep="first"), "파일 내 중복된 식품코드")
+
+    rejected = reasons.notna()
+    rejects = pd.DataFrame({
+        "row": df.index[rejected] + 1,
+        "food_cd": clean.loc[rejected, "food_cd"],
+        "reason": reasons[rejected],
+    })
+    return clean[~rejected], rejects
+
+
+def row_hashes(frame: pd.DataFrame) -> np.ndarray:
+    """행마다 정규화된 내용(문자열/영양성분 컬럼)의 64비트 해시를 계산합니다.
+
+    엑셀 행과 데이터베이스 행을 같은 방식으로 정규화하므로 두 해시를 직접 비교할 수 있습니다.
+    """
+    normalized = pd.DataFrame(index=frame.index)
+    for field in STRING_COLUMNS:
+        normalized[field] = frame[field].astype("string")
+    for field in NUTRIENT_COLUMNS:
+        normalized[field] = frame[field].astype(np.float64)
+    return pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+
+
+def read_food_dataframe(excel_path: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """엑셀 파일을 읽어 정제된 식품 데이터와 거부 보고서를 반환합니다."""
+    df = pd.read_excel(excel_path)
+    logger.info(f"엑셀 파일에서 {len(df)}개 행을 읽었습니다.")
+    return clean_dataframe(df)
+
+
+def workbook_hash(excel_path: str) -> str:
+    """엑셀 파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(excel_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(excel_path: str) -> str:
+    """엑셀 파일 옆에 저장되는 캐시 파일 경로를 반환합니다."""
+    return excel_path + CACHE_SUFFIX
+
+
+def save_dataset_cache(path: str, digest: str, records: pd.DataFrame, rejects: pd.DataFrame) -> None:
+    """정제된 데이터셋을 NumPy npz(문자열 테이블 + 영양성분 행렬)로 저장합니다."""
+    arrays = {
+        "meta": np.array(json.dumps({
+            "format_version": CACHE_FORMAT_VERSION,
+            "workbook_sha256": digest,
+            "rows": len(records),
+            "rejects": len(rejects),
+            "created_at": time.time(),
+        })),
+        "nutrients": records[list(NUTRIENT_COLUMNS)].to_numpy(dtype=np.float64),
+        "rejects_row": rejects["row"].to_numpy(dtype=np.int64),
+        "rejects_food_cd": rejects["food_cd"].to_numpy(dtype=str),
+        "rejects_reason": rejects["reason"].to_numpy(dtype=str),
+    }
+    # 문자열 컬럼은 딕셔너리 인코딩 (코드 배열 + 고유값 테이블)
+    for field in STRING_COLUMNS:
+        codes, values = pd.factorize(records[field])
+        arrays[f"{field}_codes"] = codes.astype(np.int32)
+        arrays[f"{field}_values"] = np.asarray(values, dtype=str)
+
+    # 쓰는 도중 다른 프로세스가 읽지 않도록 임시 파일에 쓴 후 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_path, path)
+
+
+def read_dataset_cache(path: str) -> tuple[dict, pd.DataFrame, pd.DataFrame]:
+    """캐시 파일에서 (메타데이터, 정제된 데이터, 거부 보고서)를 복원합니다."""
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data["meta"]))
+        records = pd.DataFrame({
+            field: data[f"{field}_values"][data[f"{field}_codes"]]
+            for field in STRING_COLUMNS
+        })
+        nutrients = data["nutrients"]
+        for index, field in enumerate(NUTRIENT_COLUMNS):
+            records[field] = nutrients[:, index]
+        rejects = pd.DataFrame({
+            "row": data["rejects_row"],
+            "food_cd": data["rejects_food_cd"],
+            "reason": data["rejects_reason"],
+        })
+    return meta, records, rejects
+
+
+def load_food_dataset(excel_path: str, use_cache: bool = True) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """정제된 식품 데이터와 거부 보고서를 반환합니다.
+
+    엑셀 파일 해시가 캐시와 같으면 엑셀 파싱 없이 캐시에서 읽고,
+    다르거나 캐시가 없으면 엑셀을 파싱한 뒤 캐시를 다시 만듭니다.
+    """
+    if not use_cache:
+        return read_food_dataframe(excel_path)
+
+    digest = workbook_hash(excel_path)
+    path = cache_path(excel_path)
+    if os.path.exists(path):
+        try:
+            meta, records, rejects = read_dataset_cache(path)
+            if meta.get("format_version") == CACHE_FORMAT_VERSION and meta.get("workbook_sha256") == digest:
+                logger.info(f"데이터셋 캐시 사용: {path} ({len(records)}개 행)")
+                return records, rejects
+            logger.info("엑셀 파일이 변경되어 데이터셋 캐시를 다시 생성합니다.")
+        except Exception as e:
+            logger.warning(f"데이터셋 캐시 읽기 실패, 엑셀에서 다시 읽습니다: {e}")
+
+    records, rejects = read_food_dataframe(excel_path)
+    try:
+        save_dataset_cache(path, digest, records, rejects)
+        logger.info(f"데이터셋 캐시를 저장했습니다: {path}")
+    except OSError as e:
+        logger.warning(f"데이터셋 캐시 저장 실패: {e}")
+    return records, rejects
+
+
+def describe_dataset_cache(excel_path: str) -> dict:
+    """캐시 파일의 상태(존재 여부, 최신 여부, 행 수 등)를 반환합니다."""
+    path = cache_path(excel_path)
+    info = {"path": path, "exists": os.path.exists(path)}
+    if not info["exists"]:
+        return info
+    info["size_bytes"] = os.path.getsize(path)
+    try:
+        meta, _, _ = read_dataset_cache(path)
+    except Exception as e:
+        info["error"] = str(e)
+        return info
+    info.update(meta)
+    info["fresh"] = (
+        meta.get("format_version") == CACHE_FORMAT_VERSION
+        and meta.get("workbook_sha256") == workbook_hash(excel_path)
+    )
+    return info
+
+
+if __name__ == "__main__":
+    # 사용법: python scripts/food_dataset.py [excel_file_path]
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    excel_path = sys.argv[1] if len(sys.argv) > 1 else "food_nutrition_db.xlsx"
+    load_food_dataset(excel_path)
+    for key, value in describe_dataset_cache(excel_path).items():
+        print(f"{key}: {value}")
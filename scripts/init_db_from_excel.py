@@ -1,26 +1,41 @@
 import asyncio
 import argparse
-import pandas as pd
 import sys
 import os
 from pathlib import Path
 import logging
+from typing import Callable, Optional
 
 # 프로젝트 루트를 Python path에 추가
 sys.path.append(str(Path(__file__).parent.parent))
 
 from database import async_session_factory, create_tables
 from repositories.food_repository import FoodRepository
-from schemas.food import FoodCreate
-from models.food import Food
+from repositories import events
+from scripts.food_dataset import load_food_dataset, row_hashes
+import pandas as pd
 from sqlalchemy import text
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-async def init_from_excel(excel_path: str, clear_existing: bool = False):
-    """엑셀 파일로부터 데이터베이스를 초기화합니다."""
+DEFAULT_BATCH_SIZE = 1000
+
+
+async def init_from_excel(
+    excel_path: str,
+    clear_existing: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    reject_report: str = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> dict:
+    """엑셀 파일로부터 데이터베이스를 초기화합니다.
+
+    정제된 행을 batch_size개씩 executemany로 삽입하고 배치마다 커밋합니다.
+    이미 존재하는 식품코드는 건너뜁니다.
+    progress가 주어지면 배치가 커밋될 때마다 (처리한 행 수, 전체 행 수)로 호출합니다.
+    """
     
     logger.info("데이터베이스 테이블 생성 중...")
     await create_tables()
@@ -28,11 +43,19 @@ async def init_from_excel(excel_path: str, clear_existing: bool = False):
     # 엑셀 파일 읽기
     try:
         logger.info(f"엑셀 파일 읽기 중: {excel_path}")
-        df = pd.read_excel(excel_path)
-        logger.info(f"엑셀 파일에서 {len(df)}개 행을 읽었습니다.")
+        # 애플리케이션 시작 시 백그라운드로 실행되므로 파싱 중에도 이벤트 루프가 요청을 처리하도록 스레드에서 실행
+        records, rejects = await asyncio.to_thread(load_food_dataset, excel_path)
     except Exception as e:
         logger.error(f"엑셀 파일 읽기 실패: {e}")
-        return
+        return {}
+
+    for row in rejects.head(20).itertuples(index=False):
+        logger.warning(f"Row {row.row}: {row.reason} (식품코드: {row.food_cd})")
+    if len(rejects) > 20:
+        logger.warning(f"... 외 {len(rejects) - 20}개 행이 거부되었습니다.")
+    if reject_report and len(rejects):
+        rejects.to_csv(reject_report, index=False, encoding="utf-8-sig")
+        logger.info(f"거부 보고서를 저장했습니다: {reject_report}")
     
     async with async_session_factory() as session:
         try:
@@ -40,98 +63,130 @@ async def init_from_excel(excel_path: str, clear_existing: bool = False):
             if clear_existing:
                 logger.info("기존 데이터 삭제 중...")
                 await session.execute(text("DELETE FROM foods"))
+                events.record_reset(session)
                 await session.commit()
                 logger.info("기존 데이터를 삭제했습니다.")
             
             repository = FoodRepository(session)
-            success_count = 0
-            error_count = 0
+            inserted_count = 0
+            total_batches = (len(records) + batch_size - 1) // batch_size
+            if progress:
+                progress(0, len(records))
             
-            # 배치 처리
-            batch_size = 100
-            total_batches = (len(df) + batch_size - 1) // batch_size
-            
-            for i in range(0, len(df), batch_size):
-                batch = df.iloc[i:i+batch_size]
+            for i in range(0, len(records), batch_size):
+                batch = records.iloc[i:i+batch_size].to_dict("records")
                 batch_num = i // batch_size + 1
-                logger.info(f"배치 {batch_num}/{total_batches} 처리 중... ({i+1}-{min(i+batch_size, len(df))})")
-                
-                for index, row in batch.iterrows():
-                    try:
-                        # 데이터 검증 및 변환
-                        def safe_str(value):
-                            """안전하게 문자열로 변환"""
-                            if pd.isna(value) or value == '-':
-                                return ""
-                            return str(value).strip()
-                        
-                        def safe_float(value):
-                            """안전하게 float로 변환"""
-                            if pd.isna(value) or value == '-' or value == '':
-                                return 0.0
-                            try:
-                                return float(value)
-                            except (ValueError, TypeError):
-                                return 0.0
-                        
-                        # 필수 필드 검증
-                        food_cd = safe_str(row['식품코드'])
-                        food_name = safe_str(row['식품명'])
-                        research_year = safe_str(row['연도'])
-                        
-                        if not food_cd or not food_name:
-                            logger.warning(f"Row {index + 1}: 필수 필드 누락 (식품코드: {food_cd}, 식품명: {food_name})")
-                            error_count += 1
-                            continue
-                        
-                        # 연도 형식 검증
-                        if not research_year or len(research_year) != 4 or not research_year.isdigit():
-                            research_year = "2023"  # 기본값 설정
-                        
-                        food_data = FoodCreate(
-                            food_cd=food_cd,
-                            group_name=safe_str(row['DB군']),
-                            food_name=food_name,
-                            research_year=research_year,
-                            maker_name=safe_str(row['지역 / 제조사']),
-                            ref_name=safe_str(row['성분표출처']),
-                            serving_size=safe_str(row['1회제공량']),
-                            calorie=safe_float(row['에너지(㎉)']),
-                            carbohydrate=safe_float(row['탄수화물(g)']),
-                            protein=safe_float(row['단백질(g)']),
-                            province=safe_float(row['지방(g)']),
-                            sugars=safe_float(row['총당류(g)']),
-                            salt=safe_float(row['나트륨(㎎)']),
-                            cholesterol=safe_float(row['콜레스테롤(㎎)']),
-                            saturated_fatty_acids=safe_float(row['총 포화 지방산(g)']),
-                            trans_fat=safe_float(row['트랜스 지방산(g)'])
-                        )
-                        
-                        await repository.create(food_data)
-                        success_count += 1
-                        
-                    except Exception as e:
-                        error_count += 1
-                        logger.warning(f"Row {index + 1} 처리 실패: {e}")
                 
-                # 배치마다 커밋
+                # 배치마다 하나의 트랜잭션
+                inserted_count += await repository.bulk_insert(batch)
                 await session.commit()
-                logger.info(f"배치 {batch_num} 완료 - 성공: {success_count}, 실패: {error_count}")
+                logger.info(f"배치 {batch_num}/{total_batches} 완료 ({i+1}-{i+len(batch)})")
+                if progress:
+                    progress(i + len(batch), len(records))
             
+            summary = {
+                "inserted": inserted_count,
+                "skipped": len(records) - inserted_count,
+                "rejected": len(rejects),
+            }
             logger.info(f"\n초기화 완료!")
-            logger.info(f"성공: {success_count}개")
-            logger.info(f"실패: {error_count}개")
-            logger.info(f"총 처리율: {success_count/(success_count+error_count)*100:.1f}%")
+            logger.info(f"삽입: {summary['inserted']}개")
+            logger.info(f"기존 식품코드로 건너뜀: {summary['skipped']}개")
+            logger.info(f"거부: {summary['rejected']}개")
+            return summary
             
         except Exception as e:
             await session.rollback()
             logger.error(f"초기화 실패: {e}")
             raise
 
+async def sync_from_excel(
+    excel_path: str,
+    delete_missing: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict:
+    """엑셀 파일과 데이터베이스를 식품코드 기준으로 비교하여 바뀐 행만 반영합니다.
+
+    행 내용 해시가 다른 행은 INSERT ... ON CONFLICT DO UPDATE로 삽입/수정하고,
+    delete_missing이 참이면 엑셀에 없는 식품을 삭제합니다.
+    엑셀에 있지만 정제 중 거부된 행의 식품은 없는 식품으로 보지 않고 기존 행을 그대로 유지합니다.
+    변경되지 않은 행은 건드리지 않으므로 캐시도 바뀐 행만 무효화됩니다.
+    """
+    await create_tables()
+
+    try:
+        logger.info(f"엑셀 파일 읽기 중: {excel_path}")
+        records, rejects = await asyncio.to_thread(load_food_dataset, excel_path)
+    except Exception as e:
+        logger.error(f"엑셀 파일 읽기 실패: {e}")
+        return {}
+
+    async with async_session_factory() as session:
+        try:
+            repository = FoodRepository(session)
+            stored_rows = await repository.get_rows()
+            stored = pd.DataFrame(stored_rows, columns=list(records.columns) + ["id"])
+            previous = {row["food_cd"]: row for row in stored_rows}
+
+            incoming_hash = pd.Series(row_hashes(records), index=records["food_cd"].to_numpy())
+            stored_hash = pd.Series(row_hashes(stored), index=stored["food_cd"].to_numpy())
+
+            is_new = ~records["food_cd"].isin(stored_hash.index).to_numpy()
+            is_changed = ~is_new & (
+                incoming_hash.to_numpy() != stored_hash.reindex(incoming_hash.index).to_numpy()
+            )
+            changes = records[is_new | is_changed]
+            # 거부된 행도 엑셀에는 있으므로 삭제 대상에서 제외 (셀 하나의 오류로 기존 식품이 삭제되지 않도록)
+            is_incoming = stored["food_cd"].isin(incoming_hash.index)
+            is_rejected = ~is_incoming & stored["food_cd"].isin(rejects["food_cd"])
+            missing = stored[~is_incoming & ~is_rejected]
+            kept_rejected = stored.loc[is_rejected, "food_cd"].tolist()
+            for food_cd in kept_rejected[:20]:
+                logger.warning(f"거부된 행의 식품은 기존 값을 유지합니다 (식품코드: {food_cd})")
+            if len(kept_rejected) > 20:
+                logger.warning(f"... 외 {len(kept_rejected) - 20}개 식품을 유지했습니다.")
+
+            total_batches = (len(changes) + batch_size - 1) // batch_size
+            for i in range(0, len(changes), batch_size):
+                batch = changes.iloc[i:i+batch_size].to_dict("records")
+                await repository.upsert_many(batch, previous)
+                await session.commit()
+                logger.info(f"배치 {i // batch_size + 1}/{total_batches} 반영 완료")
+
+            deleted_count = 0
+            if delete_missing and len(missing):
+                missing_rows = [previous[food_cd] for food_cd in missing["food_cd"]]
+                deleted_count = await repository.delete_many(missing_rows)
+                await session.commit()
+
+            summary = {
+                "inserted": int(is_new.sum()),
+                "updated": int(is_changed.sum()),
+                "deleted": deleted_count,
+                "unchanged": int(len(records) - is_new.sum() - is_changed.sum()),
+                "rejected": len(rejects),
+                "kept_rejected": len(kept_rejected),
+            }
+            logger.info(
+                f"동기화 완료 - 삽입: {summary['inserted']}개, 수정: {summary['updated']}개, "
+                f"삭제: {summary['deleted']}개, 변경 없음: {summary['unchanged']}개, 거부: {summary['rejected']}개 "
+                f"(그중 기존 값 유지: {summary['kept_rejected']}개)"
+            )
+            return summary
+
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"동기화 실패: {e}")
+            raise
+
 def main():
     parser = argparse.ArgumentParser(description='엑셀 파일로부터 데이터베이스 초기화')
     parser.add_argument('excel_path', nargs='?', help='엑셀 파일 경로 (미지정 시 자동 검색)')
     parser.add_argument('--clear', action='store_true', help='기존 데이터 삭제')
+    parser.add_argument('--sync', action='store_true', help='식품코드 기준으로 바뀐 행만 삽입/수정/삭제')
+    parser.add_argument('--keep-missing', action='store_true', help='--sync 시 엑셀에 없는 식품을 삭제하지 않음')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help='배치당 삽입 행 수')
+    parser.add_argument('--reject-report', help='거부된 행 보고서를 저장할 CSV 경로')
     
     args = parser.parse_args()
     
@@ -152,13 +207,20 @@ def main():
         print(f"파일을 찾을 수 없습니다: {excel_path}")
         return
     
+    if args.sync:
+        if args.clear:
+            print("--sync와 --clear는 함께 사용할 수 없습니다.")
+            return
+        asyncio.run(sync_from_excel(excel_path, not args.keep_missing, args.batch_size))
+        return
+    
     if args.clear:
         response = input("기존 데이터를 모두 삭제하고 초기화하시겠습니까? (y/N): ")
         if response.lower() != 'y':
             print("초기화를 취소했습니다.")
             return
     
-    asyncio.run(init_from_excel(excel_path, args.clear))
+    asyncio.run(init_from_excel(excel_path, args.clear, args.batch_size, args.reject_report))
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
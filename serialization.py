@@ -0,0 +1,28 @@
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """dict/list/str/숫자로만 구성된 값을 JSON 바이트로 직렬화합니다."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(Response):
+    """검증 없이 바로 직렬화하는 JSON 응답
+
+    response_model 검증/직렬화를 거치지 않으므로 content는 응답 스키마와 같은 형태여야 합니다.
+    라우트의 response_model은 OpenAPI 문서용으로 그대로 둡니다.
+    """
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
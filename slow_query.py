@@ -0,0 +1,201 @@
+import logging
+import os
+import re
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+try:
+    import greenlet
+except ImportError:  # greenlet이 없으면 현재 스택에서만 호출 위치를 찾음
+    greenlet = None
+
+logger = logging.getLogger(__name__)
+
+# 느린 쿼리 기록 사용 여부 및 설정
+SLOW_QUERY_ENABLED = os.getenv("SLOW_QUERY_ENABLED", "false").lower() in ("1", "true", "yes")
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100"))
+# 처음 느리게 실행된 쿼리 형태마다 실행 계획을 수집할지 여부
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() in ("1", "true", "yes")
+# 집계할 최대 쿼리 형태 수 (넘으면 새 형태는 버림)
+SLOW_QUERY_MAX_SHAPES = int(os.getenv("SLOW_QUERY_MAX_SHAPES", "500"))
+
+# 로그에 남길 파라미터 표현의 최대 길이
+_MAX_PARAMS_LENGTH = 500
+
+# 호출 위치를 찾을 리포지토리 패키지 경로
+_REPOSITORIES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "repositories")
+
+# 실행 계획을 수집할 문장 종류
+_EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|\$\d+))*\s*\)")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_statement(statement: str) -> str:
+    """리터럴과 IN 목록 길이를 지워 같은 형태의 쿼리를 하나로 묶는 키를 만듭니다."""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _format_params(parameters) -> str:
+    text = repr(parameters)
+    if len(text) > _MAX_PARAMS_LENGTH:
+        text = text[:_MAX_PARAMS_LENGTH] + "..."
+    return text
+
+
+def find_caller() -> Optional[str]:
+    """SQL을 실행한 리포지토리 메서드를 "클래스.메서드" 형태로 찾습니다.
+
+    비동기 세션의 SQL은 별도 greenlet에서 실행되므로, 현재 스택에 없으면
+    부모 greenlet(리포지토리 코루틴이 대기 중인 스택)까지 거슬러 올라갑니다.
+    밑줄로 시작하는 내부 헬퍼보다 그 헬퍼를 호출한 공개 메서드를 우선합니다.
+    """
+    fallback = None
+    frame = sys._getframe(1)
+    current = greenlet.getcurrent() if greenlet is not None else None
+    while True:
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename.startswith(_REPOSITORIES_DIR):
+                owner = frame.f_locals.get("self")
+                name = f"{type(owner).__name__}.{code.co_name}" if owner is not None else code.co_name
+                if not code.co_name.startswith("_"):
+                    return name
+                fallback = fallback or name
+            frame = frame.f_back
+        if current is None or current.parent is None:
+            return fallback
+        current = current.parent
+        frame = current.gr_frame
+
+
+@dataclass
+class QueryShape:
+    """정규화된 쿼리 형태 하나의 실행 통계"""
+    statement: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    slow_count: int = 0
+    callers: Dict[str, int] = field(default_factory=dict)
+    slowest_params: Optional[str] = None
+    plan: Optional[List[str]] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "slow_count": self.slow_count,
+            "callers": dict(sorted(self.callers.items(), key=lambda item: -item[1])),
+            "slowest_params": self.slowest_params,
+            "plan": self.plan,
+        }
+
+
+class SlowQueryLog:
+    """SQL 실행 시간을 쿼리 형태별로 집계하고 임계값을 넘은 문장을 기록합니다.
+
+    모든 문장은 형태별 횟수/시간 합계만 갱신하고(정규화 결과는 원본 문장별로 캐시),
+    임계값을 넘은 문장만 호출 위치와 파라미터를 로그로 남깁니다.
+    형태별로 처음 느리게 실행되었을 때 같은 연결에서 EXPLAIN (QUERY PLAN)을 실행하여 저장합니다.
+    리포지토리 밖에서 실행한 문장(헬스 체크의 SELECT 1 등)은 실행 계획을 수집하지 않습니다.
+    """
+
+    def __init__(self, threshold_ms: float, max_shapes: int, explain: bool):
+        self.threshold_ms = threshold_ms
+        self.max_shapes = max_shapes
+        self.explain = explain
+        self.shapes: Dict[str, QueryShape] = {}
+        self._normalized: Dict[str, str] = {}
+
+    def instrument(self, sync_engine: Engine) -> None:
+        """엔진의 SQL 실행 시간을 수집하는 이벤트를 등록합니다."""
+
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before(conn, cursor, statement, parameters, context, executemany):
+            context._slow_query_started = time.perf_counter()
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after(conn, cursor, statement, parameters, context, executemany):
+            elapsed_ms = (time.perf_counter() - context._slow_query_started) * 1000
+            self.record(conn, statement, parameters, elapsed_ms, executemany)
+
+    def _shape(self, statement: str) -> Optional[QueryShape]:
+        key = self._normalized.get(statement)
+        if key is None:
+            key = normalize_statement(statement)
+            if len(self._normalized) < self.max_shapes * 4:
+                self._normalized[statement] = key
+        shape = self.shapes.get(key)
+        if shape is None and len(self.shapes) < self.max_shapes:
+            shape = self.shapes[key] = QueryShape(key)
+        return shape
+
+    def record(self, conn, statement: str, parameters, elapsed_ms: float, executemany: bool = False) -> None:
+        shape = self._shape(statement)
+        if shape is not None:
+            shape.count += 1
+            shape.total_ms += elapsed_ms
+            shape.max_ms = max(shape.max_ms, elapsed_ms)
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        repository_caller = find_caller()
+        caller = repository_caller or "unknown"
+        params = _format_params(parameters)
+        logger.warning(f"느린 쿼리 {elapsed_ms:.1f}ms [{caller}] {statement} | params={params}")
+        if shape is None:
+            return
+        shape.slow_count += 1
+        shape.callers[caller] = shape.callers.get(caller, 0) + 1
+        if elapsed_ms >= shape.max_ms:
+            shape.slowest_params = params
+        if shape.plan is None and self.explain and repository_caller is not None and not executemany:
+            shape.plan = self._explain(conn, statement, parameters)
+            if shape.plan:
+                logger.warning("실행 계획:\n" + "\n".join(shape.plan))
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters) -> Optional[List[str]]:
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return None
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        # 결과를 아직 읽지 않은 원래 커서를 건드리지 않도록 같은 연결에서 새 커서 사용
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception as e:
+            return [f"실행 계획을 수집하지 못했습니다: {e}"]
+        finally:
+            cursor.close()
+        if conn.dialect.name == "sqlite":
+            # (id, parent, notused, detail)
+            return [str(row[-1]) for row in rows]
+        return [" | ".join(str(value) for value in row) for row in rows]
+
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[dict]:
+        """쿼리 형태를 order_by(total_ms/max_ms/count/slow_count) 내림차순으로 limit개 반환합니다."""
+        shapes = [shape.to_dict() for shape in list(self.shapes.values())]
+        shapes.sort(key=lambda shape: shape[order_by], reverse=True)
+        return shapes[:limit]
+
+    def reset(self) -> None:
+        self.shapes.clear()
+
+
+slow_query_log = SlowQueryLog(SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_MAX_SHAPES, SLOW_QUERY_EXPLAIN)
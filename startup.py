@@ -0,0 +1,221 @@
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import make_url
+
+from database import DATABASE_URL, create_tables, read_session_factory, _is_memory_sqlite, _is_sqlite
+from models.food import Food
+
+try:
+    import fcntl
+except ImportError:  # Windows 등 fcntl이 없는 환경에서는 워커 간 잠금 없이 실행
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# 초기화용 엑셀 파일 (프로젝트 루트)
+INIT_EXCEL_PATH = os.getenv("INIT_EXCEL_PATH", "food_nutrition_db.xlsx")
+# 다른 워커가 초기화 잠금을 가지고 있을 때 다시 확인하는 주기(초)
+INIT_LOCK_POLL_SECONDS = float(os.getenv("INIT_LOCK_POLL_SECONDS", "0.5"))
+# 준비 상태 확인 시 DB ping 제한 시간(초)
+READINESS_DB_TIMEOUT_SECONDS = float(os.getenv("READINESS_DB_TIMEOUT_SECONDS", "2"))
+
+
+def _default_lock_path() -> Optional[str]:
+    """SQLite 파일 DB는 DB 파일 옆에, 그 외에는 임시 디렉터리에 잠금 파일을 둡니다."""
+    if _is_memory_sqlite(DATABASE_URL):
+        # 인메모리 DB는 프로세스마다 별도이므로 잠금이 필요 없음
+        return None
+    if _is_sqlite(DATABASE_URL):
+        return f"{make_url(DATABASE_URL).database}.init.lock"
+    return os.path.join(tempfile.gettempdir(), "food_api_init.lock")
+
+
+INIT_LOCK_PATH = os.getenv("INIT_LOCK_PATH") or _default_lock_path()
+
+
+class InitLock:
+    """워커 간 초기화 잠금 (fcntl.flock)
+
+    잠금을 가진 워커는 진행 상황을 잠금 파일에 JSON으로 기록하고,
+    기다리는 워커는 같은 파일을 읽어 준비 상태에 보고합니다.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._file = None
+
+    def try_acquire(self) -> bool:
+        """잠금을 얻으면 True, 다른 프로세스가 가지고 있으면 False를 반환합니다."""
+        if self.path is None or fcntl is None:
+            return True
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file = open(self.path, "a+")
+        try:
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            file.close()
+            return False
+        self._file = file
+        # 이전 실행이 남긴 진행 상황 제거
+        self.write_progress({})
+        return True
+
+    def release(self) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+    def write_progress(self, progress: dict) -> None:
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(json.dumps(progress))
+            self._file.flush()
+
+    def read_progress(self) -> Optional[dict]:
+        if self.path is None:
+            return None
+        try:
+            with open(self.path) as file:
+                return json.loads(file.read() or "null")
+        except (OSError, ValueError):
+            return None
+
+
+class InitializationState:
+    """시작 시 데이터 초기화 진행 상태
+
+    status 값:
+    - pending: 아직 시작 전
+    - waiting: 다른 워커가 초기화 중이라 잠금을 기다리는 중
+    - importing: 이 워커가 엑셀 데이터를 삽입하는 중
+    - loading: 인메모리 카탈로그 적재 중
+    - ready: 초기화 완료 (데이터가 이미 있었던 경우 포함)
+    - failed: 초기화 실패
+    """
+
+    def __init__(self, lock: InitLock):
+        self.lock = lock
+        self.status = "pending"
+        self.rows_done = 0
+        self.rows_total: Optional[int] = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+    def on_progress(self, rows_done: int, rows_total: int) -> None:
+        """초기화 스크립트의 배치 진행 콜백"""
+        self.rows_done = rows_done
+        self.rows_total = rows_total
+        self.lock.write_progress({"rows_done": rows_done, "rows_total": rows_total})
+
+    def snapshot(self) -> dict:
+        rows_done, rows_total = self.rows_done, self.rows_total
+        if self.status == "waiting":
+            # 다른 워커가 기록한 진행 상황
+            progress = self.lock.read_progress() or {}
+            rows_done = progress.get("rows_done", 0)
+            rows_total = progress.get("rows_total")
+        end = self.finished_at or time.time()
+        return {
+            "status": self.status,
+            "rows_done": rows_done,
+            "rows_total": rows_total,
+            "elapsed_seconds": round(end - self.started_at, 3) if self.started_at else None,
+            "error": self.error,
+        }
+
+
+init_state = InitializationState(InitLock(INIT_LOCK_PATH))
+
+
+async def _acquire_init_lock(state: InitializationState) -> None:
+    """초기화 잠금을 얻을 때까지 기다립니다. (취소 가능하도록 이벤트 루프를 막지 않고 폴링)"""
+    while not state.lock.try_acquire():
+        if state.status != "waiting":
+            logger.info("다른 워커가 데이터 초기화 중입니다. 완료를 기다립니다...")
+            state.status = "waiting"
+        await asyncio.sleep(INIT_LOCK_POLL_SECONDS)
+
+
+async def auto_initialize_data(state: InitializationState = init_state) -> None:
+    """데이터가 없으면 엑셀에서 초기화합니다.
+
+    여러 워커가 동시에 시작해도 잠금을 얻은 워커 하나만 초기화하고,
+    나머지는 잠금이 풀린 뒤 데이터 개수를 다시 확인하여 건너뜁니다.
+    """
+    await _acquire_init_lock(state)
+    try:
+        await create_tables()
+
+        # 데이터 개수 확인 (초기화 스크립트가 쓰기 연결을 사용하므로 세션을 먼저 닫음)
+        async with read_session_factory() as session:
+            count = (await session.execute(select(func.count(Food.id)))).scalar()
+
+        if count:
+            logger.info(f"데이터베이스에 {count}개의 식품 데이터가 있습니다.")
+            state.rows_done = state.rows_total = count
+            return
+
+        logger.info("데이터베이스가 비어있습니다. 엑셀 파일에서 초기화를 시작합니다...")
+        if not os.path.exists(INIT_EXCEL_PATH):
+            logger.warning(f"초기화용 엑셀 파일을 찾을 수 없습니다: {INIT_EXCEL_PATH}")
+            logger.warning("프로젝트 루트에 food_nutrition_db.xlsx 파일이 있는지 확인해주세요.")
+            return
+
+        logger.info(f"엑셀 파일 사용: {INIT_EXCEL_PATH}")
+        state.status = "importing"
+        # 동적으로 초기화 스크립트 임포트 및 실행
+        from scripts.init_db_from_excel import init_from_excel
+        await init_from_excel(INIT_EXCEL_PATH, clear_existing=False, progress=state.on_progress)
+        logger.info("엑셀 데이터 초기화가 완료되었습니다.")
+    finally:
+        state.lock.release()
+
+
+async def run_startup(state: InitializationState = init_state) -> None:
+    """백그라운드에서 데이터 초기화와 카탈로그 적재를 수행하고 준비 상태를 갱신합니다."""
+    from repositories.food_catalog import catalog, CATALOG_ENABLED
+
+    state.started_at = time.time()
+    try:
+        await auto_initialize_data(state)
+
+        # 인메모리 카탈로그 사용 시 미리 적재
+        if CATALOG_ENABLED:
+            state.status = "loading"
+            async with read_session_factory() as session:
+                await catalog.load(session)
+
+        state.status = "ready"
+    except Exception as e:
+        state.status = "failed"
+        state.error = str(e)
+        logger.error(f"자동 초기화 중 오류 발생: {e}")
+    finally:
+        state.finished_at = time.time()
+
+
+async def ping_database() -> dict:
+    """읽기 엔진으로 SELECT 1을 실행하여 응답 여부와 지연 시간(ms)을 반환합니다."""
+    started = time.perf_counter()
+    try:
+        async with read_session_factory() as session:
+            await asyncio.wait_for(session.execute(text("SELECT 1")), READINESS_DB_TIMEOUT_SECONDS)
+    except Exception as e:
+        return {"ok": False, "latency_ms": None, "error": str(e) or type(e).__name__}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
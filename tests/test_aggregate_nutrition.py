@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from database import Base
+from exceptions import BatchOperationError
+from models.food import Food, NUTRIENT_COLUMNS
+from repositories.food_repository import FoodRepository
+from schemas.food import NutritionItem
+
+
+def _food(food_cd: str, serving_size: str) -> Food:
+    return Food(
+        food_cd=food_cd, group_name="과자류", food_name=f"식품 {food_cd}", research_year="2020",
+        maker_name="제조사", ref_name="자료", serving_size=serving_size,
+        **{name: 10.0 for name in NUTRIENT_COLUMNS}
+    )
+
+
+async def _aggregate(items):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            session.add_all([_food("F1", "100"), _food("F2", "0"), _food("F3", "1개(30g)")])
+            await session.commit()
+            return await FoodRepository(session).aggregate_nutrition(items)
+    finally:
+        await engine.dispose()
+
+
+def test_aggregate_grams_with_numeric_serving_size():
+    results, totals = asyncio.run(_aggregate([NutritionItem(food_cd="F1", quantity=50, unit="g")]))
+
+    assert results[0]["servings"] == 0.5
+    assert totals["calorie"] == 5.0
+
+
+@pytest.mark.parametrize("food_cd", ["F2", "F3"])
+def test_aggregate_grams_with_unparseable_serving_size(food_cd):
+    items = [
+        NutritionItem(food_cd="F1", quantity=1),
+        NutritionItem(food_cd=food_cd, quantity=30, unit="g"),
+        NutritionItem(food_cd="NONE", quantity=1),
+    ]
+
+    with pytest.raises(BatchOperationError) as exc_info:
+        asyncio.run(_aggregate(items))
+
+    errors = exc_info.value.details["errors"]
+    assert [(error["index"], error["code"]) for error in errors] == [(1, "VALIDATION_ERROR"), (2, "RESOURCE_NOT_FOUND")]
+
+
+def test_aggregate_servings_ignores_serving_size():
+    results, totals = asyncio.run(_aggregate([NutritionItem(food_cd="F3", quantity=2)]))
+
+    assert results[0]["servings"] == 2
+    assert totals["calorie"] == 20.0
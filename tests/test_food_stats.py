@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import repositories.food_stats as food_stats_module
+from database import Base
+from models.food import NUTRIENT_COLUMNS
+from repositories import events
+from repositories.events import FoodChange
+from repositories.food_repository import FoodRepository
+from repositories.food_stats import FoodStatistics, GroupSummary
+from schemas.food import FoodCreate
+
+
+def _row(food_cd: str, calorie: float, group_name: str = "과자류") -> dict:
+    return {
+        "food_cd": food_cd, "group_name": group_name, "food_name": f"식품 {food_cd}", "research_year": "2020",
+        "maker_name": "제조사", "ref_name": "자료", "serving_size": "100",
+        **{name: calorie for name in NUTRIENT_COLUMNS},
+    }
+
+
+def test_group_summary_add_remove():
+    summary = GroupSummary()
+    for calorie in (30.0, 10.0, 20.0, 20.0):
+        summary.add(_row("F", calorie))
+
+    summary.remove(_row("F", 20.0))
+
+    assert summary.count == 3
+    assert summary.values[0] == [10.0, 20.0, 30.0]
+    assert summary.stats()["nutrients"]["calorie"]["mean"] == 20.0
+
+
+@pytest.mark.parametrize("calorie", [15.0, 5.0, 40.0])
+def test_group_summary_remove_missing_value_raises(calorie):
+    summary = GroupSummary()
+    for value in (10.0, 20.0, 30.0):
+        summary.add(_row("F", value))
+
+    with pytest.raises(KeyError):
+        summary.remove(_row("F", calorie))
+
+    assert summary.count == 3
+    assert summary.values[0] == [10.0, 20.0, 30.0]
+
+
+def test_apply_marks_stale_on_drift():
+    stats = FoodStatistics()
+    stats._loaded = True
+    stats.db_version = 1
+    stats._add({"id": 1, **_row("F1", 10.0)})
+
+    stats.on_changes([FoodChange("delete", 2, before={"id": 2, **_row("F2", 99.0)})], version=2)
+
+    assert not stats._loaded
+
+
+async def _load_with_concurrent_create(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'stats.db'}")
+    stats = FoodStatistics()
+    events.subscribe(stats.on_changes)
+    try:
+        async with engine.begin() as conn:
+            await conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            for index in range(3):
+                await FoodRepository(session).create(FoodCreate(**_row(f"F{index}", 10.0)))
+                await session.commit()
+
+        # 버전을 읽은 직후(행을 읽기 전)에 다른 요청이 식품을 생성하여 커밋
+        get_catalog_version = food_stats_module.get_catalog_version
+
+        async def get_version_then_create(db):
+            version = await get_catalog_version(db)
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                await FoodRepository(session).create(FoodCreate(**_row("NEW", 10.0)))
+                await session.commit()
+            return version
+
+        food_stats_module.get_catalog_version = get_version_then_create
+        try:
+            async with AsyncSession(engine) as session:
+                await stats.load(session)
+        finally:
+            food_stats_module.get_catalog_version = get_catalog_version
+        return stats
+    finally:
+        events.unsubscribe(stats.on_changes)
+        await engine.dispose()
+
+
+def test_load_counts_concurrent_create_once(tmp_path):
+    stats = asyncio.run(_load_with_concurrent_create(tmp_path))
+
+    assert stats._loaded
+    assert stats.db_version == 4
+    assert stats.group_stats("group_name")[0]["count"] == 4